@@ -0,0 +1,23 @@
+"""
+Agent Package Initialization
+Exportiert die Bausteine des Pi-Agents.
+"""
+from .api_client import ApiClient
+from .doors import Door, DoorBank
+from .embedded import EmbeddedTransport
+from .entity_cache import EntityCache
+from .metrics import Metrics, MetricsServer, ScanTrace
+from .outbox import ScanOutbox
+from .runtime import AgentRuntime
+from .snapshot import ConfigSnapshot
+from .scheduler import DoorScheduler, DoorState
+from .stations import DEFAULT_STATION, Station, StationPoller
+from .timers import Timer, TimerQueue
+from .transport import Transport
+
+__all__ = [
+    "Transport", "ApiClient", "EmbeddedTransport", "Door", "DoorBank", "EntityCache", "ScanOutbox", "AgentRuntime",
+    "ConfigSnapshot", "Metrics", "MetricsServer", "ScanTrace",
+    "DoorScheduler", "DoorState",
+    "DEFAULT_STATION", "Station", "StationPoller", "Timer", "TimerQueue"
+]
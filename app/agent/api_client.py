@@ -0,0 +1,176 @@
+"""
+API Client Module
+Asynchroner HTTP-Client des Pi-Agents für die Fooder-API.
+"""
+import json
+import logging
+from typing import AsyncIterator, Dict, List, Optional
+
+import httpx
+
+from .metrics import Metrics
+from .outbox import ScanBatchRejected
+from .transport import Transport
+
+LOGGER = logging.getLogger(__name__)
+
+# 4xx-Antworten, bei denen ein erneuter Versuch sinnvoll ist (Request Timeout, Too Many Requests)
+RETRYABLE_CLIENT_ERRORS = (408, 429)
+
+
+class ApiClient(Transport):
+    """
+    Dünne async-Hülle um die REST-Endpunkte, die der Agent benötigt
+    (Transport für den Remote-Betrieb).
+
+    Alle Methoden fangen Netzwerk- und Protokollfehler ab und liefern
+    None bzw. False, damit der Aufrufer auf gecachte Daten zurückfallen kann.
+
+    Attributes:
+        base_url: Basis-URL der API (z.B. 'http://localhost:8080')
+        metrics: Optionale Metrik-Registry (zählt api_errors_total je Operation)
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        timeout: float = 5.0,
+        client: Optional[httpx.AsyncClient] = None,
+        metrics: Optional[Metrics] = None
+    ):
+        """
+        Initialisiert den Client.
+
+        Args:
+            base_url: Basis-URL der API
+            timeout: Standard-Timeout pro Request in Sekunden
+            client: Optional vorhandener httpx.AsyncClient (z.B. mit ASGI-Transport)
+            metrics: Optionale Metrik-Registry
+        """
+        super().__init__(metrics)
+        self.base_url = base_url
+        self._client = client or httpx.AsyncClient(base_url=base_url, timeout=timeout)
+
+    async def fetch_door_settings(self) -> Optional[Dict[str, dict]]:
+        """Lädt Türkonfigurationen als {door_name: setting}; None bei Fehlern."""
+        try:
+            resp = await self._client.get("/settings")
+            resp.raise_for_status()
+            return {item["door_name"]: item for item in resp.json()}
+        except (httpx.HTTPError, ValueError) as exc:
+            LOGGER.error("Failed to fetch door settings: %s", exc)
+            self._count_error("fetch_door_settings")
+            return None
+
+    async def fetch_entities(self) -> Optional[Dict[str, dict]]:
+        """Lädt alle Entities als {rfid_id: entity}; None bei Fehlern."""
+        try:
+            resp = await self._client.get("/entities")
+            resp.raise_for_status()
+            return {entity["rfid_id"]: entity for entity in resp.json()}
+        except (httpx.HTTPError, ValueError) as exc:
+            LOGGER.error("Failed to fetch entities: %s", exc)
+            self._count_error("fetch_entities")
+            return None
+
+    async def fetch_pending_door_values(self) -> Optional[Dict[str, float]]:
+        """Lädt die Türwerte für unbekannte RFIDs; None bei Fehlern."""
+        try:
+            resp = await self._client.get("/system-settings")
+            resp.raise_for_status()
+            return resp.json().get("pending_door_values", {})
+        except (httpx.HTTPError, ValueError) as exc:
+            LOGGER.error("Failed to fetch pending door values: %s", exc)
+            self._count_error("fetch_pending_door_values")
+            return None
+
+    async def resolve_scan(self, rfid_id: str, timeout: Optional[float] = None) -> Optional[dict]:
+        """
+        Meldet einen Scan an POST /access/scan.
+
+        Der Server sucht die Entity, schreibt den Log, registriert unbekannte
+        Tags und liefert die effektiven door_values in einem Round-Trip.
+
+        Args:
+            rfid_id: Gescannte RFID-Tag-Nummer
+            timeout: Abweichender Timeout in Sekunden
+
+        Returns:
+            Scan-Ergebnis oder None, wenn die API nicht erreichbar ist
+        """
+        kwargs = {"timeout": timeout} if timeout is not None else {}
+        try:
+            resp = await self._client.post("/access/scan", json={"rfid_id": rfid_id}, **kwargs)
+            resp.raise_for_status()
+            return resp.json()
+        except (httpx.HTTPError, ValueError) as exc:
+            LOGGER.warning("Failed to resolve scan via API: %s", exc)
+            self._count_error("resolve_scan")
+            return None
+
+    async def send_scan_batch(self, scans: List[dict]) -> bool:
+        """
+        Überträgt gepufferte Scans an POST /access/scan/batch.
+
+        Client-Fehler (4xx außer 408/429) gelten als endgültig, Server- und
+        Netzwerkfehler als vorübergehend.
+
+        Raises:
+            ScanBatchRejected: Bei endgültiger Ablehnung durch die API
+        """
+        try:
+            resp = await self._client.post("/access/scan/batch", json={"scans": scans})
+            resp.raise_for_status()
+            return True
+        except httpx.HTTPStatusError as exc:
+            self._count_error("send_scan_batch")
+            status = exc.response.status_code
+            if 400 <= status < 500 and status not in RETRYABLE_CLIENT_ERRORS:
+                raise ScanBatchRejected(f"HTTP {status}: {exc.response.text[:200]}") from exc
+            LOGGER.warning("Failed to deliver scan batch: %s", exc)
+            return False
+        except httpx.HTTPError as exc:
+            LOGGER.warning("Failed to deliver scan batch: %s", exc)
+            self._count_error("send_scan_batch")
+            return False
+
+    async def stream_events(self, read_timeout: float = 45.0) -> AsyncIterator[dict]:
+        """
+        Abonniert den Änderungs-Stream GET /events (Server-Sent Events).
+
+        Liefert {"event": ..., "data": {...}} je Event. Endet, sobald die
+        Verbindung abbricht; Fehler werden geloggt und nicht weitergereicht.
+
+        Args:
+            read_timeout: Maximale Zeit ohne Daten (der Server sendet Keepalives)
+        """
+        timeout = httpx.Timeout(5.0, read=read_timeout)
+        try:
+            async with self._client.stream("GET", "/events", timeout=timeout) as resp:
+                resp.raise_for_status()
+                event, data = "message", []
+                async for line in resp.aiter_lines():
+                    if not line:
+                        if data:
+                            yield {"event": event, "data": json.loads("\n".join(data))}
+                        event, data = "message", []
+                        continue
+                    if line.startswith(":"):
+                        continue
+
+                    field, _, value = line.partition(":")
+                    value = value[1:] if value.startswith(" ") else value
+                    if field == "event":
+                        event = value
+                    elif field == "data":
+                        data.append(value)
+        except (httpx.HTTPError, ValueError) as exc:
+            LOGGER.warning("Change event stream interrupted: %s", exc)
+            self._count_error("stream_events")
+
+    async def aclose(self) -> None:
+        """Schließt die HTTP-Verbindungen."""
+        await self._client.aclose()
+
+    def __repr__(self):
+        return f"<ApiClient(base_url='{self.base_url}')>"
@@ -0,0 +1,262 @@
+"""
+Doors Module
+Asynchrone Türsteuerung des Pi-Agents.
+"""
+import asyncio
+import logging
+from typing import Callable, Dict, List, Optional
+
+from ..hardware import ServoController
+from .metrics import ScanTrace
+from .scheduler import DoorScheduler, DoorState
+from .timers import Timer
+
+LOGGER = logging.getLogger(__name__)
+
+ServoFactory = Callable[..., ServoController]
+
+
+def create_servo(cfg: dict, servo_factory: ServoFactory = ServoController) -> ServoController:
+    """
+    Erstellt einen ServoController aus einem DoorSetting-Dictionary.
+
+    WICHTIG: Sichere Defaults verwenden (0 statt -90/90), damit der Servo
+    bei DB-Fehlern nicht wild ausschlägt.
+    """
+    return servo_factory(
+        pin=cfg["servo_pin"],
+        min_angle=cfg.get("min_angle", 0),
+        max_angle=cfg.get("max_angle", 0),
+        min_pulse=cfg.get("min_pulse", 0.0005),
+        max_pulse=cfg.get("max_pulse", 0.0025)
+    )
+
+
+def _hardware_key(cfg: dict) -> tuple:
+    """Felder, die einen neuen AngularServo erfordern (Pin und Pulsbreiten)."""
+    return cfg["servo_pin"], cfg.get("min_pulse", 0.0005), cfg.get("max_pulse", 0.0025)
+
+
+class Door:
+    """
+    Eine Tür mit ihrem Servo.
+
+    Zustand und Timer werden ausschließlich vom DoorScheduler verändert.
+
+    Attributes:
+        name: Name der Tür (z.B. 'door_1')
+        servo: ServoController der Tür
+        config: DoorSetting-Dictionary aus der API
+        state: Aktueller DoorState
+        close_at: Geplanter Schließzeitpunkt (time.monotonic())
+    """
+
+    def __init__(self, name: str, servo: ServoController, config: dict):
+        self.name = name
+        self.servo = servo
+        self.config = config
+        self.state = DoorState.CLOSED
+        self.close_at = 0.0
+        self.close_timer: Optional[Timer] = None
+        self.settle_timer: Optional[Timer] = None
+        self.idle = asyncio.Event()
+        self.idle.set()
+        self.held = False
+        self.deferred_seconds = 0.0
+        # Callbacks, die beim vollständigen Schließen aufgerufen werden
+        self.on_closed: List[Callable[[], None]] = []
+        self.closed = False
+
+    def __repr__(self):
+        return f"<Door(name='{self.name}', state={self.state.value}, servo={self.servo!r})>"
+
+
+class DoorBank:
+    """
+    Verwaltet alle Türen des Agents.
+
+    Die Servos und ihre Konfiguration liegen hier; Öffnen und Schließen
+    übernimmt ein gemeinsamer DoorScheduler, sodass weitere Scans verarbeitet
+    werden, während andere Türen noch offen sind.
+    """
+
+    def __init__(self, servo_factory: ServoFactory = ServoController, travel_time: float = 0.3):
+        self._servo_factory = servo_factory
+        self.scheduler = DoorScheduler(travel_time=travel_time)
+        self.doors: Dict[str, Door] = {}
+        # Zuletzt angewendete Konfiguration (auch Türen, deren Servo nicht startete)
+        self.settings: Dict[str, dict] = {}
+
+    def configure(self, settings: Dict[str, dict]) -> None:
+        """
+        Erstellt die Servos aller Türen, fährt sie in die Schließposition
+        und startet den Scheduler.
+        """
+        self.scheduler.start()
+        self.settings = settings
+        for door_name, cfg in settings.items():
+            try:
+                servo = create_servo(cfg, self._servo_factory)
+                servo.move_to_max()
+                self.doors[door_name] = Door(door_name, servo, cfg)
+                LOGGER.info(
+                    "Initialized '%s' on pin %s. Open=%s°, Closed=%s°",
+                    door_name, cfg["servo_pin"], cfg.get("min_angle", 0), cfg.get("max_angle", 0)
+                )
+            except Exception as exc:
+                LOGGER.error("Failed to initialize servo '%s': %s", door_name, exc)
+
+    async def reconfigure(self, settings: Dict[str, dict]) -> None:
+        """
+        Wendet eine neue Konfiguration inkrementell an.
+
+        Nur hinzugefügte, entfernte und geänderte Türen werden angefasst:
+        Ändern sich nur die Winkel, wird der bestehende Servo umgezielt.
+        Bei neuem Pin oder neuen Pulsbreiten wird der Servo neu erstellt,
+        wobei frei werdende Servos mit passender Hardware wiederverwendet
+        werden. Laufende Öffnungszyklen der betroffenen Türen werden vorher
+        abgewartet (Öffnungen in dieser Zeit werden danach nachgeholt); alle
+        anderen Türen bleiben verfügbar.
+        """
+        removed = [name for name in self.doors if name not in settings]
+        added = [name for name in settings if name not in self.doors]
+        changed = [
+            name for name in settings
+            if name in self.doors and self.doors[name].config != settings[name]
+        ]
+        rebuilt = [name for name in changed if _hardware_key(self.doors[name].config) != _hardware_key(settings[name])]
+        retargeted = [name for name in changed if name not in rebuilt]
+
+        if removed or added or changed:
+            LOGGER.info(
+                "Reconfiguring doors: added=%s removed=%s rebuilt=%s retargeted=%s",
+                added, removed, rebuilt, retargeted
+            )
+
+        affected = [self.doors[name] for name in removed + changed]
+        for door in affected:
+            self.scheduler.hold(door)
+
+        try:
+            await asyncio.gather(*(self.scheduler.wait_closed(door) for door in affected))
+
+            # Frei werdende Servos nach Hardware (Pin + Pulsbreiten) sammeln
+            pool: Dict[tuple, List[ServoController]] = {}
+            for name in removed:
+                door = self.doors.pop(name)
+                door.closed = True
+                pool.setdefault(_hardware_key(door.config), []).append(door.servo)
+            for name in rebuilt:
+                door = self.doors[name]
+                pool.setdefault(_hardware_key(door.config), []).append(door.servo)
+
+            reused = {}
+            for name in added + rebuilt:
+                candidates = pool.get(_hardware_key(settings[name]))
+                if candidates:
+                    reused[name] = candidates.pop()
+
+            # Nicht wiederverwendete Servos freigeben, bevor ihre Pins neu belegt werden
+            for servos in pool.values():
+                for servo in servos:
+                    try:
+                        servo.close()
+                    except Exception as exc:
+                        LOGGER.warning("Error closing servo on pin %s: %s", servo.pin, exc)
+
+            for name in added + rebuilt:
+                self._install(name, settings[name], reused.get(name))
+
+            for name in retargeted:
+                door, cfg = self.doors[name], settings[name]
+                try:
+                    door.servo.retarget(cfg.get("min_angle", 0), cfg.get("max_angle", 0))
+                    door.servo.move_to_max()
+                    door.config = cfg
+                except Exception as exc:
+                    LOGGER.error("Failed to retarget servo '%s': %s", name, exc)
+        finally:
+            for door in affected:
+                self.scheduler.release(door)
+
+        self.settings = settings
+
+    def _install(self, name: str, cfg: dict, servo: Optional[ServoController]) -> None:
+        """Setzt den Servo einer Tür (wiederverwendet oder neu) und schließt sie."""
+        try:
+            if servo is None:
+                servo = create_servo(cfg, self._servo_factory)
+            else:
+                servo.retarget(cfg.get("min_angle", 0), cfg.get("max_angle", 0))
+            servo.move_to_max()
+        except Exception as exc:
+            LOGGER.error("Failed to initialize servo '%s': %s", name, exc)
+            door = self.doors.pop(name, None)
+            if door is not None:
+                door.closed = True
+            return
+
+        door = self.doors.get(name)
+        if door is None:
+            self.doors[name] = Door(name, servo, cfg)
+        else:
+            door.servo = servo
+            door.config = cfg
+        LOGGER.info(
+            "Configured '%s' on pin %s. Open=%s°, Closed=%s°",
+            name, cfg["servo_pin"], cfg.get("min_angle", 0), cfg.get("max_angle", 0)
+        )
+
+    def dispatch(
+        self,
+        door_values: Dict[str, float],
+        station: Optional[str] = None,
+        trace: Optional[ScanTrace] = None
+    ) -> List[str]:
+        """
+        Öffnet alle bekannten Türen bzw. verlängert bereits offene, ohne zu warten.
+
+        Args:
+            door_values: {door_name: Sekunden}
+            station: Auslösende Station; Türen anderer Stationen werden übersprungen
+            trace: Zeitmessung des Scans (meldet das Schließen der Türen)
+
+        Returns:
+            Namen der Türen, die geöffnet oder verlängert werden
+        """
+        dispatched = []
+        for door_name, seconds in door_values.items():
+            door = self.doors.get(door_name)
+            if door is None or seconds <= 0:
+                continue
+            if station is not None and door.config.get("station") not in (None, station):
+                continue
+
+            self.scheduler.open(door, seconds)
+            if trace is not None and door.state in (DoorState.OPENING, DoorState.OPEN):
+                door.on_closed.append(trace.door_opened())
+            dispatched.append(door_name)
+        return dispatched
+
+    def cancel(self, door_name: str) -> None:
+        """Schließt eine einzelne Tür sofort."""
+        door = self.doors.get(door_name)
+        if door is not None:
+            self.scheduler.cancel(door)
+
+    def close_all(self) -> None:
+        """Notschließung: schließt alle offenen Türen sofort."""
+        self.scheduler.close_all(self.doors.values())
+
+    async def close(self) -> None:
+        """Schließt alle Türen, stoppt den Scheduler und gibt alle Servos frei."""
+        self.close_all()
+        await self.scheduler.stop()
+
+        for door in self.doors.values():
+            door.closed = True
+            try:
+                door.servo.close()
+            except Exception:
+                pass
+        self.doors = {}
@@ -0,0 +1,158 @@
+"""
+Embedded Transport Module
+Direkter Zugriff des Pi-Agents auf die Services im selben Prozess.
+"""
+import asyncio
+import logging
+from typing import AsyncIterator, Callable, Dict, List, Optional
+
+from pydantic import ValidationError
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from ..database import SessionLocal
+from ..schemas.access_scan import AccessScanRequest
+from ..schemas.door_setting import DoorSetting
+from ..schemas.entity import Entity
+from ..services import AccessService, EntityService, SettingService, SystemSettingsService
+from ..services.change_feed import ChangeFeed
+from .metrics import Metrics
+from .outbox import ScanBatchRejected
+from .transport import Transport
+
+LOGGER = logging.getLogger(__name__)
+
+
+class EmbeddedTransport(Transport):
+    """
+    Transport für Einzel-Pi-Installationen ohne HTTP.
+
+    Ruft SettingService, EntityService, SystemSettingsService und
+    AccessService (Entity-Lookup, Log, PendingRFID) direkt auf. Jeder
+    Aufruf nutzt eine eigene Session und läuft im Thread-Pool, damit
+    SQLite-Commits die Event-Loop nicht blockieren. Die Ergebnisse haben
+    dasselbe Format wie die JSON-Antworten der API.
+
+    Läuft die API im selben Prozess, liefert change_feed die Änderungen
+    ohne Polling; sonst lädt der Agent die Konfiguration zyklisch neu.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session] = SessionLocal,
+        change_feed: Optional[ChangeFeed] = None,
+        metrics: Optional[Metrics] = None
+    ):
+        """
+        Initialisiert den Transport.
+
+        Args:
+            session_factory: Erzeugt Datenbank-Sessions (default: SessionLocal)
+            change_feed: Change Feed der API im selben Prozess (None = kein Event-Stream)
+            metrics: Optionale Metrik-Registry
+        """
+        super().__init__(metrics)
+        self._session_factory = session_factory
+        self._change_feed = change_feed
+        self.setting_service = SettingService()
+        self.entity_service = EntityService()
+        self.system_settings_service = SystemSettingsService()
+        self.access_service = AccessService()
+
+    async def _call(self, operation: str, fn: Callable[[Session], object]) -> Optional[object]:
+        def run():
+            with self._session_factory() as db:
+                return fn(db)
+
+        try:
+            return await asyncio.to_thread(run)
+        except (SQLAlchemyError, ValidationError, ValueError) as exc:
+            LOGGER.error("Embedded %s failed: %s", operation, exc)
+            self._count_error(operation)
+            return None
+
+    async def fetch_door_settings(self) -> Optional[Dict[str, dict]]:
+        """Lädt Türkonfigurationen als {door_name: setting}; None bei Fehlern."""
+        return await self._call("fetch_door_settings", lambda db: {
+            setting.door_name: DoorSetting.model_validate(setting).model_dump(mode="json")
+            for setting in self.setting_service.get_all(db)
+        })
+
+    async def fetch_entities(self) -> Optional[Dict[str, dict]]:
+        """Lädt alle Entities als {rfid_id: entity}; None bei Fehlern."""
+        return await self._call("fetch_entities", lambda db: {
+            entity.rfid_id: Entity.model_validate(entity).model_dump(mode="json")
+            for entity in self.entity_service.get_all(db)
+        })
+
+    async def fetch_pending_door_values(self) -> Optional[Dict[str, float]]:
+        """Lädt die Türwerte für unbekannte RFIDs; None bei Fehlern."""
+        return await self._call("fetch_pending_door_values", self.system_settings_service.get_pending_door_values)
+
+    async def resolve_scan(self, rfid_id: str, timeout: Optional[float] = None) -> Optional[dict]:
+        """
+        Löst einen Scan über AccessService.scan() auf.
+
+        Args:
+            rfid_id: Gescannte RFID-Tag-Nummer
+            timeout: Wird ignoriert (kein Netzwerk beteiligt)
+
+        Returns:
+            Scan-Ergebnis oder None bei Datenbankfehlern
+        """
+        return await self._call(
+            "resolve_scan",
+            lambda db: self.access_service.scan(db, rfid_id).model_dump(mode="json")
+        )
+
+    async def send_scan_batch(self, scans: List[dict]) -> bool:
+        """
+        Schreibt gepufferte Scans über AccessService.scan_batch().
+
+        Raises:
+            ScanBatchRejected: Wenn ein Scan nicht dem AccessScanRequest-Schema entspricht
+        """
+        try:
+            requests = [AccessScanRequest.model_validate(scan) for scan in scans]
+        except ValidationError as exc:
+            self._count_error("send_scan_batch")
+            raise ScanBatchRejected(str(exc)) from exc
+        result = await self._call("send_scan_batch", lambda db: self.access_service.scan_batch(db, requests))
+        return result is not None
+
+    async def stream_events(self) -> AsyncIterator[dict]:
+        """
+        Liefert Änderungen aus dem Change Feed im selben Prozess.
+
+        Bei Änderungen an Entities wird der Entity-Cache der Services
+        geleert. Ohne change_feed endet der Stream sofort und der Agent pollt.
+        """
+        if self._change_feed is None:
+            return
+
+        subscription = self._change_feed.subscribe()
+        try:
+            yield self._hello_event()
+            while True:
+                event = await subscription.get()
+                if subscription.overflowed:
+                    while not subscription.queue.empty():
+                        subscription.queue.get_nowait()
+                    subscription.overflowed = False
+                    yield self._hello_event()
+                else:
+                    if event.get("resource") == "entities":
+                        # Auch "nicht gefunden"-Einträge des Scan-Pfads verwerfen (z.B. nach convert)
+                        self.entity_service.cache.clear()
+                    yield {"event": "change", "data": event}
+        finally:
+            subscription.close()
+
+    def _hello_event(self) -> dict:
+        return {"event": "hello", "data": {
+            "version": self._change_feed.version,
+            "resources": self._change_feed.resource_versions()
+        }}
+
+    def __repr__(self):
+        return f"<EmbeddedTransport(change_feed={self._change_feed is not None})>"
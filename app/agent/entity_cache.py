@@ -0,0 +1,163 @@
+"""
+Entity Cache Module
+Lokaler rfid_id → Entity-Cache für den Pi-Agent.
+"""
+import asyncio
+import logging
+from time import monotonic
+from typing import Awaitable, Callable, Dict, Optional
+
+LOGGER = logging.getLogger(__name__)
+
+EntityFetcher = Callable[[], Awaitable[Optional[Dict[str, dict]]]]
+
+
+class EntityCache:
+    """
+    Hält die zuletzt erfolgreich geladene Entity-Liste im Speicher.
+
+    Lookups sind reine Dictionary-Zugriffe ohne HTTP. Ein Hintergrund-Task
+    aktualisiert den Cache zyklisch und zusätzlich nach einem Cache-Miss.
+    Schlägt ein Refresh fehl, bleibt die letzte gültige Kopie aktiv.
+
+    Attributes:
+        refresh_interval: Sekunden zwischen zwei regulären Refreshes
+        miss_refresh_gap: Mindestabstand in Sekunden zwischen Refreshes durch Cache-Misses
+    """
+
+    def __init__(
+        self,
+        fetcher: EntityFetcher,
+        refresh_interval: float = 30.0,
+        miss_refresh_gap: float = 2.0,
+        on_change: Optional[Callable[[Dict[str, dict]], None]] = None
+    ):
+        """
+        Initialisiert den Cache.
+
+        Args:
+            fetcher: Coroutine-Funktion, die {rfid_id: entity} liefert oder None bei Fehlern
+            refresh_interval: Sekunden zwischen zwei regulären Refreshes
+            miss_refresh_gap: Mindestabstand zwischen Refreshes durch Cache-Misses
+            on_change: Wird nach einem Refresh mit geändertem Inhalt aufgerufen
+        """
+        self._fetcher = fetcher
+        self._on_change = on_change
+        self.refresh_interval = refresh_interval
+        self.miss_refresh_gap = miss_refresh_gap
+
+        # Wird nur als Ganzes ersetzt, Lookups sehen immer einen konsistenten Stand
+        self._entities: Dict[str, dict] = {}
+        self._loaded = False
+        self._last_attempt = 0.0
+
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def loaded(self) -> bool:
+        """True, sobald mindestens ein Refresh erfolgreich war."""
+        return self._loaded
+
+    @property
+    def entities(self) -> Dict[str, dict]:
+        """Aktueller Cache-Inhalt (nicht verändern)."""
+        return self._entities
+
+    def seed(self, entities: Dict[str, dict]) -> None:
+        """Befüllt den Cache ohne API-Aufruf (z.B. aus dem Config-Snapshot)."""
+        self._entities = entities
+
+    def get(self, rfid_id: str) -> Optional[dict]:
+        """
+        Sucht eine Entity anhand der RFID-ID (O(1), ohne HTTP).
+
+        Bei einem Miss wird ein Refresh im Hintergrund angestoßen.
+
+        Args:
+            rfid_id: RFID-Tag-Nummer
+
+        Returns:
+            Entity-Dictionary oder None
+        """
+        entity = self._entities.get(rfid_id)
+        if entity is None:
+            self.request_refresh()
+        return entity
+
+    def request_refresh(self) -> None:
+        """Fordert einen Refresh im Hintergrund an."""
+        self._wakeup.set()
+
+    async def refresh(self) -> bool:
+        """
+        Lädt die Entities neu und ersetzt den Cache-Inhalt.
+
+        Returns:
+            True bei Erfolg, False wenn die letzte gültige Kopie behalten wurde
+        """
+        self._last_attempt = monotonic()
+        entities = await self._fetcher()
+        if entities is None:
+            LOGGER.warning("Entity refresh failed, keeping %d cached entities", len(self._entities))
+            return False
+
+        changed = entities != self._entities
+        self._entities = entities
+        self._loaded = True
+        LOGGER.debug("Entity cache refreshed (%d entities)", len(entities))
+        if changed and self._on_change is not None:
+            self._on_change(entities)
+        return True
+
+    async def start(self, initial_refresh: bool = True) -> None:
+        """
+        Startet den Hintergrund-Refresh.
+
+        Args:
+            initial_refresh: Vorher einmal laden (False, wenn per seed() befüllt)
+        """
+        if self._task is not None:
+            return
+
+        if initial_refresh:
+            await self.refresh()
+        self._task = asyncio.create_task(self._run(), name="entity_cache")
+
+    async def stop(self) -> None:
+        """Beendet den Hintergrund-Refresh."""
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.refresh_interval)
+                triggered = True
+            except asyncio.TimeoutError:
+                triggered = False
+            self._wakeup.clear()
+
+            # Misses von unbekannten Tags dürfen die API nicht fluten
+            if triggered:
+                remaining = self.miss_refresh_gap - (monotonic() - self._last_attempt)
+                if remaining > 0:
+                    await asyncio.sleep(remaining)
+
+            try:
+                await self.refresh()
+            except Exception as exc:
+                LOGGER.error("Unexpected error while refreshing entity cache: %s", exc)
+
+    def __len__(self) -> int:
+        return len(self._entities)
+
+    def __repr__(self):
+        return f"<EntityCache(entities={len(self._entities)}, loaded={self._loaded})>"
@@ -0,0 +1,257 @@
+"""
+Metrics Module
+Zähler, Histogramme und Prometheus-Endpunkt des Pi-Agents.
+"""
+import asyncio
+import bisect
+import logging
+from collections import deque
+from time import monotonic
+from typing import Callable, Deque, Dict, List, Optional, Tuple
+
+LOGGER = logging.getLogger(__name__)
+
+# Bucket-Grenzen in Sekunden (1 ms bis 10 s), passend für SPI-Reads bis Türzyklen
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+def _labels(labels: Dict[str, str]) -> Labels:
+    return tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+
+def _format_labels(labels: Labels, extra: Optional[Tuple[str, str]] = None) -> str:
+    items = list(labels) + ([extra] if extra else [])
+    if not items:
+        return ""
+    inner = ",".join(f'{key}="{value}"' for key, value in items)
+    return "{" + inner + "}"
+
+
+def _format_value(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+class Histogram:
+    """
+    Kumulatives Histogramm im Prometheus-Format.
+
+    observe() ist O(log b) über die Bucket-Grenzen und allokiert nichts.
+    """
+
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        """Zählt einen Messwert."""
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+class RollingRate:
+    """Anzahl Ereignisse im gleitenden Zeitfenster (z.B. Scans pro Minute)."""
+
+    def __init__(self, window: float = 60.0, clock: Callable[[], float] = monotonic):
+        self.window = window
+        self._clock = clock
+        self._events: Deque[float] = deque()
+
+    def mark(self) -> None:
+        """Zählt ein Ereignis zum aktuellen Zeitpunkt."""
+        self._events.append(self._clock())
+
+    def value(self) -> int:
+        """Ereignisse innerhalb des Fensters."""
+        cutoff = self._clock() - self.window
+        while self._events and self._events[0] < cutoff:
+            self._events.popleft()
+        return len(self._events)
+
+
+class Metrics:
+    """
+    Metrik-Registry des Agents.
+
+    Alle Aufrufe erfolgen aus der Event-Loop; daher sind keine Locks nötig
+    und ein Messpunkt kostet nur ein Dictionary-Update.
+    """
+
+    def __init__(self, prefix: str = "fooder_agent", buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.prefix = prefix
+        self._buckets = buckets
+        self._counters: Dict[str, Dict[Labels, float]] = {}
+        self._histograms: Dict[str, Dict[Labels, Histogram]] = {}
+        self._gauges: Dict[str, Callable[[], float]] = {}
+        self._help: Dict[str, str] = {}
+        self.scan_rate = RollingRate()
+        self.gauge("scans_per_minute", self.scan_rate.value, "Scans in den letzten 60 Sekunden")
+
+    def inc(self, name: str, value: float = 1, **labels: str) -> None:
+        """Erhöht einen Zähler."""
+        series = self._counters.setdefault(name, {})
+        key = _labels(labels)
+        series[key] = series.get(key, 0) + value
+
+    def observe(self, name: str, seconds: float, **labels: str) -> None:
+        """Zählt einen Messwert in einem Histogramm."""
+        series = self._histograms.setdefault(name, {})
+        key = _labels(labels)
+        histogram = series.get(key)
+        if histogram is None:
+            histogram = series[key] = Histogram(self._buckets)
+        histogram.observe(seconds)
+
+    def gauge(self, name: str, fn: Callable[[], float], help_text: str = "") -> None:
+        """Registriert einen Gauge, dessen Wert beim Export abgefragt wird."""
+        self._gauges[name] = fn
+        if help_text:
+            self._help[name] = help_text
+
+    def describe(self, name: str, help_text: str) -> None:
+        """Hinterlegt den HELP-Text einer Metrik."""
+        self._help[name] = help_text
+
+    def counter_value(self, name: str, **labels: str) -> float:
+        """Aktueller Wert eines Zählers (0, wenn nie erhöht)."""
+        return self._counters.get(name, {}).get(_labels(labels), 0)
+
+    def histogram(self, name: str, **labels: str) -> Optional[Histogram]:
+        """Histogramm einer Serie oder None."""
+        return self._histograms.get(name, {}).get(_labels(labels))
+
+    def render(self) -> str:
+        """Exportiert alle Metriken im Prometheus-Textformat (Version 0.0.4)."""
+        lines: List[str] = []
+
+        for name, series in sorted(self._counters.items()):
+            full = f"{self.prefix}_{name}"
+            self._header(lines, name, full, "counter")
+            for labels, value in sorted(series.items()):
+                lines.append(f"{full}{_format_labels(labels)} {_format_value(value)}")
+
+        for name, series in sorted(self._histograms.items()):
+            full = f"{self.prefix}_{name}"
+            self._header(lines, name, full, "histogram")
+            for labels, histogram in sorted(series.items()):
+                cumulative = 0
+                for bound, count in zip(histogram.buckets, histogram.counts):
+                    cumulative += count
+                    lines.append(f"{full}_bucket{_format_labels(labels, ('le', repr(bound)))} {cumulative}")
+                lines.append(f"{full}_bucket{_format_labels(labels, ('le', '+Inf'))} {histogram.count}")
+                lines.append(f"{full}_sum{_format_labels(labels)} {repr(histogram.sum)}")
+                lines.append(f"{full}_count{_format_labels(labels)} {histogram.count}")
+
+        for name, fn in sorted(self._gauges.items()):
+            full = f"{self.prefix}_{name}"
+            self._header(lines, name, full, "gauge")
+            try:
+                lines.append(f"{full} {_format_value(fn())}")
+            except Exception as exc:
+                LOGGER.warning("Could not read gauge %s: %s", name, exc)
+
+        return "\n".join(lines) + "\n"
+
+    def _header(self, lines: List[str], name: str, full: str, kind: str) -> None:
+        if name in self._help:
+            lines.append(f"# HELP {full} {self._help[name]}")
+        lines.append(f"# TYPE {full} {kind}")
+
+
+class ScanTrace:
+    """
+    Zeitmessung eines einzelnen Scans über alle Stufen.
+
+    Alle Stufen werden als Dauer in das Histogramm scan_stage_seconds
+    geschrieben: read, resolve und log als eigene Dauer, actuate_start und
+    actuate_end als Zeit seit Beginn des Reads (Tag aufgelegt -> Servo
+    bewegt bzw. alle Türen wieder geschlossen).
+    """
+
+    __slots__ = ("metrics", "started", "_open_doors")
+
+    def __init__(self, metrics: Metrics, started: float):
+        self.metrics = metrics
+        self.started = started
+        self._open_doors = 0
+
+    def span(self, stage: str, seconds: float) -> None:
+        """Erfasst die Dauer einer Stufe."""
+        self.metrics.observe("scan_stage_seconds", seconds, stage=stage)
+
+    def since_start(self, stage: str) -> None:
+        """Erfasst die Zeit seit Beginn des Scans für eine Stufe."""
+        self.span(stage, monotonic() - self.started)
+
+    def door_opened(self) -> Callable[[], None]:
+        """
+        Meldet eine geöffnete Tür an.
+
+        Returns:
+            Callback, der beim Schließen der Tür aufzurufen ist
+        """
+        self._open_doors += 1
+        return self._door_closed
+
+    def _door_closed(self) -> None:
+        self._open_doors -= 1
+        if self._open_doors == 0:
+            self.since_start("actuate_end")
+
+
+class MetricsServer:
+    """
+    Minimaler HTTP-Server für GET /metrics (Prometheus-Textformat).
+
+    Läuft in der Event-Loop des Agents über asyncio.start_server; jede
+    Anfrage wird mit einer vollständigen Antwort beantwortet und die
+    Verbindung geschlossen.
+    """
+
+    def __init__(self, metrics: Metrics, host: str = "127.0.0.1", port: int = 9105):
+        self.metrics = metrics
+        self.host = host
+        self.port = port
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    async def start(self) -> None:
+        """Startet den Server."""
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        LOGGER.info("Metrics endpoint listening on http://%s:%d/metrics", self.host, self.port)
+
+    async def stop(self) -> None:
+        """Stoppt den Server."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            request_line = await asyncio.wait_for(reader.readline(), timeout=5.0)
+            # Header bis zur Leerzeile verwerfen
+            while (await asyncio.wait_for(reader.readline(), timeout=5.0)) not in (b"\r\n", b"\n", b""):
+                pass
+
+            parts = request_line.decode("latin-1").split()
+            if len(parts) >= 2 and parts[0] == "GET" and parts[1].split("?")[0] == "/metrics":
+                status, body = "200 OK", self.metrics.render().encode()
+                content_type = "text/plain; version=0.0.4; charset=utf-8"
+            else:
+                status, body, content_type = "404 Not Found", b"not found\n", "text/plain"
+
+            writer.write(
+                f"HTTP/1.1 {status}\r\nContent-Type: {content_type}\r\n"
+                f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode() + body
+            )
+            await writer.drain()
+        except (asyncio.TimeoutError, ConnectionError):
+            pass
+        finally:
+            writer.close()
@@ -0,0 +1,257 @@
+"""
+Scan Outbox Module
+Dauerhafte Warteschlange für Scan-Ereignisse des Pi-Agents.
+"""
+import asyncio
+import logging
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from functools import partial
+from pathlib import Path
+from time import monotonic
+from typing import Awaitable, Callable, List, Optional, TypeVar
+
+LOGGER = logging.getLogger(__name__)
+
+# Erhält eine Liste von {"rfid_id", "timestamp"} und meldet True bei Erfolg,
+# False bei vorübergehenden Fehlern; ScanBatchRejected bei endgültiger Ablehnung
+BatchSender = Callable[[List[dict]], Awaitable[bool]]
+
+T = TypeVar("T")
+
+
+class ScanBatchRejected(Exception):
+    """Das Backend lehnt einen Scan-Batch endgültig ab (erneutes Senden ist zwecklos)."""
+
+
+class ScanOutbox:
+    """
+    Outbox für Scan-Ereignisse auf Basis einer lokalen SQLite-Datei.
+
+    record() kehrt erst zurück, wenn das Ereignis in der Datei committed
+    ist (synchronous=FULL, übersteht also auch Stromausfälle). Alle
+    Dateizugriffe laufen in einem eigenen Writer-Thread, damit die
+    Event-Loop nicht blockiert. Ein Hintergrund-Task überträgt die
+    Ereignisse in Batches an die API. Bei vorübergehenden Fehlern wird mit
+    exponentiellem Backoff erneut versucht; nicht übertragene Ereignisse
+    überleben API-Ausfälle und Neustarts inklusive ihres ursprünglichen
+    Zeitstempels.
+
+    Lehnt die API einen Batch endgültig ab (ScanBatchRejected, z.B. HTTP
+    422), werden seine Ereignisse einzeln übertragen. Einzeln abgelehnte
+    Ereignisse landen mit Grund in scan_events_rejected, damit sie die
+    Warteschlange nicht dauerhaft blockieren.
+
+    Attributes:
+        path: Pfad der SQLite-Datei
+        batch_size: Maximale Anzahl Ereignisse pro Übertragung
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        sender: BatchSender,
+        batch_size: int = 100,
+        min_backoff: float = 1.0,
+        max_backoff: float = 60.0
+    ):
+        """
+        Initialisiert die Outbox.
+
+        Args:
+            path: Pfad der SQLite-Datei (wird bei Bedarf angelegt)
+            sender: Coroutine-Funktion, die einen Batch an die API überträgt
+            batch_size: Maximale Anzahl Ereignisse pro Übertragung
+            min_backoff: Wartezeit in Sekunden nach dem ersten Fehlschlag
+            max_backoff: Maximale Wartezeit in Sekunden zwischen Versuchen
+        """
+        self.path = Path(path)
+        self.batch_size = batch_size
+        self.min_backoff = min_backoff
+        self.max_backoff = max_backoff
+        self._sender = sender
+
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._wakeup = asyncio.Event()
+        self._stopping = False
+        self._task: Optional[asyncio.Task] = None
+        self._conn: Optional[sqlite3.Connection] = None
+        self._pending = 0
+
+    @property
+    def pending(self) -> int:
+        """Anzahl gespeicherter, noch nicht übertragener Ereignisse (Schätzung)."""
+        return self._pending
+
+    async def record(self, rfid_id: str, timestamp: Optional[datetime] = None) -> None:
+        """
+        Speichert ein Scan-Ereignis dauerhaft, ohne auf das Netzwerk zu warten.
+
+        Args:
+            rfid_id: Gescannte RFID-Tag-Nummer
+            timestamp: Zeitpunkt des Scans (default: jetzt, UTC)
+
+        Raises:
+            RuntimeError: Wenn die Outbox nicht gestartet ist
+        """
+        if self._conn is None:
+            raise RuntimeError("Scan outbox is not started")
+
+        scanned_at = timestamp or datetime.now(timezone.utc)
+        await self._db(self._persist, [(rfid_id, scanned_at.isoformat())])
+        self._pending += 1
+        self._wakeup.set()
+
+    async def start(self) -> None:
+        """Öffnet die Datei und startet den Hintergrund-Flusher."""
+        if self._task is not None:
+            return
+
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="scan_outbox")
+        self._conn = await self._db(self._connect)
+        self._pending = await self._db(self._count)
+        if self._pending:
+            LOGGER.info("Outbox contains %d unsent scan events", self._pending)
+
+        self._stopping = False
+        self._task = asyncio.create_task(self._run(), name="scan_outbox")
+
+    async def stop(self) -> None:
+        """Beendet den Flusher; gespeicherte Ereignisse bleiben in der Datei."""
+        if self._task is None:
+            return
+
+        self._stopping = True
+        self._wakeup.set()
+        await self._task
+        self._task = None
+
+        conn, self._conn = self._conn, None
+        await self._db(conn.close)
+        self._executor.shutdown()
+        self._executor = None
+
+    async def _db(self, fn: Callable[..., T], *args) -> T:
+        # Ein einziger Writer-Thread: record() und Flusher greifen nie gleichzeitig auf die Verbindung zu
+        return await asyncio.get_running_loop().run_in_executor(self._executor, partial(fn, *args))
+
+    def _connect(self) -> sqlite3.Connection:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Erzeugt im Writer-Thread und nur dort genutzt
+        conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=FULL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS scan_events ("
+            " id INTEGER PRIMARY KEY AUTOINCREMENT,"
+            " rfid_id TEXT NOT NULL,"
+            " scanned_at TEXT NOT NULL)"
+        )
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS scan_events_rejected ("
+            " id INTEGER PRIMARY KEY,"
+            " rfid_id TEXT NOT NULL,"
+            " scanned_at TEXT NOT NULL,"
+            " rejected_at TEXT NOT NULL,"
+            " reason TEXT NOT NULL)"
+        )
+        conn.commit()
+        return conn
+
+    def _persist(self, rows: List[tuple[str, str]]) -> None:
+        with self._conn:
+            self._conn.executemany("INSERT INTO scan_events (rfid_id, scanned_at) VALUES (?, ?)", rows)
+
+    def _read_batch(self) -> list:
+        return self._conn.execute(
+            "SELECT id, rfid_id, scanned_at FROM scan_events ORDER BY id LIMIT ?",
+            (self.batch_size,)
+        ).fetchall()
+
+    def _delete_up_to(self, last_id: int) -> None:
+        with self._conn:
+            self._conn.execute("DELETE FROM scan_events WHERE id <= ?", (last_id,))
+
+    def _reject(self, row: tuple, reason: str) -> None:
+        rejected_at = datetime.now(timezone.utc).isoformat()
+        with self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO scan_events_rejected (id, rfid_id, scanned_at, rejected_at, reason)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (*row, rejected_at, reason)
+            )
+            self._conn.execute("DELETE FROM scan_events WHERE id <= ?", (row[0],))
+
+    def _count(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM scan_events").fetchone()[0]
+
+    @staticmethod
+    def _to_scans(rows: list) -> List[dict]:
+        return [{"rfid_id": rfid_id, "timestamp": scanned_at} for _id, rfid_id, scanned_at in rows]
+
+    async def _flush_batch(self) -> bool:
+        rows = await self._db(self._read_batch)
+        if not rows:
+            self._pending = 0
+            return True
+
+        try:
+            if not await self._sender(self._to_scans(rows)):
+                return False
+        except ScanBatchRejected as exc:
+            LOGGER.warning("API rejected batch of %d scan events (%s), sending them one by one", len(rows), exc)
+            return await self._flush_single(rows)
+
+        await self._db(self._delete_up_to, rows[-1][0])
+        self._pending = max(0, self._pending - len(rows))
+        LOGGER.debug("Flushed %d scan events", len(rows))
+        return True
+
+    async def _flush_single(self, rows: list) -> bool:
+        """Überträgt einen abgelehnten Batch einzeln; abgelehnte Ereignisse wandern in scan_events_rejected."""
+        for row in rows:
+            try:
+                if not await self._sender(self._to_scans([row])):
+                    return False
+            except ScanBatchRejected as exc:
+                LOGGER.error("Dropping scan event %d (rfid %r, scanned at %s): %s", *row, exc)
+                await self._db(self._reject, row, str(exc))
+            else:
+                await self._db(self._delete_up_to, row[0])
+            self._pending = max(0, self._pending - 1)
+        return True
+
+    async def _run(self) -> None:
+        backoff = 0.0
+        retry_at = 0.0
+
+        while True:
+            self._wakeup.clear()
+            if self._stopping:
+                break
+
+            if self._pending and monotonic() >= retry_at:
+                try:
+                    sent = await self._flush_batch()
+                except Exception as exc:
+                    LOGGER.error("Unexpected error while flushing outbox: %s", exc)
+                    sent = False
+
+                if sent:
+                    backoff = 0.0
+                    # Weitere volle Batches direkt hinterher schicken
+                    continue
+
+                backoff = min(self.max_backoff, max(self.min_backoff, backoff * 2))
+                retry_at = monotonic() + backoff
+                LOGGER.warning("Could not deliver %d scan events, retrying in %.1fs", self._pending, backoff)
+
+            wait = max(0.0, retry_at - monotonic()) if self._pending else None
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=wait)
+            except asyncio.TimeoutError:
+                pass
+
+    def __repr__(self):
+        return f"<ScanOutbox(path='{self.path}', pending={self.pending})>"
@@ -0,0 +1,430 @@
+"""
+Agent Runtime Module
+Asyncio-basierte Laufzeit des Pi-Agents.
+"""
+import asyncio
+import logging
+from datetime import datetime, timezone
+from pathlib import Path
+from time import monotonic
+from typing import Callable, Dict, List, Optional, Tuple
+
+from ..hardware import PresenceTracker, RFIDReader
+from ..hardware.presence import ARRIVED
+from .doors import DoorBank, ServoFactory
+from .entity_cache import EntityCache
+from .metrics import Metrics, MetricsServer, ScanTrace
+from .outbox import ScanOutbox
+from .snapshot import ConfigSnapshot
+from .stations import DEFAULT_STATION, Station, StationPoller
+from .transport import Transport
+
+LOGGER = logging.getLogger(__name__)
+
+
+class AgentRuntime:
+    """
+    Laufzeit des Pi-Agents.
+
+    Jede Station (Reader) hat eine eigene Anwesenheitserkennung; ihre
+    Scans werden unabhängig von anderen Stationen entschieden und öffnen
+    nur die Türen, deren DoorSetting.station zu ihr passt (oder leer ist).
+
+    RFID-Polling, Konfigurations-Refresh, Entity-Cache, Outbox und die
+    Türsteuerung (DoorScheduler) laufen als unabhängige asyncio-Tasks. Ein
+    Scan wird sofort verarbeitet, auch wenn andere Türen gerade offen sind.
+    Der PresenceTracker reduziert das Dauerlesen eines anwesenden Tieres auf
+    ein einziges "angekommen"-Event; nur diese Events werden entschieden.
+    Kommt ein Tag erneut an, solange dessen Türen offen sind, wird die
+    Öffnung verlängert, ohne den Scan erneut zu entscheiden oder zu loggen.
+
+    Konfigurationsänderungen kommen über den Event-Stream GET /events;
+    /settings wird nur gepollt, solange der Stream nicht verbunden ist.
+
+    Mit snapshot_path wird jede Änderung an Türkonfiguration, Entities und
+    pending_door_values lokal gespeichert. Beim Start ist der Agent damit
+    sofort einsatzbereit und gleicht sich im Hintergrund mit der API ab,
+    sobald diese erreichbar ist.
+    """
+
+    def __init__(
+        self,
+        api: Transport,
+        outbox_path: Path,
+        readers: Optional[Dict[str, Callable[[], RFIDReader]]] = None,
+        servo_factory: Optional[ServoFactory] = None,
+        poll_interval: float = 0.2,
+        config_reload_interval: float = 10.0,
+        entity_refresh_interval: float = 30.0,
+        scan_resolve_timeout: float = 1.0,
+        settings_retry_interval: float = 3.0,
+        max_reconnect_delay: float = 30.0,
+        presence_hold_off: float = 1.0,
+        presence_rearm: float = 5.0,
+        metrics: Optional[Metrics] = None,
+        metrics_port: Optional[int] = None,
+        snapshot_path: Optional[Path] = None
+    ):
+        """
+        Initialisiert die Laufzeit.
+
+        Args:
+            api: Zugriff auf das Backend (ApiClient über HTTP oder EmbeddedTransport)
+            outbox_path: Pfad der Outbox-Datei
+            readers: {station: Factory des RFID-Readers} (default: ein RFIDReader als DEFAULT_STATION)
+            servo_factory: Erzeugt ServoController (default: ServoController)
+            poll_interval: Sekunden zwischen zwei RFID-Abfragen je Station (im IRQ-Modus: maximale Wartezeit je Aufruf)
+            config_reload_interval: Sekunden zwischen zwei Abfragen von /settings (ohne Event-Stream)
+            entity_refresh_interval: Sekunden zwischen zwei Entity-Refreshes
+            scan_resolve_timeout: Timeout für /access/scan bei Cache-Misses
+            settings_retry_interval: Wartezeit, wenn beim Start keine Settings verfügbar sind
+            max_reconnect_delay: Maximale Wartezeit zwischen Verbindungsversuchen zum Event-Stream
+            presence_hold_off: Sekunden ohne Lesung, bis ein Tag als weg gilt
+            presence_rearm: Sperrzeit nach dem Weggang, bevor derselbe Tag erneut zählt
+            metrics: Metrik-Registry (default: neue Registry)
+            metrics_port: Port des lokalen /metrics-Endpunkts; None = kein Endpunkt
+            snapshot_path: Pfad des Config-Snapshots; None = kein Snapshot
+        """
+        self.api = api
+        self.poll_interval = poll_interval
+        self.config_reload_interval = config_reload_interval
+        self.scan_resolve_timeout = scan_resolve_timeout
+        self.settings_retry_interval = settings_retry_interval
+        self.max_reconnect_delay = max_reconnect_delay
+        self.presence_hold_off = presence_hold_off
+        self.presence_rearm = presence_rearm
+
+        self._reader_factories = readers or {DEFAULT_STATION: RFIDReader}
+        self.stations: List[Station] = []
+        self.doors = DoorBank(servo_factory) if servo_factory else DoorBank()
+        self.entity_cache = EntityCache(
+            api.fetch_entities,
+            refresh_interval=entity_refresh_interval,
+            on_change=lambda _entities: self._snapshot_changed()
+        )
+        self.outbox = ScanOutbox(outbox_path, api.send_scan_batch)
+        self.pending_door_values: Dict[str, float] = {}
+        self.snapshot = ConfigSnapshot(snapshot_path) if snapshot_path else None
+
+        self.metrics = metrics or Metrics()
+        self.metrics.gauge("outbox_pending", lambda: self.outbox.pending, "Noch nicht übertragene Scan-Events")
+        self.metrics.gauge("entity_cache_size", lambda: len(self.entity_cache), "Entities im lokalen Cache")
+        self.metrics.gauge("events_connected", lambda: int(self._events_connected), "1, wenn GET /events verbunden ist")
+        self.metrics.describe("scan_stage_seconds", "Dauer je Scan-Stufe (actuate_* ab Beginn des Reads)")
+        self.metrics.describe("outbox_errors_total", "Scans, die nicht in die Outbox geschrieben werden konnten")
+        self._metrics_server = MetricsServer(self.metrics, port=metrics_port) if metrics_port else None
+
+        self._stop = asyncio.Event()
+        self._scan_tasks: set[asyncio.Task] = set()
+        # (Station, Tag), deren Scan gerade entschieden wird
+        self._resolving: set[Tuple[str, str]] = set()
+        # Laufende Öffnungen je (Station, Tag): (Ende auf monotonic-Skala, door_values)
+        self._tag_cycles: Dict[Tuple[str, str], Tuple[float, Dict[str, float]]] = {}
+        self._events_connected = False
+        self._config_lock = asyncio.Lock()
+        self._snapshot_dirty = asyncio.Event()
+
+    def stop(self) -> None:
+        """Fordert das Beenden der Laufzeit an (auch aus Signal-Handlern)."""
+        self._stop.set()
+
+    async def run(self) -> None:
+        """Startet alle Tasks und läuft bis stop() aufgerufen wird."""
+        self.stations = self._create_stations()
+        if not self.stations:
+            LOGGER.error("No RFID reader available, exiting")
+            return
+
+        tasks = []
+        snapshot = await asyncio.to_thread(self.snapshot.load) if self.snapshot else None
+        if snapshot and snapshot["door_settings"]:
+            # Kaltstart aus dem Snapshot, Abgleich mit der API im Hintergrund
+            LOGGER.info("Starting from config snapshot saved at %s", snapshot["saved_at"])
+            self.doors.configure(snapshot["door_settings"])
+            self.entity_cache.seed(snapshot["entities"])
+            self.pending_door_values = snapshot["pending_door_values"]
+            await self.entity_cache.start(initial_refresh=False)
+            tasks.append(asyncio.create_task(self._reconcile(), name="config_reconcile"))
+        else:
+            settings = await self._load_initial_settings()
+            if settings is None:
+                for station in self.stations:
+                    station.reader.close()
+                return
+            self.doors.configure(settings)
+
+            await self.entity_cache.start()
+            self.pending_door_values = await self.api.fetch_pending_door_values() or {}
+            self._snapshot_changed()
+
+        await self.outbox.start()
+        if self._metrics_server is not None:
+            await self._metrics_server.start()
+
+        poller = StationPoller(self.stations, self._on_read, poll_interval=self.poll_interval)
+        tasks += [
+            asyncio.create_task(poller.run(), name="rfid_stations"),
+            asyncio.create_task(self._reload_config(), name="config_reload"),
+            asyncio.create_task(self._watch_changes(), name="change_events"),
+        ]
+        if self.snapshot is not None:
+            tasks.append(asyncio.create_task(self._write_snapshots(), name="config_snapshot"))
+        LOGGER.info("Fooder Pi agent ready. Scan RFID tags.")
+
+        try:
+            await self._stop.wait()
+        finally:
+            LOGGER.info("Stopping agent...")
+            for task in tasks + list(self._scan_tasks):
+                task.cancel()
+            await asyncio.gather(*tasks, *self._scan_tasks, return_exceptions=True)
+            if self._snapshot_dirty.is_set():
+                await self._save_snapshot()
+
+            await self.doors.close()
+            for station in self.stations:
+                await asyncio.to_thread(station.reader.close)
+            await self.entity_cache.stop()
+            await self.outbox.stop()
+            if self._metrics_server is not None:
+                await self._metrics_server.stop()
+            await self.api.aclose()
+
+    async def _load_initial_settings(self) -> Optional[Dict[str, dict]]:
+        while not self._stop.is_set():
+            settings = await self.api.fetch_door_settings()
+            if settings:
+                return settings
+
+            LOGGER.warning("Could not load door settings from API. Retry in %.0fs...", self.settings_retry_interval)
+            try:
+                await asyncio.wait_for(self._stop.wait(), timeout=self.settings_retry_interval)
+            except asyncio.TimeoutError:
+                pass
+        return None
+
+    async def _reconcile(self) -> None:
+        """Gleicht den Snapshot-Stand mit der API ab, sobald sie erreichbar ist."""
+        while not await self._refresh_settings():
+            await asyncio.sleep(self.settings_retry_interval)
+        await asyncio.gather(self.entity_cache.refresh(), self._refresh_pending_door_values())
+        LOGGER.info("Configuration reconciled with API")
+
+    def _snapshot_changed(self) -> None:
+        if self.snapshot is not None:
+            self._snapshot_dirty.set()
+
+    async def _write_snapshots(self) -> None:
+        # Änderungen kurz hintereinander werden zu einem Schreibvorgang zusammengefasst
+        while True:
+            await self._snapshot_dirty.wait()
+            await self._save_snapshot()
+
+    async def _save_snapshot(self) -> None:
+        self._snapshot_dirty.clear()
+        if not self.doors.settings:
+            return
+        try:
+            await asyncio.to_thread(
+                self.snapshot.save,
+                dict(self.doors.settings),
+                self.entity_cache.entities,
+                dict(self.pending_door_values)
+            )
+        except OSError as exc:
+            LOGGER.error("Could not write config snapshot %s: %s", self.snapshot.path, exc)
+
+    def _create_stations(self) -> List[Station]:
+        stations = []
+        for name, factory in self._reader_factories.items():
+            try:
+                reader = factory()
+            except Exception as exc:
+                LOGGER.error("Failed to initialize reader of station %s: %s", name, exc)
+                continue
+            presence = PresenceTracker(hold_off=self.presence_hold_off, rearm=self.presence_rearm)
+            stations.append(Station(name, reader, presence))
+        return stations
+
+    def _on_read(self, station: Station, rfid_id: Optional[int]) -> None:
+        self.metrics.inc("reads_total", station=station.name)
+        for event in station.presence.update(rfid_id):
+            if event.kind == ARRIVED:
+                self.metrics.inc("scans_total", station=station.name)
+                self.metrics.scan_rate.mark()
+                trace = ScanTrace(self.metrics, station.last_read_started)
+                if station.last_read_seconds:
+                    trace.span("read", station.last_read_seconds)
+                self._submit_scan(station.name, str(event.rfid_id), trace)
+            else:
+                LOGGER.info("RFID %s left station %s after %.1fs", event.rfid_id, station.name, event.duration)
+
+    def _submit_scan(self, station: str, rfid: str, trace: Optional[ScanTrace] = None) -> None:
+        key = (station, rfid)
+        if key in self._resolving:
+            return
+
+        cycle = self._tag_cycles.get(key)
+        if cycle is not None and monotonic() < cycle[0]:
+            # Tag liegt noch auf: offene Türen verlängern statt neu zu zyklisieren
+            self.metrics.inc("decisions_total", result="extended")
+            self._open_doors(station, rfid, cycle[1], trace)
+            return
+
+        self._resolving.add(key)
+        task = asyncio.create_task(self._handle_scan(station, rfid, trace), name=f"scan_{station}_{rfid}")
+        self._scan_tasks.add(task)
+        task.add_done_callback(self._scan_tasks.discard)
+
+    async def _handle_scan(self, station: str, rfid: str, trace: Optional[ScanTrace] = None) -> None:
+        try:
+            started = monotonic()
+            scanned_at = datetime.now(timezone.utc)
+            door_values, log_locally = await self.resolve_door_values(rfid, trace)
+            if trace is not None:
+                trace.span("resolve", monotonic() - started)
+            self._open_doors(station, rfid, door_values, trace)
+            # Erst nach dem Öffnen: der Scan wartet nie auf die Outbox
+            if log_locally:
+                await self._record(rfid, scanned_at, trace)
+        except Exception as exc:
+            LOGGER.error("Error handling scan of %s at station %s: %s", rfid, station, exc)
+        finally:
+            self._resolving.discard((station, rfid))
+
+    def _open_doors(
+        self, station: str, rfid: str, door_values: Dict[str, float], trace: Optional[ScanTrace] = None
+    ) -> None:
+        now = monotonic()
+        dispatched = self.doors.dispatch(door_values, station=station, trace=trace)
+        if dispatched and trace is not None:
+            trace.since_start("actuate_start")
+
+        # Abgelaufene Zyklen verwerfen
+        for key in [key for key, (until, _values) in self._tag_cycles.items() if until <= now]:
+            del self._tag_cycles[key]
+        if dispatched:
+            until = now + max(door_values[name] for name in dispatched)
+            self._tag_cycles[(station, rfid)] = (until, door_values)
+
+    async def resolve_door_values(
+        self, rfid: str, trace: Optional[ScanTrace] = None
+    ) -> Tuple[Dict[str, float], bool]:
+        """
+        Ermittelt die Türwerte für einen Scan.
+
+        Bekannte Tags werden aus dem Cache entschieden und müssen danach über
+        die Outbox geloggt werden. Unbekannte Tags fragt der Agent mit kurzem
+        Timeout bei /access/scan an (das Backend loggt selbst); ist die API
+        nicht erreichbar, gelten die zuletzt bekannten pending_door_values.
+
+        Args:
+            rfid: Gescannte RFID-Tag-Nummer
+            trace: Zeitmessung des Scans
+
+        Returns:
+            (door_values, True, wenn der Scan über die Outbox geloggt werden muss)
+        """
+        entity = self.entity_cache.get(rfid)
+        if entity:
+            LOGGER.info("RFID %s recognized as entity ID %d", rfid, entity["id"])
+            self.metrics.inc("cache_hits_total")
+            self.metrics.inc("decisions_total", result="granted")
+            return entity.get("door_values", {}), True
+
+        self.metrics.inc("cache_misses_total")
+        result = await self.api.resolve_scan(rfid, timeout=self.scan_resolve_timeout)
+        if result is None:
+            LOGGER.warning("Unknown RFID %s (API unreachable, using cached pending values)", rfid)
+            self.metrics.inc("decisions_total", result="offline")
+            return self.pending_door_values, True
+
+        self.metrics.inc("decisions_total", result=result["action"])
+        if result["action"] == "granted":
+            LOGGER.info("RFID %s recognized as entity ID %d", rfid, result["entity_id"])
+        else:
+            LOGGER.warning("Unknown RFID %s", rfid)
+            if result["door_values"] != self.pending_door_values:
+                self.pending_door_values = result["door_values"]
+                self._snapshot_changed()
+        return result["door_values"], False
+
+    async def _record(self, rfid: str, scanned_at: datetime, trace: Optional[ScanTrace]) -> None:
+        started = monotonic()
+        try:
+            await self.outbox.record(rfid, scanned_at)
+        except Exception as exc:
+            LOGGER.error("Could not record scan of %s in outbox: %s", rfid, exc)
+            self.metrics.inc("outbox_errors_total")
+            return
+        if trace is not None:
+            trace.span("log", monotonic() - started)
+
+    async def _reload_config(self) -> None:
+        """Fallback-Polling, solange der Event-Stream nicht verbunden ist."""
+        while True:
+            await asyncio.sleep(self.config_reload_interval)
+            if not self._events_connected:
+                await self._refresh_settings()
+
+    async def _refresh_settings(self) -> bool:
+        async with self._config_lock:
+            new_settings = await self.api.fetch_door_settings()
+            if not new_settings:
+                LOGGER.warning("Could not reload settings, keeping current configuration")
+                return False
+
+            if new_settings != self.doors.settings:
+                await self.doors.reconfigure(new_settings)
+                self._snapshot_changed()
+            return True
+
+    async def _refresh_pending_door_values(self) -> None:
+        values = await self.api.fetch_pending_door_values()
+        if values is not None and values != self.pending_door_values:
+            self.pending_door_values = values
+            self._snapshot_changed()
+
+    async def _watch_changes(self) -> None:
+        delay = 1.0
+        while True:
+            events = self.api.stream_events()
+            try:
+                async for event in events:
+                    if not self._events_connected:
+                        LOGGER.info("Subscribed to change events, polling paused")
+                        self._events_connected = True
+                        delay = 1.0
+                    await self._apply_change(event)
+            except Exception as exc:
+                # Wie ein verlorener Stream behandeln: Polling übernimmt, danach neu verbinden
+                LOGGER.error("Error while processing change events: %s", exc)
+            finally:
+                await events.aclose()
+                if self._events_connected:
+                    LOGGER.warning("Change event stream lost, falling back to polling")
+                self._events_connected = False
+            await asyncio.sleep(delay)
+            delay = min(self.max_reconnect_delay, delay * 2)
+
+    async def _apply_change(self, event: dict) -> None:
+        name = event["event"]
+        if name == "hello":
+            # Nach (Re-)Connect können Änderungen verpasst worden sein
+            await asyncio.gather(
+                self._refresh_settings(),
+                self.entity_cache.refresh(),
+                self._refresh_pending_door_values()
+            )
+            return
+        if name != "change":
+            return
+
+        resource = event["data"].get("resource")
+        LOGGER.info("Change event %s (version %s)", resource, event["data"].get("version"))
+        if resource == "settings":
+            await self._refresh_settings()
+        elif resource == "entities":
+            await self.entity_cache.refresh()
+        elif resource == "system_settings":
+            await self._refresh_pending_door_values()
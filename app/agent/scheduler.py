@@ -0,0 +1,202 @@
+"""
+Door Scheduler Module
+Zentrale Zustandsmaschine für das Öffnen und Schließen der Türen.
+"""
+import asyncio
+import logging
+from enum import Enum
+from time import monotonic
+from typing import TYPE_CHECKING, Iterable, Optional
+
+from .timers import Timer, TimerQueue
+
+if TYPE_CHECKING:
+    from .doors import Door
+
+LOGGER = logging.getLogger(__name__)
+
+
+class DoorState(str, Enum):
+    """Zustand einer Tür."""
+    CLOSED = "closed"
+    OPENING = "opening"
+    OPEN = "open"
+    CLOSING = "closing"
+
+
+class DoorScheduler:
+    """
+    Steuert alle Türen über eine gemeinsame Timer-Queue.
+
+    Statt eines Threads bzw. Tasks pro Öffnungszyklus plant der Scheduler
+    für jede Tür nur Deadlines ein (Schließen, Ende der Servo-Bewegung).
+    Ein einzelner Treiber-Task schläft exakt bis zur nächsten Deadline.
+
+    - Ein weiterer open() auf eine offene Tür verlängert die Öffnung,
+      statt sie neu zu zyklisieren.
+    - cancel() schließt eine Tür sofort, close_all() alle (Notschließung).
+    - hold()/release() sperren eine Tür während eines Servo-Tauschs;
+      Öffnungen in dieser Zeit werden danach nachgeholt.
+
+    Attributes:
+        travel_time: Angenommene Stellzeit des Servos in Sekunden
+    """
+
+    def __init__(self, travel_time: float = 0.3):
+        self.travel_time = travel_time
+        self._timers = TimerQueue()
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._running = False
+
+    # ------------------------------------------------------------------ #
+    # Befehle
+    # ------------------------------------------------------------------ #
+
+    def open(self, door: "Door", seconds: float) -> bool:
+        """
+        Öffnet eine Tür für die angegebene Zeit oder verlängert die Öffnung.
+
+        Args:
+            door: Tür
+            seconds: Öffnungsdauer ab jetzt
+
+        Returns:
+            True, wenn ein neuer Öffnungszyklus gestartet wurde
+        """
+        if seconds <= 0:
+            LOGGER.info("%s: Skipping (value=%.2f seconds, no opening)", door.name, seconds)
+            return False
+        if door.closed:
+            return False
+        if door.held:
+            door.deferred_seconds = max(door.deferred_seconds, seconds)
+            return False
+
+        now = monotonic()
+        close_at = now + seconds
+
+        if door.state in (DoorState.OPENING, DoorState.OPEN):
+            if close_at > door.close_at:
+                LOGGER.debug("Extending %s by %.2f seconds", door.name, close_at - door.close_at)
+                door.close_at = close_at
+                self._replace(door, "close_timer", self._timers.schedule(close_at, lambda: self._close(door)))
+            return False
+
+        LOGGER.info("Opening %s for %.2f seconds", door.name, seconds)
+        try:
+            door.servo.move_to_min()
+        except Exception as exc:
+            LOGGER.error("Error operating door %s: %s", door.name, exc)
+            return False
+
+        door.state = DoorState.OPENING
+        door.idle.clear()
+        door.close_at = close_at
+        self._replace(door, "settle_timer", self._schedule(now + self.travel_time, lambda: self._settle(door, DoorState.OPEN)))
+        self._replace(door, "close_timer", self._schedule(close_at, lambda: self._close(door)))
+        return True
+
+    def cancel(self, door: "Door") -> None:
+        """Bricht eine laufende Öffnung ab und schließt die Tür sofort."""
+        if door.state in (DoorState.OPENING, DoorState.OPEN):
+            LOGGER.info("Cancelling open cycle of %s", door.name)
+            self._close(door)
+
+    def close_all(self, doors: Iterable["Door"]) -> None:
+        """Notschließung: schließt alle offenen Türen sofort."""
+        for door in doors:
+            self.cancel(door)
+
+    def hold(self, door: "Door") -> None:
+        """Sperrt eine Tür für neue Öffnungen (z.B. während eines Servo-Tauschs)."""
+        door.held = True
+
+    def release(self, door: "Door") -> None:
+        """Gibt eine Tür wieder frei und holt zwischenzeitliche Öffnungen nach."""
+        door.held = False
+        seconds, door.deferred_seconds = door.deferred_seconds, 0.0
+        if seconds > 0:
+            self.open(door, seconds)
+
+    async def wait_closed(self, door: "Door") -> None:
+        """Wartet, bis die Tür vollständig geschlossen ist."""
+        await door.idle.wait()
+
+    # ------------------------------------------------------------------ #
+    # Treiber
+    # ------------------------------------------------------------------ #
+
+    def start(self) -> None:
+        """Startet den Treiber-Task."""
+        if self._task is None:
+            self._running = True
+            self._task = asyncio.create_task(self._run(), name="door_scheduler")
+
+    async def stop(self) -> None:
+        """Beendet den Treiber-Task."""
+        if self._task is None:
+            return
+
+        # Über Flag statt cancel(): wait_for() kann eine Cancellation verschlucken,
+        # wenn das Wakeup-Event im selben Moment gesetzt wird
+        self._running = False
+        self._wakeup.set()
+        await self._task
+        self._task = None
+
+    async def _run(self) -> None:
+        while self._running:
+            for timer in self._timers.pop_due():
+                try:
+                    timer.callback()
+                except Exception as exc:
+                    LOGGER.error("Error in door timer: %s", exc)
+
+            self._wakeup.clear()
+            deadline = self._timers.next_deadline()
+            timeout = None if deadline is None else max(0.0, deadline - monotonic())
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                pass
+
+    # ------------------------------------------------------------------ #
+    # Intern
+    # ------------------------------------------------------------------ #
+
+    def _schedule(self, deadline: float, callback) -> Timer:
+        timer = self._timers.schedule(deadline, callback)
+        # Treiber neu einplanen lassen, falls die neue Deadline früher liegt
+        self._wakeup.set()
+        return timer
+
+    @staticmethod
+    def _replace(door: "Door", attribute: str, timer: Optional[Timer]) -> None:
+        previous = getattr(door, attribute)
+        if previous is not None:
+            previous.cancel()
+        setattr(door, attribute, timer)
+
+    def _close(self, door: "Door") -> None:
+        self._replace(door, "close_timer", None)
+        LOGGER.info("Closing %s", door.name)
+        try:
+            door.servo.move_to_max()
+        except Exception as exc:
+            LOGGER.error("Error closing door %s: %s", door.name, exc)
+
+        door.state = DoorState.CLOSING
+        self._replace(door, "settle_timer", self._schedule(monotonic() + self.travel_time, lambda: self._settle(door, DoorState.CLOSED)))
+
+    def _settle(self, door: "Door", state: DoorState) -> None:
+        door.settle_timer = None
+        door.state = state
+        if state is DoorState.CLOSED:
+            door.idle.set()
+            callbacks, door.on_closed = door.on_closed, []
+            for callback in callbacks:
+                try:
+                    callback()
+                except Exception as exc:
+                    LOGGER.error("Error in close callback of %s: %s", door.name, exc)
@@ -0,0 +1,91 @@
+"""
+Config Snapshot Module
+Letzter bekannter Konfigurationsstand des Pi-Agents als lokale Datei.
+"""
+import json
+import logging
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Optional
+
+LOGGER = logging.getLogger(__name__)
+
+SNAPSHOT_VERSION = 1
+
+
+class ConfigSnapshot:
+    """
+    Speichert Türkonfiguration, Entities und pending_door_values als JSON.
+
+    Der Agent startet nach einem Stromausfall sofort mit diesem Stand,
+    auch wenn die API noch nicht erreichbar ist. Geschrieben wird atomar
+    (temporäre Datei + os.replace), damit ein Abbruch beim Schreiben nie
+    eine halbe Datei hinterlässt.
+
+    Attributes:
+        path: Pfad der Snapshot-Datei
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+
+    def load(self) -> Optional[dict]:
+        """
+        Liest den Snapshot.
+
+        Returns:
+            {"door_settings", "entities", "pending_door_values", "saved_at"}
+            oder None, wenn keine gültige Datei existiert
+        """
+        try:
+            with open(self.path, "r", encoding="utf-8") as file:
+                data = json.load(file)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as exc:
+            LOGGER.warning("Ignoring unreadable config snapshot %s: %s", self.path, exc)
+            return None
+
+        if not isinstance(data, dict) or data.get("version") != SNAPSHOT_VERSION:
+            LOGGER.warning("Ignoring config snapshot %s with unknown format", self.path)
+            return None
+
+        return {
+            "door_settings": data.get("door_settings") or {},
+            "entities": data.get("entities") or {},
+            "pending_door_values": data.get("pending_door_values") or {},
+            "saved_at": data.get("saved_at"),
+        }
+
+    def save(
+        self,
+        door_settings: Dict[str, dict],
+        entities: Dict[str, dict],
+        pending_door_values: Dict[str, float]
+    ) -> None:
+        """
+        Schreibt den Snapshot atomar (blockierend, im Thread-Pool aufrufen).
+
+        Args:
+            door_settings: {door_name: setting}
+            entities: {rfid_id: entity}
+            pending_door_values: Türwerte für unbekannte RFIDs
+        """
+        data = {
+            "version": SNAPSHOT_VERSION,
+            "saved_at": datetime.now(timezone.utc).isoformat(),
+            "door_settings": door_settings,
+            "entities": entities,
+            "pending_door_values": pending_door_values,
+        }
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_path, "w", encoding="utf-8") as file:
+            json.dump(data, file)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(tmp_path, self.path)
+
+    def __repr__(self):
+        return f"<ConfigSnapshot(path='{self.path}')>"
@@ -0,0 +1,113 @@
+"""
+Stations Module
+Mehrere RFID-Reader (Futterstellen) in einem Agent.
+"""
+import asyncio
+import logging
+from time import monotonic
+from typing import Callable, List, Optional
+
+from ..hardware import PresenceTracker, RFIDReader
+
+LOGGER = logging.getLogger(__name__)
+
+# Station für Installationen mit genau einem Reader
+DEFAULT_STATION = "default"
+
+ReadHandler = Callable[["Station", Optional[int]], None]
+
+
+class Station:
+    """
+    Eine Futterstelle: ein Reader mit eigener Anwesenheitserkennung.
+
+    Attributes:
+        name: Name der Station (entspricht DoorSetting.station)
+        reader: RFID-Reader der Station
+        presence: PresenceTracker der Station
+        next_poll: Nächster geplanter Poll (time.monotonic(), nur Polling-Modus)
+        last_read_started: Beginn des letzten Lesevorgangs (time.monotonic())
+        last_read_seconds: Dauer des letzten Lesevorgangs in Sekunden
+    """
+
+    def __init__(self, name: str, reader: RFIDReader, presence: PresenceTracker):
+        self.name = name
+        self.reader = reader
+        self.presence = presence
+        self.next_poll = 0.0
+        self.last_read_started = 0.0
+        self.last_read_seconds = 0.0
+
+    def __repr__(self):
+        return f"<Station(name='{self.name}', reader={self.reader!r})>"
+
+
+class StationPoller:
+    """
+    Liest alle Reader und meldet jedes Ergebnis an einen Handler.
+
+    Reader im Polling-Modus teilen sich einen Task, der immer die Station
+    mit der frühesten Fälligkeit abfragt (Earliest Deadline First). Jede
+    Station behält so ihr eigenes Poll-Intervall, solange die SPI-Zeit
+    aller Reader unter dem Intervall liegt; bei Überlast werden die
+    Stationen reihum bedient. Reader im IRQ-Modus warten jeweils in einem
+    eigenen Task auf ihre Flanke.
+    """
+
+    def __init__(self, stations: List[Station], handler: ReadHandler, poll_interval: float = 0.2):
+        """
+        Initialisiert den Poller.
+
+        Args:
+            stations: Zu lesende Stationen
+            handler: Wird je Lesevorgang mit (station, rfid_id oder None) aufgerufen
+            poll_interval: Poll-Intervall je Station in Sekunden
+        """
+        self.stations = stations
+        self.poll_interval = poll_interval
+        self._handler = handler
+
+    async def run(self) -> None:
+        """Liest alle Reader, bis der Task abgebrochen wird."""
+        polled = [station for station in self.stations if not station.reader.irq_enabled]
+        tasks = [
+            asyncio.create_task(self._watch_irq(station), name=f"rfid_irq_{station.name}")
+            for station in self.stations if station.reader.irq_enabled
+        ]
+        if polled:
+            tasks.append(asyncio.create_task(self._poll(polled), name="rfid_poll"))
+
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _poll(self, stations: List[Station]) -> None:
+        while True:
+            station = min(stations, key=lambda s: s.next_poll)
+            delay = station.next_poll - monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+            # SPI-Transaktion blockiert kurz, daher im Thread-Pool
+            started = monotonic()
+            rfid_id = await asyncio.to_thread(station.reader.read_once)
+            # Hinkt die Station hinterher, zählt das Intervall ab jetzt (kein Nachholen)
+            station.next_poll = max(station.next_poll, started) + self.poll_interval
+            station.last_read_started, station.last_read_seconds = started, monotonic() - started
+            self._dispatch(station, rfid_id)
+
+    async def _watch_irq(self, station: Station) -> None:
+        while True:
+            rfid_id = await asyncio.to_thread(station.reader.wait_for_tag, self.poll_interval)
+            # Im IRQ-Modus beginnt der Scan mit dem Ende des Wartens (Lesedauer nicht getrennt messbar)
+            station.last_read_started, station.last_read_seconds = monotonic(), 0.0
+            self._dispatch(station, rfid_id)
+
+    def _dispatch(self, station: Station, rfid_id: Optional[int]) -> None:
+        try:
+            self._handler(station, rfid_id)
+        except Exception as exc:
+            LOGGER.error("Error handling read of station %s: %s", station.name, exc)
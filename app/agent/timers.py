@@ -0,0 +1,82 @@
+"""
+Timer Module
+Monotone Deadline-Timer für den Pi-Agent.
+"""
+import heapq
+import itertools
+from time import monotonic
+from typing import Callable, List, Optional
+
+
+class Timer:
+    """
+    Handle eines geplanten Timers.
+
+    Attributes:
+        deadline: Fälligkeitszeitpunkt (time.monotonic())
+        callback: Wird bei Fälligkeit aufgerufen
+        cancelled: True nach cancel()
+    """
+
+    __slots__ = ("deadline", "callback", "cancelled")
+
+    def __init__(self, deadline: float, callback: Callable[[], None]):
+        self.deadline = deadline
+        self.callback = callback
+        self.cancelled = False
+
+    def cancel(self) -> None:
+        """Verhindert die Ausführung (Eintrag wird beim nächsten Pop verworfen)."""
+        self.cancelled = True
+
+    def __repr__(self):
+        return f"<Timer(deadline={self.deadline:.3f}, cancelled={self.cancelled})>"
+
+
+class TimerQueue:
+    """
+    Timer-Queue auf Basis eines Min-Heaps über monotone Deadlines.
+
+    Einfügen ist O(log n), Abbrechen O(1) (lazy), die nächste Deadline ist
+    O(1) verfügbar. Ein einzelner Treiber kann damit exakt bis zur nächsten
+    Fälligkeit schlafen, statt in festen Ticks zu pollen.
+    """
+
+    def __init__(self):
+        self._heap: List[tuple] = []
+        self._sequence = itertools.count()
+
+    def schedule(self, deadline: float, callback: Callable[[], None]) -> Timer:
+        """
+        Plant einen Callback zu einer monotonen Deadline ein.
+
+        Args:
+            deadline: Zeitpunkt auf der time.monotonic()-Skala
+            callback: Funktion ohne Argumente
+
+        Returns:
+            Timer-Handle zum Abbrechen
+        """
+        timer = Timer(deadline, callback)
+        # Sequenznummer hält die Reihenfolge bei gleicher Deadline stabil
+        heapq.heappush(self._heap, (deadline, next(self._sequence), timer))
+        return timer
+
+    def next_deadline(self) -> Optional[float]:
+        """Deadline des nächsten aktiven Timers oder None."""
+        while self._heap and self._heap[0][2].cancelled:
+            heapq.heappop(self._heap)
+        return self._heap[0][0] if self._heap else None
+
+    def pop_due(self, now: Optional[float] = None) -> List[Timer]:
+        """Entnimmt alle fälligen, nicht abgebrochenen Timer in Deadline-Reihenfolge."""
+        now = monotonic() if now is None else now
+        due = []
+        while self._heap and self._heap[0][0] <= now:
+            timer = heapq.heappop(self._heap)[2]
+            if not timer.cancelled:
+                due.append(timer)
+        return due
+
+    def __len__(self) -> int:
+        return sum(1 for _deadline, _seq, timer in self._heap if not timer.cancelled)
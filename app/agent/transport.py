@@ -0,0 +1,79 @@
+"""
+Transport Module
+Schnittstelle zwischen Pi-Agent und Fooder-Backend.
+"""
+from typing import AsyncIterator, Dict, List, Optional
+
+from .metrics import Metrics
+
+
+class Transport:
+    """
+    Basisklasse für den Zugriff des Agents auf das Backend.
+
+    ApiClient spricht die REST-API über HTTP an (Remote-Betrieb),
+    EmbeddedTransport ruft die Services direkt im selben Prozess auf.
+
+    Alle Methoden fangen Fehler ab und liefern None bzw. False, damit der
+    Aufrufer auf gecachte Daten zurückfallen kann.
+
+    Attributes:
+        metrics: Optionale Metrik-Registry (zählt api_errors_total je Operation)
+    """
+
+    def __init__(self, metrics: Optional[Metrics] = None):
+        self.metrics = metrics
+
+    async def fetch_door_settings(self) -> Optional[Dict[str, dict]]:
+        """Lädt Türkonfigurationen als {door_name: setting}; None bei Fehlern."""
+        raise NotImplementedError
+
+    async def fetch_entities(self) -> Optional[Dict[str, dict]]:
+        """Lädt alle Entities als {rfid_id: entity}; None bei Fehlern."""
+        raise NotImplementedError
+
+    async def fetch_pending_door_values(self) -> Optional[Dict[str, float]]:
+        """Lädt die Türwerte für unbekannte RFIDs; None bei Fehlern."""
+        raise NotImplementedError
+
+    async def resolve_scan(self, rfid_id: str, timeout: Optional[float] = None) -> Optional[dict]:
+        """
+        Löst einen Scan auf (Entity suchen, Log schreiben, unbekannte Tags registrieren).
+
+        Args:
+            rfid_id: Gescannte RFID-Tag-Nummer
+            timeout: Abweichender Timeout in Sekunden
+
+        Returns:
+            Scan-Ergebnis (wie AccessScanResult) oder None, wenn das Backend nicht erreichbar ist
+        """
+        raise NotImplementedError
+
+    async def send_scan_batch(self, scans: List[dict]) -> bool:
+        """
+        Überträgt gepufferte Scans ({"rfid_id", "timestamp"}).
+
+        Returns:
+            True bei Erfolg, False bei vorübergehenden Fehlern (erneut versuchen)
+
+        Raises:
+            ScanBatchRejected: Wenn das Backend die Scans als ungültig ablehnt
+        """
+        raise NotImplementedError
+
+    async def stream_events(self) -> AsyncIterator[dict]:
+        """
+        Liefert Änderungs-Events ({"event": ..., "data": {...}}).
+
+        Endet, sobald keine Events mehr geliefert werden können; der Agent
+        pollt dann wieder. Standard: kein Stream.
+        """
+        return
+        yield
+
+    async def aclose(self) -> None:
+        """Gibt Verbindungen und Ressourcen frei."""
+
+    def _count_error(self, operation: str) -> None:
+        if self.metrics is not None:
+            self.metrics.inc("api_errors_total", operation=operation)
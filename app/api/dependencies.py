@@ -2,9 +2,10 @@
 API Dependencies Module
 Enthält gemeinsame Abhängigkeiten für alle API-Endpunkte.
 """
-from typing import Generator
+from typing import AsyncGenerator, Generator
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from app.database import SessionLocal
+from app.database import AsyncSessionLocal, SessionLocal
 
 
 def get_db() -> Generator[Session, None, None]:
@@ -18,3 +19,12 @@ def get_db() -> Generator[Session, None, None]:
     finally:
         db.close()
 
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency für asynchronen Datenbankzugriff.
+    Erstellt eine neue AsyncSession für jeden Request und schließt sie danach.
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
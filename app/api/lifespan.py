@@ -0,0 +1,50 @@
+"""
+API Lifespan
+Startet und stoppt Hintergrund-Komponenten der API zusammen mit der App.
+"""
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.database import AsyncSessionLocal
+from app.services import AuditTrail, LogRetention, LogWriter, audit_trail, log_retention, log_writer
+
+
+def create_lifespan(
+    session_factory: async_sessionmaker = AsyncSessionLocal,
+    writer: LogWriter = log_writer,
+    retention: LogRetention = log_retention,
+    audit: AuditTrail = audit_trail
+):
+    """
+    Erstellt den Lifespan-Handler für FastAPI(lifespan=...).
+
+    Beim Herunterfahren werden alle eingereihten Logs und Audit-Events
+    geschrieben, bevor die App endet.
+
+    Args:
+        session_factory: Sessions der Hintergrund-Tasks (default: AsyncSessionLocal)
+        writer: Zu startender LogWriter
+        retention: Periodische Verdichtung alter Logs
+        audit: Gepufferter Audit-Trail der Verwaltungs-API
+
+    Returns:
+        Lifespan-Contextmanager
+    """
+    @asynccontextmanager
+    async def lifespan(_app: FastAPI):
+        await writer.start(session_factory)
+        await retention.start(session_factory)
+        await audit.start(session_factory)
+        try:
+            yield
+        finally:
+            await audit.stop()
+            await retention.stop()
+            await writer.stop()
+
+    return lifespan
+
+
+lifespan = create_lifespan()
@@ -0,0 +1,124 @@
+"""
+API Snapshots
+Vorserialisierte JSON-Antworten je Ressourcen-Version mit ETag/304.
+"""
+import asyncio
+import secrets
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict
+
+from fastapi import Request, Response, status
+from pydantic import TypeAdapter
+
+from app.services import ChangeFeed, change_feed
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    """Serialisierte Antwort einer Ressource in einer bestimmten Version."""
+    version: int
+    etag: str
+    body: bytes
+
+
+class SnapshotCache:
+    """
+    Hält je Ressource die JSON-Bytes ihrer aktuellen Version.
+
+    Die Versionen kommen aus dem ChangeFeed, den jeder Schreibvorgang der
+    Services nach dem Commit erhöht. Eine Version wird daher genau einmal
+    abgefragt und serialisiert; bis zur nächsten Änderung werden die
+    fertigen Bytes ausgeliefert. Der ETag enthält eine Kennung des
+    Prozesses, weil die Versionen nach einem Neustart wieder bei 0 beginnen.
+    """
+
+    def __init__(self, feed: ChangeFeed = change_feed):
+        self._feed = feed
+        self._epoch = secrets.token_hex(4)
+        self._snapshots: Dict[str, Snapshot] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+
+    def etag(self, resource: str) -> str:
+        """Starker ETag der aktuellen Version (ohne Datenbankzugriff)."""
+        return self._etag(resource, self._feed.resource_version(resource))
+
+    def _etag(self, resource: str, version: int) -> str:
+        return f'"{self._epoch}-{resource}-{version}"'
+
+    async def get(self, resource: str, load: Callable[[], Awaitable[Any]], adapter: TypeAdapter) -> Snapshot:
+        """
+        Gibt den Snapshot der aktuellen Version zurück und baut ihn bei Bedarf.
+
+        Args:
+            resource: Ressource im ChangeFeed ('entities', 'settings', 'system_settings')
+            load: Lädt die Daten (ORM-Objekte) aus der Datenbank
+            adapter: TypeAdapter des Antwort-Schemas
+
+        Returns:
+            Snapshot mit Version, ETag und JSON-Bytes
+        """
+        version = self._feed.resource_version(resource)
+        snapshot = self._snapshots.get(resource)
+        if snapshot is not None and snapshot.version == version:
+            return snapshot
+
+        # Gleichzeitige Requests derselben Version serialisieren nur einmal
+        async with self._locks.setdefault(resource, asyncio.Lock()):
+            version = self._feed.resource_version(resource)
+            snapshot = self._snapshots.get(resource)
+            if snapshot is not None and snapshot.version == version:
+                return snapshot
+
+            data = adapter.validate_python(await load(), from_attributes=True)
+            snapshot = Snapshot(version, self._etag(resource, version), adapter.dump_json(data))
+            # Änderung während des Ladens: Bytes ausliefern, aber nicht behalten
+            if self._feed.resource_version(resource) == version:
+                self._snapshots[resource] = snapshot
+            return snapshot
+
+    def clear(self) -> None:
+        """Verwirft alle Snapshots."""
+        self._snapshots.clear()
+
+
+snapshot_cache = SnapshotCache()
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    if if_none_match.strip() == "*":
+        return True
+    # If-None-Match vergleicht schwach: W/"x" passt zu "x"
+    return any(candidate.strip().removeprefix("W/") == etag for candidate in if_none_match.split(","))
+
+
+async def snapshot_response(
+    request: Request,
+    resource: str,
+    load: Callable[[], Awaitable[Any]],
+    adapter: TypeAdapter
+) -> Response:
+    """
+    Beantwortet einen GET aus dem Snapshot der Ressource.
+
+    Passt If-None-Match zur aktuellen Version, folgt 304 ohne
+    Datenbankzugriff; sonst die vorserialisierten Bytes mit ETag.
+
+    Args:
+        request: Eingehender Request (für If-None-Match)
+        resource: Ressource im ChangeFeed
+        load: Lädt die Daten, falls die Version noch nicht serialisiert ist
+        adapter: TypeAdapter des Antwort-Schemas
+
+    Returns:
+        200 mit JSON oder 304
+    """
+    # Clients sollen jedes Mal nachfragen; der 304 ist billig
+    headers = {"Cache-Control": "no-cache"}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        etag = snapshot_cache.etag(resource)
+        if _etag_matches(if_none_match, etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={**headers, "ETag": etag})
+
+    snapshot = await snapshot_cache.get(resource, load, adapter)
+    return Response(snapshot.body, media_type="application/json", headers={**headers, "ETag": snapshot.etag})
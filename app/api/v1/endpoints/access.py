@@ -0,0 +1,48 @@
+"""
+Access API Endpoints
+REST-Endpunkte für die Scan-Auflösung des Pi-Agents.
+"""
+from fastapi import APIRouter, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.dependencies import get_async_db
+from app.schemas.access_scan import AccessScanRequest, AccessScanResult, AccessScanBatch, AccessScanBatchResult
+from app.services import AsyncAccessService
+
+router = APIRouter()
+access_service = AsyncAccessService()
+
+
+@router.post("/scan", response_model=AccessScanResult, summary="RFID-Scan auflösen")
+async def scan(scan_request: AccessScanRequest, db: AsyncSession = Depends(get_async_db)):
+    """
+    Löst einen RFID-Scan in einem einzigen Request auf.
+
+    Sucht die Entity, schreibt den Access-Log, registriert unbekannte Tags
+    als PendingRFID und gibt die effektiven Türwerte zurück
+    (Entity-Werte oder pending_door_values).
+
+    Args:
+        scan_request: Gescannte RFID-Nummer (optional mit Zeitstempel)
+
+    Returns:
+        Scan-Ergebnis inkl. door_values
+    """
+    return await access_service.scan(db, scan_request.rfid_id, scan_request.timestamp)
+
+
+@router.post("/scan/batch", response_model=AccessScanBatchResult, summary="Mehrere Scans nachreichen")
+async def scan_batch(batch: AccessScanBatch, db: AsyncSession = Depends(get_async_db)):
+    """
+    Verarbeitet mehrere Scans in einer Transaktion.
+
+    Wird von der Outbox des Pi-Agents genutzt, um lokal gepufferte Scans
+    mit ihrem ursprünglichen Zeitstempel nachzureichen.
+
+    Args:
+        batch: Liste der Scans (max. 1000)
+
+    Returns:
+        Anzahl verarbeiteter, erkannter und unbekannter Scans
+    """
+    return await access_service.scan_batch(db, batch.scans)
@@ -0,0 +1,32 @@
+"""
+Audit API Endpoints
+REST-Endpunkte für den Audit-Trail der Verwaltungs-API.
+"""
+from typing import List, Optional
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.dependencies import get_async_db
+from app.schemas.audit_event import AuditEvent
+from app.services import audit_trail
+
+router = APIRouter()
+
+
+@router.get("", response_model=List[AuditEvent], summary="Audit-Events abrufen")
+async def get_audit_events(
+    limit: int = Query(100, ge=1, le=1000, description="Maximale Anzahl Einträge"),
+    resource: Optional[str] = Query(None, description="Filter nach Ressource (z.B. entity)"),
+    resource_id: Optional[int] = Query(None, description="Filter nach Ressourcen-ID"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Gibt die neuesten Admin-Zugriffe zurück (neueste zuerst).
+
+    Events werden gepuffert geschrieben und erscheinen daher mit bis zu
+    flush_interval_ms Verzögerung.
+
+    Returns:
+        Liste von Audit-Events
+    """
+    return await audit_trail.get_recent(db, limit, resource, resource_id)
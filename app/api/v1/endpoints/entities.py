@@ -3,32 +3,47 @@ Entities API Endpoints
 REST-Endpunkte für Entity-Verwaltung.
 """
 from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from pydantic import TypeAdapter
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.dependencies import get_db
-from app.schemas.entity import Entity, EntityCreate
-from app.schemas.access_log import AccessLogCreate
-from app.services import EntityService, LogService
+from app.api.dependencies import get_async_db
+from app.api.snapshots import snapshot_response
+from app.schemas.entity import Entity, EntityCacheStats, EntityCreate
+from app.services import AsyncEntityService, audit_trail, entity_cache
 
 router = APIRouter()
-entity_service = EntityService()
-log_service = LogService()
+entity_service = AsyncEntityService()
+entity_list = TypeAdapter(List[Entity])
 
 
 @router.get("", response_model=List[Entity], summary="Alle Entities abrufen")
-def get_entities(db: Session = Depends(get_db)):
+async def get_entities(request: Request, db: AsyncSession = Depends(get_async_db)):
     """
     Gibt alle registrierten Entities zurück.
 
+    Die Liste wird einmal pro Änderung serialisiert; mit If-None-Match
+    und unverändertem ETag folgt 304 ohne Datenbankzugriff.
+
     Returns:
         Liste aller Entities
     """
-    return entity_service.get_all(db)
+    return await snapshot_response(request, "entities", lambda: entity_service.get_all(db), entity_list)
+
+
+@router.get("/cache/stats", response_model=EntityCacheStats, summary="Zähler des Entity-Caches")
+async def get_cache_stats():
+    """
+    Gibt Trefferquote und Füllstand des Entity-Caches zurück (Monitoring).
+
+    Returns:
+        Cache-Zähler seit dem Start
+    """
+    return entity_cache.stats()
 
 
 @router.get("/{entity_id}", response_model=Entity, summary="Entity anhand ID abrufen")
-def get_entity(entity_id: int, db: Session = Depends(get_db)):
+async def get_entity(entity_id: int, db: AsyncSession = Depends(get_async_db)):
     """
     Gibt eine einzelne Entity anhand der ID zurück.
 
@@ -41,21 +56,20 @@ def get_entity(entity_id: int, db: Session = Depends(get_db)):
     Raises:
         404: Entity nicht gefunden
     """
-    entity = entity_service.get_by_id(db, entity_id)
+    entity = await entity_service.get_by_id(db, entity_id)
     if not entity:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Entity mit ID {entity_id} nicht gefunden"
         )
 
-    # Logge den Zugriff
-    log_service.log_access(db, entity_id, "read")
+    audit_trail.record("entity", "read", entity_id)
 
     return entity
 
 
 @router.post("", response_model=Entity, status_code=status.HTTP_201_CREATED, summary="Neue Entity erstellen")
-def create_entity(entity: EntityCreate, db: Session = Depends(get_db)):
+async def create_entity(entity: EntityCreate, db: AsyncSession = Depends(get_async_db)):
     """
     Erstellt eine neue Entity.
 
@@ -69,16 +83,20 @@ def create_entity(entity: EntityCreate, db: Session = Depends(get_db)):
         400: RFID-ID existiert bereits
     """
     try:
-        return entity_service.create(db, entity)
+        created_entity = await entity_service.create(db, entity)
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
 
+    audit_trail.record("entity", "create", created_entity.id)
+
+    return created_entity
+
 
 @router.put("/{entity_id}", response_model=Entity, summary="Entity aktualisieren")
-def update_entity(entity_id: int, entity: EntityCreate, db: Session = Depends(get_db)):
+async def update_entity(entity_id: int, entity: EntityCreate, db: AsyncSession = Depends(get_async_db)):
     """
     Aktualisiert eine existierende Entity.
 
@@ -94,15 +112,14 @@ def update_entity(entity_id: int, entity: EntityCreate, db: Session = Depends(ge
         400: Validierungsfehler
     """
     try:
-        updated_entity = entity_service.update(db, entity_id, entity)
+        updated_entity = await entity_service.update(db, entity_id, entity)
         if not updated_entity:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Entity mit ID {entity_id} nicht gefunden"
             )
 
-        # Logge die Aktualisierung
-        log_service.log_access(db, entity_id, "update")
+        audit_trail.record("entity", "update", entity_id)
 
         return updated_entity
     except ValueError as e:
@@ -113,7 +130,7 @@ def update_entity(entity_id: int, entity: EntityCreate, db: Session = Depends(ge
 
 
 @router.delete("/{entity_id}", summary="Entity löschen")
-def delete_entity(entity_id: int, db: Session = Depends(get_db)):
+async def delete_entity(entity_id: int, db: AsyncSession = Depends(get_async_db)):
     """
     Löscht eine Entity.
 
@@ -126,15 +143,14 @@ def delete_entity(entity_id: int, db: Session = Depends(get_db)):
     Raises:
         404: Entity nicht gefunden
     """
-    entity = entity_service.delete(db, entity_id)
+    entity = await entity_service.delete(db, entity_id)
     if not entity:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Entity mit ID {entity_id} nicht gefunden"
         )
 
-    # Logge die Löschung
-    log_service.log_access(db, entity_id, "delete")
+    audit_trail.record("entity", "delete", entity_id)
 
     return {"detail": f"Entity {entity_id} erfolgreich gelöscht"}
 
@@ -0,0 +1,65 @@
+"""
+Events API Endpoints
+Server-Sent-Events-Stream für Konfigurationsänderungen.
+"""
+import json
+
+from fastapi import APIRouter, Request
+from fastapi.responses import StreamingResponse
+
+from app.services import change_feed
+
+router = APIRouter()
+
+# Kommentarzeile in diesem Abstand, damit Proxies/Clients die Verbindung offen halten
+KEEPALIVE_INTERVAL = 15.0
+
+
+def _format_event(event: str, data: dict, event_id: int) -> str:
+    return f"id: {event_id}\nevent: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+def _hello_event() -> str:
+    versions = change_feed.resource_versions()
+    version = change_feed.version
+    return _format_event("hello", {"version": version, "resources": versions}, version)
+
+
+@router.get("", summary="Änderungs-Stream (Server-Sent Events)")
+async def stream_events(request: Request):
+    """
+    Liefert Änderungen an Settings, Entities und System-Settings als
+    Server-Sent Events.
+
+    Nach dem Verbindungsaufbau (und nach einem Überlauf beim Client) wird ein
+    'hello'-Event mit den aktuellen Versionen gesendet; der Client sollte dann
+    vollständig neu laden. Danach folgt pro Commit ein 'change'-Event mit
+    monoton steigender Versionsnummer und der geänderten Ressource.
+
+    Returns:
+        text/event-stream
+    """
+    subscription = change_feed.subscribe()
+
+    async def event_stream():
+        try:
+            yield _hello_event()
+            while not await request.is_disconnected():
+                event = await subscription.get(timeout=KEEPALIVE_INTERVAL)
+                if subscription.overflowed:
+                    while not subscription.queue.empty():
+                        subscription.queue.get_nowait()
+                    subscription.overflowed = False
+                    yield _hello_event()
+                elif event is None:
+                    yield ": keepalive\n\n"
+                else:
+                    yield _format_event("change", event, event["version"])
+        finally:
+            subscription.close()
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"}
+    )
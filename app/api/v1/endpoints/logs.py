@@ -3,46 +3,247 @@ Logs API Endpoints
 REST-Endpunkte für AccessLog-Verwaltung.
 """
 from typing import List, Optional
-from datetime import datetime
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
+from datetime import date, datetime, timedelta, timezone
+from fastapi import APIRouter, Depends, HTTPException, Response, status, Query
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.dependencies import get_db
-from app.schemas.access_log import AccessLog, AccessLogCreate
-from app.services import LogService
+from app.api.dependencies import get_async_db
+from app.schemas.access_log import (
+    AccessLog, AccessLogCreate, AccessLogBatch, AccessLogBatchResult, AccessLogDailyCount, AccessLogPage,
+    AccessLogQueued, LogRetentionStatus, LogStatsBucket, UnknownTagCount
+)
+from app.services import AsyncLogService, log_retention
 
 router = APIRouter()
-log_service = LogService()
+log_service = AsyncLogService()
 
 
-@router.get("", response_model=List[AccessLog], summary="Alle Logs abrufen")
-def get_logs(
-    limit: int = Query(100, ge=1, le=1000, description="Maximale Anzahl Einträge"),
+@router.get("", response_model=AccessLogPage, summary="Logs seitenweise abrufen")
+async def get_logs(
+    limit: int = Query(100, ge=1, le=1000, description="Maximale Anzahl Einträge pro Seite"),
+    cursor: Optional[str] = Query(None, description="next_cursor der vorigen Seite"),
     entity_id: Optional[int] = Query(None, description="Filter nach Entity-ID"),
     action: Optional[str] = Query(None, description="Filter nach Aktion"),
-    db: Session = Depends(get_db)
+    rfid_id: Optional[str] = Query(None, description="Filter nach RFID"),
+    since: Optional[datetime] = Query(None, description="Nur Logs ab diesem Zeitpunkt (inklusive)"),
+    until: Optional[datetime] = Query(None, description="Nur Logs vor diesem Zeitpunkt (exklusive)"),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
-    Gibt Zugriffslogs zurück (neueste zuerst).
+    Gibt Zugriffslogs seitenweise zurück (neueste zuerst).
+
+    Alle Filter sind kombinierbar. Für die nächste Seite wird next_cursor
+    mit denselben Filtern als cursor übergeben; die Seiten sind stabil,
+    auch wenn währenddessen neue Logs geschrieben werden.
 
     Args:
-        limit: Maximale Anzahl Einträge (default: 100, max: 1000)
+        limit: Maximale Anzahl Einträge pro Seite (default: 100, max: 1000)
+        cursor: Optional - next_cursor der vorigen Seite
         entity_id: Optional - Filter nach Entity-ID
         action: Optional - Filter nach Aktion (z.B. 'granted', 'unknown')
+        rfid_id: Optional - Filter nach RFID
+        since: Optional - Beginn des Zeitraums
+        until: Optional - Ende des Zeitraums
+
+    Returns:
+        Seite mit Logs und next_cursor (null auf der letzten Seite)
+
+    Raises:
+        400: Ungültiger Cursor oder since nach until
+    """
+    try:
+        items, next_cursor = await log_service.get_page(db, limit, cursor, entity_id, action, rfid_id, since, until)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    return AccessLogPage(items=items, next_cursor=next_cursor)
+
+
+@router.post(
+    "/batch",
+    response_model=AccessLogBatchResult,
+    status_code=status.HTTP_201_CREATED,
+    responses={status.HTTP_202_ACCEPTED: {"model": AccessLogBatchResult, "description": "Eingereiht (durability 'enqueue')"}},
+    summary="Mehrere Logs erstellen"
+)
+async def create_logs_batch(batch: AccessLogBatch, response: Response, db: AsyncSession = Depends(get_async_db)):
+    """
+    Erstellt mehrere Log-Einträge in einer Transaktion.
+
+    Die Einträge werden mit einem einzigen executemany-INSERT geschrieben
+    und nicht zurückgelesen; die Antwort enthält nur die Anzahl.
+
+    Args:
+        batch: Log-Daten (max. 5000, optional mit Client-Zeitstempel)
+
+    Returns:
+        Anzahl geschriebener Einträge (202, wenn nur eingereiht)
+    """
+    inserted = await log_service.create_batch(db, batch.logs)
+    if log_service.acknowledges_on_enqueue:
+        response.status_code = status.HTTP_202_ACCEPTED
+    return AccessLogBatchResult(inserted=inserted)
+
+
+# Content-Type je Exportformat
+EXPORT_MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv; charset=utf-8"}
+
+
+@router.get("/export", summary="Logs exportieren (NDJSON/CSV)")
+async def export_logs(
+    export_format: str = Query("ndjson", alias="format", description="ndjson oder csv"),
+    since: Optional[datetime] = Query(None, description="Nur Logs ab diesem Zeitpunkt (inklusive)"),
+    until: Optional[datetime] = Query(None, description="Nur Logs vor diesem Zeitpunkt (exklusive)"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Streamt alle Logs im Zeitraum chronologisch als NDJSON oder CSV.
+
+    Die Zeilen werden blockweise aus einem serverseitigen Cursor
+    geschrieben; der Speicherbedarf bleibt auch bei Millionen Logs
+    konstant und die Antwort beginnt sofort.
+
+    Returns:
+        application/x-ndjson bzw. text/csv (Spalten id, timestamp, entity_id, action, rfid_id)
+
+    Raises:
+        400: Unbekanntes Format oder since liegt nach until
+    """
+    try:
+        chunks = log_service.export(db, export_format, since, until)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+    async def stream():
+        # Die Dependency schließt die Session schon vor dem Senden; die beim
+        # Streamen neu belegte Verbindung muss hier zurückgegeben werden
+        try:
+            async for chunk in chunks:
+                yield chunk
+        finally:
+            await chunks.aclose()
+            await db.close()
+
+    return StreamingResponse(
+        stream(),
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="access_logs.{export_format}"'}
+    )
+
+
+@router.get("/stats", response_model=List[LogStatsBucket], summary="Log-Statistik je Zeit-Bucket")
+async def get_stats(
+    group_by: str = Query("entity", description="Gruppierung: entity, action oder door"),
+    bucket: str = Query("day", description="Bucket-Größe: hour, day oder week (ab Montag)"),
+    since: Optional[datetime] = Query(None, description="Beginn (default: until - 7 Tage)"),
+    until: Optional[datetime] = Query(None, description="Ende, exklusive (default: jetzt)"),
+    entity_id: Optional[int] = Query(None, description="Filter nach Entity-ID"),
+    action: Optional[str] = Query(None, description="Filter nach Aktion"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Zählt Logs je Zeit-Bucket und Entity, Aktion oder Tür.
+
+    Die Werte kommen aus Zählern, die mit jedem Log in derselben
+    Transaktion erhöht werden; die Abfrage liest keine Roh-Logs.
+    Bei group_by=door wird gezählt, wie oft jede Tür geöffnet wurde.
+
+    Returns:
+        Zähler je Bucket (nach Bucket sortiert)
+
+    Raises:
+        400: Unbekanntes group_by/bucket oder since liegt nicht vor until
+    """
+    until = until or datetime.now(timezone.utc)
+    since = since or until - timedelta(days=7)
+    try:
+        return await log_service.get_stats(db, since, until, group_by, bucket, entity_id, action)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+
+@router.get("/stats/unknown-tags", response_model=List[UnknownTagCount], summary="Häufigste unbekannte Tags")
+async def get_unknown_tags(
+    since: Optional[date] = Query(None, description="Erster Tag (UTC, default: until - 30 Tage)"),
+    until: Optional[date] = Query(None, description="Letzter Tag (UTC, inklusive, default: heute)"),
+    limit: int = Query(20, ge=1, le=1000, description="Maximale Anzahl Tags"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Gibt die am häufigsten gescannten unbekannten RFID-Tags zurück.
+
+    Returns:
+        Tags mit Anzahl und letztem Tag (häufigste zuerst)
+
+    Raises:
+        400: since liegt nach until
+    """
+    until = until or datetime.now(timezone.utc).date()
+    since = since or until - timedelta(days=30)
+    try:
+        return await log_service.get_top_unknown(db, since, until, limit)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+
+@router.get("/stats/daily", response_model=List[AccessLogDailyCount], summary="Logs pro Tag zählen")
+async def get_daily_stats(
+    since: Optional[date] = Query(None, description="Erster Tag (UTC, default: until - 30 Tage)"),
+    until: Optional[date] = Query(None, description="Letzter Tag (UTC, inklusive, default: heute)"),
+    entity_id: Optional[int] = Query(None, description="Filter nach Entity-ID"),
+    rfid_id: Optional[str] = Query(None, description="Filter nach RFID"),
+    action: Optional[str] = Query(None, description="Filter nach Aktion"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Zählt Logs je Tag, Entity, RFID und Aktion.
+
+    Tage vor dem Aufbewahrungs-Stichtag kommen aus den Tageszählern,
+    jüngere aus den Roh-Logs.
 
     Returns:
-        Liste von AccessLog-Einträgen
+        Tageszähler (nach Tag sortiert)
+
+    Raises:
+        400: since liegt nach until
     """
-    if entity_id is not None:
-        return log_service.get_by_entity(db, entity_id, limit)
-    elif action is not None:
-        return log_service.get_by_action(db, action, limit)
-    else:
-        return log_service.get_all(db, limit)
+    until = until or datetime.now(timezone.utc).date()
+    since = since or until - timedelta(days=30)
+    try:
+        return await log_service.get_daily_stats(db, since, until, entity_id, rfid_id, action)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+
+@router.get("/retention", response_model=LogRetentionStatus, summary="Zustand der Log-Aufbewahrung")
+async def get_retention_status(db: AsyncSession = Depends(get_async_db)):
+    """
+    Gibt Stichtag, ältesten Roh-Log und Ergebnis der Aufräumläufe zurück.
+
+    Returns:
+        Zustand der Aufbewahrung
+    """
+    return await log_retention.status(db)
 
 
 @router.get("/{log_id}", response_model=AccessLog, summary="Log anhand ID abrufen")
-def get_log(log_id: int, db: Session = Depends(get_db)):
+async def get_log(log_id: int, db: AsyncSession = Depends(get_async_db)):
     """
     Gibt einen einzelnen Log-Eintrag anhand der ID zurück.
 
@@ -55,7 +256,7 @@ def get_log(log_id: int, db: Session = Depends(get_db)):
     Raises:
         404: Log nicht gefunden
     """
-    log = log_service.get_by_id(db, log_id)
+    log = await log_service.get_by_id(db, log_id)
     if not log:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -65,8 +266,14 @@ def get_log(log_id: int, db: Session = Depends(get_db)):
     return log
 
 
-@router.post("", response_model=AccessLog, status_code=status.HTTP_201_CREATED, summary="Neuen Log erstellen")
-def create_log(log: AccessLogCreate, db: Session = Depends(get_db)):
+@router.post(
+    "",
+    response_model=AccessLog,
+    status_code=status.HTTP_201_CREATED,
+    responses={status.HTTP_202_ACCEPTED: {"model": AccessLogQueued, "description": "Eingereiht (durability 'enqueue')"}},
+    summary="Neuen Log erstellen"
+)
+async def create_log(log: AccessLogCreate, db: AsyncSession = Depends(get_async_db)):
     """
     Erstellt einen neuen Log-Eintrag.
 
@@ -74,7 +281,13 @@ def create_log(log: AccessLogCreate, db: Session = Depends(get_db)):
         log: Log-Daten (entity_id kann null sein für unbekannte RFIDs)
 
     Returns:
-        Erstellter Log-Eintrag
+        Erstellter Log-Eintrag; bei durability 'enqueue' 202 ohne ID
     """
-    return log_service.create(db, log)
+    created = await log_service.create(db, log)
+    if created.id is None:
+        return JSONResponse(
+            status_code=status.HTTP_202_ACCEPTED,
+            content=jsonable_encoder(AccessLogQueued.model_validate(created))
+        )
+    return created
 
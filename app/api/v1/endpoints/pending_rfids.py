@@ -4,21 +4,21 @@ REST-Endpunkte für PendingRFID-Verwaltung (unbekannte RFID-Tags).
 """
 from typing import List
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.dependencies import get_db
+from app.api.dependencies import get_async_db
 from app.schemas.pending_rfid import PendingRFID, PendingRFIDCreate
 from app.schemas.entity import Entity, EntityCreate
-from app.services import PendingRFIDService
+from app.services import AsyncPendingRFIDService
 
 router = APIRouter()
-pending_service = PendingRFIDService()
+pending_service = AsyncPendingRFIDService()
 
 
 @router.get("", response_model=List[PendingRFID], summary="Alle unbekannten RFIDs abrufen")
-def get_pending_rfids(
+async def get_pending_rfids(
     limit: int = 50,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Gibt alle unbekannten/nicht-registrierten RFID-Tags zurück.
@@ -31,11 +31,11 @@ def get_pending_rfids(
     Returns:
         Liste aller PendingRFID-Einträge (neueste zuerst)
     """
-    return pending_service.get_all(db, limit)
+    return await pending_service.get_all(db, limit)
 
 
 @router.get("/{pending_id}", response_model=PendingRFID, summary="PendingRFID anhand ID abrufen")
-def get_pending_rfid(pending_id: int, db: Session = Depends(get_db)):
+async def get_pending_rfid(pending_id: int, db: AsyncSession = Depends(get_async_db)):
     """
     Gibt einen einzelnen PendingRFID anhand der ID zurück.
 
@@ -48,7 +48,7 @@ def get_pending_rfid(pending_id: int, db: Session = Depends(get_db)):
     Raises:
         404: PendingRFID nicht gefunden
     """
-    pending = pending_service.get_by_id(db, pending_id)
+    pending = await pending_service.get_by_id(db, pending_id)
     if not pending:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -59,7 +59,7 @@ def get_pending_rfid(pending_id: int, db: Session = Depends(get_db)):
 
 
 @router.post("", response_model=PendingRFID, status_code=status.HTTP_201_CREATED, summary="RFID manuell als 'pending' markieren")
-def create_pending_rfid(pending: PendingRFIDCreate, db: Session = Depends(get_db)):
+async def create_pending_rfid(pending: PendingRFIDCreate, db: AsyncSession = Depends(get_async_db)):
     """
     Markiert einen RFID-Tag manuell als "pending" (unbekannt).
 
@@ -71,14 +71,14 @@ def create_pending_rfid(pending: PendingRFIDCreate, db: Session = Depends(get_db
     Returns:
         Erstellter PendingRFID
     """
-    return pending_service.register_unknown_rfid(db, pending.rfid_id)
+    return await pending_service.register_unknown_rfid(db, pending.rfid_id)
 
 
 @router.post("/{pending_id}/convert", response_model=Entity, summary="PendingRFID zu Entity konvertieren")
-def convert_pending_to_entity(
+async def convert_pending_to_entity(
     pending_id: int,
     entity: EntityCreate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Konvertiert einen PendingRFID zu einer vollständigen Entity.
@@ -98,7 +98,7 @@ def convert_pending_to_entity(
         400: RFID-ID Mismatch oder bereits registriert
     """
     try:
-        converted = pending_service.convert_to_entity(db, pending_id, entity)
+        converted = await pending_service.convert_to_entity(db, pending_id, entity)
         if not converted:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -115,7 +115,7 @@ def convert_pending_to_entity(
 
 
 @router.delete("/{pending_id}", summary="PendingRFID löschen")
-def delete_pending_rfid(pending_id: int, db: Session = Depends(get_db)):
+async def delete_pending_rfid(pending_id: int, db: AsyncSession = Depends(get_async_db)):
     """
     Löscht einen PendingRFID ohne zu konvertieren.
 
@@ -130,7 +130,7 @@ def delete_pending_rfid(pending_id: int, db: Session = Depends(get_db)):
     Raises:
         404: PendingRFID nicht gefunden
     """
-    pending = pending_service.delete(db, pending_id)
+    pending = await pending_service.delete(db, pending_id)
     if not pending:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
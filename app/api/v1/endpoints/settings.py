@@ -3,30 +3,36 @@ Settings API Endpoints
 REST-Endpunkte für DoorSetting-Verwaltung.
 """
 from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from pydantic import TypeAdapter
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.dependencies import get_db
+from app.api.dependencies import get_async_db
+from app.api.snapshots import snapshot_response
 from app.schemas.door_setting import DoorSetting, DoorSettingCreate
-from app.services import SettingService
+from app.services import AsyncSettingService
 
 router = APIRouter()
-setting_service = SettingService()
+setting_service = AsyncSettingService()
+setting_list = TypeAdapter(List[DoorSetting])
 
 
 @router.get("", response_model=List[DoorSetting], summary="Alle Settings abrufen")
-def get_settings(db: Session = Depends(get_db)):
+async def get_settings(request: Request, db: AsyncSession = Depends(get_async_db)):
     """
     Gibt alle Tür-Settings zurück.
 
+    Die Liste wird einmal pro Änderung serialisiert; mit If-None-Match
+    und unverändertem ETag folgt 304 ohne Datenbankzugriff.
+
     Returns:
         Liste aller DoorSettings
     """
-    return setting_service.get_all(db)
+    return await snapshot_response(request, "settings", lambda: setting_service.get_all(db), setting_list)
 
 
 @router.get("/{setting_id}", response_model=DoorSetting, summary="Setting anhand ID abrufen")
-def get_setting(setting_id: int, db: Session = Depends(get_db)):
+async def get_setting(setting_id: int, db: AsyncSession = Depends(get_async_db)):
     """
     Gibt ein einzelnes Setting anhand der ID zurück.
 
@@ -39,7 +45,7 @@ def get_setting(setting_id: int, db: Session = Depends(get_db)):
     Raises:
         404: Setting nicht gefunden
     """
-    setting = setting_service.get_by_id(db, setting_id)
+    setting = await setting_service.get_by_id(db, setting_id)
     if not setting:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -50,7 +56,7 @@ def get_setting(setting_id: int, db: Session = Depends(get_db)):
 
 
 @router.post("", response_model=DoorSetting, status_code=status.HTTP_201_CREATED, summary="Neues Setting erstellen")
-def create_setting(setting: DoorSettingCreate, db: Session = Depends(get_db)):
+async def create_setting(setting: DoorSettingCreate, db: AsyncSession = Depends(get_async_db)):
     """
     Erstellt ein neues Tür-Setting.
 
@@ -64,7 +70,7 @@ def create_setting(setting: DoorSettingCreate, db: Session = Depends(get_db)):
         400: Tür-Name existiert bereits oder Validierungsfehler
     """
     try:
-        return setting_service.create(db, setting)
+        return await setting_service.create(db, setting)
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -73,7 +79,7 @@ def create_setting(setting: DoorSettingCreate, db: Session = Depends(get_db)):
 
 
 @router.put("/{setting_id}", response_model=DoorSetting, summary="Setting aktualisieren")
-def update_setting(setting_id: int, setting: DoorSettingCreate, db: Session = Depends(get_db)):
+async def update_setting(setting_id: int, setting: DoorSettingCreate, db: AsyncSession = Depends(get_async_db)):
     """
     Aktualisiert ein existierendes Setting.
 
@@ -89,7 +95,7 @@ def update_setting(setting_id: int, setting: DoorSettingCreate, db: Session = De
         400: Validierungsfehler
     """
     try:
-        updated_setting = setting_service.update(db, setting_id, setting)
+        updated_setting = await setting_service.update(db, setting_id, setting)
         if not updated_setting:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -105,7 +111,7 @@ def update_setting(setting_id: int, setting: DoorSettingCreate, db: Session = De
 
 
 @router.delete("/{setting_id}", summary="Setting löschen")
-def delete_setting(setting_id: int, db: Session = Depends(get_db)):
+async def delete_setting(setting_id: int, db: AsyncSession = Depends(get_async_db)):
     """
     Löscht ein Setting.
 
@@ -118,7 +124,7 @@ def delete_setting(setting_id: int, db: Session = Depends(get_db)):
     Raises:
         404: Setting nicht gefunden
     """
-    setting = setting_service.delete(db, setting_id)
+    setting = await setting_service.delete(db, setting_id)
     if not setting:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
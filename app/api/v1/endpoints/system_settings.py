@@ -2,35 +2,42 @@
 System Settings API Endpoints
 REST-Endpunkte für globale System-Einstellungen.
 """
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from pydantic import TypeAdapter
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.dependencies import get_db
+from app.api.dependencies import get_async_db
+from app.api.snapshots import snapshot_response
 from app.schemas.system_settings import SystemSettings, SystemSettingsUpdate
-from app.services import SystemSettingsService
+from app.services import AsyncSystemSettingsService
 
 router = APIRouter()
-settings_service = SystemSettingsService()
+settings_service = AsyncSystemSettingsService()
+system_settings_adapter = TypeAdapter(SystemSettings)
 
 
 @router.get("", response_model=SystemSettings, summary="System-Einstellungen abrufen")
-def get_system_settings(db: Session = Depends(get_db)):
+async def get_system_settings(request: Request, db: AsyncSession = Depends(get_async_db)):
     """
     Gibt die globalen System-Einstellungen zurück.
 
     Enthält u.a.:
     - pending_door_values: Standard-Türwerte für unbekannte RFIDs
 
+    Wie GET /entities mit ETag; bei unverändertem ETag folgt 304.
+
     Returns:
         SystemSettings
     """
-    return settings_service.get(db)
+    return await snapshot_response(
+        request, "system_settings", lambda: settings_service.get(db), system_settings_adapter
+    )
 
 
 @router.put("", response_model=SystemSettings, summary="System-Einstellungen aktualisieren")
-def update_system_settings(
+async def update_system_settings(
     settings_update: SystemSettingsUpdate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Aktualisiert die globalen System-Einstellungen.
@@ -47,7 +54,7 @@ def update_system_settings(
         400: Validierungsfehler
     """
     try:
-        return settings_service.update(db, settings_update)
+        return await settings_service.update(db, settings_update)
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -3,7 +3,7 @@ API v1 Main Router
 Kombiniert alle Endpunkt-Router.
 """
 from fastapi import APIRouter
-from .endpoints import entities, settings, logs, pending_rfids, system_settings
+from .endpoints import entities, settings, logs, pending_rfids, system_settings, access, events, audit
 
 api_router = APIRouter()
 
@@ -42,3 +42,24 @@ api_router.include_router(
     tags=["system-settings"]
 )
 
+
+# Access Routes
+api_router.include_router(
+    access.router,
+    prefix="/access",
+    tags=["access"]
+)
+
+# Events Routes
+api_router.include_router(
+    events.router,
+    prefix="/events",
+    tags=["events"]
+)
+
+# Audit Routes
+api_router.include_router(
+    audit.router,
+    prefix="/audit",
+    tags=["audit"]
+)
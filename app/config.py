@@ -1,10 +1,136 @@
 from pathlib import Path
-from pydantic import BaseModel
+from typing import Dict, Literal, Optional
+from pydantic import BaseModel, Field
+
+
+class SQLiteProfile(BaseModel):
+    """
+    PRAGMA-Werte, die auf jede neue SQLite-Verbindung angewendet werden.
+
+    Attributes:
+        journal_mode: DELETE (SQLite-Default) oder WAL (Leser blockieren Schreiber nicht)
+        synchronous: FULL fsynct bei jedem Commit, NORMAL im WAL-Modus nur beim Checkpoint
+        mmap_size: Bytes der Datenbank, die per mmap gelesen werden (0 = aus)
+        cache_size: Seiten-Cache; negative Werte in KiB, positive in Seiten
+        busy_timeout: Millisekunden, die auf eine gesperrte Datenbank gewartet wird
+        temp_store: Ablage temporärer Tabellen/Indizes (MEMORY spart SD-Karten-Zugriffe)
+    """
+    journal_mode: Literal["DELETE", "TRUNCATE", "PERSIST", "WAL"] = "DELETE"
+    synchronous: Literal["OFF", "NORMAL", "FULL", "EXTRA"] = "FULL"
+    mmap_size: int = Field(0, ge=0)
+    cache_size: int = -2000
+    busy_timeout: int = Field(5000, ge=0)
+    temp_store: Literal["DEFAULT", "FILE", "MEMORY"] = "DEFAULT"
+
+
+SQLITE_PROFILES: Dict[str, SQLiteProfile] = {
+    # Verhalten ohne Tuning (Rollback-Journal, fsync bei jedem Commit)
+    "default": SQLiteProfile(),
+    # WAL, aber weiterhin fsync bei jedem Commit: kein Commit geht bei Stromausfall verloren
+    "durable": SQLiteProfile(
+        journal_mode="WAL", synchronous="FULL", mmap_size=0, cache_size=-8000, temp_store="MEMORY"
+    ),
+    # WAL + NORMAL: bei Stromausfall können die letzten Commits fehlen, die Datenbank bleibt konsistent
+    "fast": SQLiteProfile(
+        journal_mode="WAL", synchronous="NORMAL", mmap_size=64 * 1024 * 1024, cache_size=-16000, temp_store="MEMORY"
+    ),
+}
+
+
+class LogWriterConfig(BaseModel):
+    """
+    Einstellungen des Group-Commit-Writers für AccessLogs.
+
+    Attributes:
+        durability: 'flush' antwortet erst nach dem Commit, 'enqueue' sofort nach
+            dem Einreihen (bei Absturz können bis zu flush_interval_ms Logs fehlen)
+        flush_interval_ms: Maximale Wartezeit auf weitere Zeilen, bevor ein Batch geschrieben
+            wird. 0 schreibt sofort alles, was während des letzten Commits eingereiht wurde
+        max_batch_rows: Zeilen, ab denen sofort geschrieben wird
+        queue_size: Maximale Anzahl wartender Aufträge (danach warten die Requests)
+        retry_interval_ms: Wartezeit, bevor Zeilen nach einem vorübergehenden
+            Datenbankfehler erneut geschrieben werden (durability 'enqueue')
+        max_retries: Wiederholungen je Auftrag, danach werden die Zeilen verworfen
+            und geloggt (durability 'enqueue')
+    """
+    durability: Literal["flush", "enqueue"] = "flush"
+    flush_interval_ms: int = Field(0, ge=0)
+    max_batch_rows: int = Field(500, ge=1)
+    queue_size: int = Field(10000, ge=1)
+    retry_interval_ms: int = Field(1000, ge=0)
+    max_retries: int = Field(5, ge=0)
+
+
+class LogRetentionConfig(BaseModel):
+    """
+    Aufbewahrung der AccessLogs.
+
+    Attributes:
+        raw_days: Tage, die Roh-Logs behalten werden; ältere werden zu Tageszählern
+            verdichtet und gelöscht (None = unbegrenzt)
+        interval_minutes: Abstand der Aufräumläufe
+        batch_size: Zeilen pro Lösch-Transaktion (kurze Schreibsperren)
+        batch_pause_ms: Pause zwischen zwei Batches, damit andere Schreiber drankommen
+    """
+    raw_days: Optional[int] = Field(90, ge=1)
+    interval_minutes: int = Field(60, ge=1)
+    batch_size: int = Field(500, ge=1)
+    batch_pause_ms: int = Field(50, ge=0)
+
+
+class AuditConfig(BaseModel):
+    """
+    Audit-Trail für Admin-Zugriffe (audit_events, getrennt von access_logs).
+
+    Attributes:
+        policy: 'off' schreibt nichts, 'sampled' schreibt alle Änderungen und
+            Lesezugriffe mit read_sample_rate, 'all' schreibt jeden Zugriff
+        read_sample_rate: Anteil protokollierter Lesezugriffe bei 'sampled'
+        flush_interval_ms: Maximale Wartezeit auf weitere Events vor dem Schreiben
+        max_batch_rows: Events, ab denen sofort geschrieben wird
+        queue_size: Maximale Anzahl gepufferter Events (danach werden neue verworfen)
+    """
+    policy: Literal["off", "sampled", "all"] = "sampled"
+    read_sample_rate: float = Field(0.1, ge=0, le=1)
+    flush_interval_ms: int = Field(1000, ge=0)
+    max_batch_rows: int = Field(500, ge=1)
+    queue_size: int = Field(10000, ge=1)
+
+
+class EntityCacheConfig(BaseModel):
+    """
+    In-Process-Cache für Entity-Lookups (RFID und ID) im EntityService.
+
+    Schreibvorgänge über die Services invalidieren sofort; ttl_seconds
+    begrenzt die Veraltung bei Änderungen an der Datenbank vorbei (z.B.
+    durch einen zweiten Worker-Prozess).
+
+    Attributes:
+        enabled: Cache verwenden
+        max_entries: Maximale Anzahl Einträge (älteste Nutzung wird verdrängt)
+        ttl_seconds: Lebensdauer eines Eintrags
+        negative_ttl_seconds: Lebensdauer von "nicht gefunden"-Einträgen (0 = nicht cachen);
+            kurz, weil ein anderer Prozess den Tag jederzeit per convert anlegen kann
+    """
+    enabled: bool = True
+    max_entries: int = Field(1024, ge=1)
+    ttl_seconds: float = Field(60.0, gt=0)
+    negative_ttl_seconds: float = Field(2.0, ge=0)
 
 
 class Settings(BaseModel):
     database_url: str = f"sqlite:///{Path(__file__).resolve().parent.parent / 'fooder.db'}"
+    # Preset aus SQLITE_PROFILES; sqlite überschreibt es mit eigenen Werten
+    sqlite_profile: Literal["default", "durable", "fast"] = "durable"
+    sqlite: Optional[SQLiteProfile] = None
+    log_writer: LogWriterConfig = LogWriterConfig()
+    log_retention: LogRetentionConfig = LogRetentionConfig()
+    audit: AuditConfig = AuditConfig()
+    entity_cache: EntityCacheConfig = EntityCacheConfig()
 
+    def sqlite_pragmas(self) -> SQLiteProfile:
+        """Effektives SQLite-Profil (eigene Werte vor Preset)."""
+        return self.sqlite or SQLITE_PROFILES[self.sqlite_profile]
 
-settings = Settings()
 
+settings = Settings()
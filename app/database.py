@@ -1,10 +1,97 @@
 import os
 from pathlib import Path
+from typing import Optional
 
+from sqlalchemy.engine import Engine
 from sqlalchemy.engine.url import make_url
-from sqlalchemy import create_engine
-from .config import settings
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from .config import SQLiteProfile, settings
 from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+# Async-Treiber je Datenbank für den async Datenpfad
+ASYNC_DRIVERS = {
+    "sqlite": "aiosqlite",
+    "postgresql": "asyncpg",
+    "mysql": "aiomysql",
+}
+
+# Verbindungen der Async-Engine bei SQLite-Dateien
+SQLITE_ASYNC_POOL_SIZE = 5
+
+
+def apply_sqlite_profile(engine: Engine, profile: SQLiteProfile) -> None:
+    """
+    Setzt die PRAGMAs des Profils auf jeder neuen Verbindung der Engine.
+
+    Args:
+        engine: SQLite-Engine
+        profile: Anzuwendende PRAGMA-Werte
+    """
+    pragmas = [
+        f"PRAGMA journal_mode={profile.journal_mode}",
+        f"PRAGMA synchronous={profile.synchronous}",
+        f"PRAGMA mmap_size={profile.mmap_size}",
+        f"PRAGMA cache_size={profile.cache_size}",
+        f"PRAGMA busy_timeout={profile.busy_timeout}",
+        f"PRAGMA temp_store={profile.temp_store}",
+    ]
+
+    @event.listens_for(engine, "connect")
+    def _set_pragmas(dbapi_connection, _connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma in pragmas:
+                cursor.execute(pragma)
+        finally:
+            cursor.close()
+
+
+def to_async_url(db_url: str) -> str:
+    """
+    Ersetzt den Treiber einer Datenbank-URL durch den passenden Async-Treiber.
+
+    Args:
+        db_url: URL des sync Stacks (z.B. 'sqlite:///fooder.db')
+
+    Returns:
+        URL für create_async_engine (z.B. 'sqlite+aiosqlite:///fooder.db')
+
+    Raises:
+        ValueError: Wenn für die Datenbank kein Async-Treiber bekannt ist
+    """
+    url = make_url(db_url)
+    backend = url.get_backend_name()
+    if backend not in ASYNC_DRIVERS:
+        raise ValueError(f"Kein Async-Treiber für Datenbank '{backend}' bekannt")
+    return url.set(drivername=f"{backend}+{ASYNC_DRIVERS[backend]}").render_as_string(hide_password=False)
+
+
+def create_async_db_engine(db_url: str, profile: Optional[SQLiteProfile] = None) -> AsyncEngine:
+    """
+    Erstellt die Async-Engine zu einer (sync) Datenbank-URL.
+
+    Args:
+        db_url: URL des sync Stacks
+        profile: SQLite-Profil (nur für SQLite, default: kein Profil)
+
+    Returns:
+        AsyncEngine
+    """
+    async_url = to_async_url(db_url)
+    engine_args: dict = {}
+    url = make_url(async_url)
+    if url.get_backend_name() == "sqlite" and url.database not in (None, "", ":memory:"):
+        # aiosqlite nutzt für Dateien sonst NullPool (pro Session eine neue Verbindung
+        # samt Thread und PRAGMAs). Ohne Overflow warten Coroutinen in der Pool-Queue
+        # statt im busy_timeout von SQLite, der nur einen Schreiber zulässt.
+        engine_args.update(poolclass=AsyncAdaptedQueuePool, pool_size=SQLITE_ASYNC_POOL_SIZE, max_overflow=0)
+    async_engine = create_async_engine(async_url, **engine_args)
+    if profile is not None and db_url.startswith("sqlite"):
+        apply_sqlite_profile(async_engine.sync_engine, profile)
+    return async_engine
+
 
 db_url = settings.database_url
 connect_args: dict[str, bool] = {}
@@ -21,7 +108,13 @@ if db_url.startswith("sqlite"):
     db_url = str(url)
 
 engine = create_engine(db_url, connect_args=connect_args)
+if db_url.startswith("sqlite"):
+    apply_sqlite_profile(engine, settings.sqlite_pragmas())
 SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False)
+
+async_engine = create_async_db_engine(db_url, settings.sqlite_pragmas())
+# expire_on_commit=False: nach dem Commit wird nichts implizit (synchron) nachgeladen
+AsyncSessionLocal = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
 Base = declarative_base()
 
 def get_db():
@@ -4,7 +4,15 @@ Exportiert alle Hardware-Klassen.
 """
 from .servo import ServoController
 from .rfid import RFIDReader
-from .gpio_factory import get_gpio_factory
+from .gpio_factory import get_gpio_factory, set_gpio_factory
+from .irq import EdgeSource, GpioEdgeSource, SimulatedEdgeSource
+from .presence import PresenceEvent, PresenceTracker
+from .simulation import ServoEvent, SimulatedMFRC522, SimulatedPinFactory, SimulatedServo
 
-__all__ = ["ServoController", "RFIDReader", "get_gpio_factory"]
+__all__ = [
+    "ServoController", "RFIDReader", "get_gpio_factory", "set_gpio_factory",
+    "EdgeSource", "GpioEdgeSource", "SimulatedEdgeSource",
+    "PresenceEvent", "PresenceTracker",
+    "ServoEvent", "SimulatedMFRC522", "SimulatedPinFactory", "SimulatedServo"
+]
 
@@ -19,6 +19,9 @@ def get_gpio_factory():
     """
     Gibt eine gemeinsame PiGPIOFactory-Instanz zurück.
 
+    Wurde per set_gpio_factory() eine eigene Factory gesetzt (z.B.
+    SimulatedPinFactory), wird diese zurückgegeben.
+
     Returns:
         PiGPIOFactory-Instanz
 
@@ -27,10 +30,10 @@ def get_gpio_factory():
     """
     global _gpio_factory
 
-    if PiGPIOFactory is None:
-        raise RuntimeError("gpiozero ist nicht installiert")
-
     if _gpio_factory is None:
+        if PiGPIOFactory is None:
+            raise RuntimeError("gpiozero ist nicht installiert")
+
         try:
             _gpio_factory = PiGPIOFactory()
             LOGGER.info("GPIO Factory initialisiert")
@@ -41,6 +44,20 @@ def get_gpio_factory():
     return _gpio_factory
 
 
+def set_gpio_factory(factory):
+    """
+    Setzt die gemeinsame Factory (z.B. SimulatedPinFactory für Tests).
+
+    Args:
+        factory: Pin-Factory-Instanz
+    """
+    global _gpio_factory
+
+    reset_gpio_factory()
+    _gpio_factory = factory
+    LOGGER.info(f"GPIO Factory gesetzt: {factory!r}")
+
+
 def reset_gpio_factory():
     """
     Setzt die GPIO Factory zurück.
@@ -0,0 +1,106 @@
+"""
+IRQ Edge Source Module
+Quellen für Interrupt-Flanken (z.B. IRQ-Pin des MFRC522).
+"""
+import logging
+import threading
+
+try:
+    from gpiozero import DigitalInputDevice
+except ImportError:
+    DigitalInputDevice = None
+
+from .gpio_factory import get_gpio_factory
+
+LOGGER = logging.getLogger(__name__)
+
+
+class EdgeSource:
+    """
+    Basisklasse für eine Flankenquelle.
+
+    Eine Flanke bleibt gespeichert, bis sie von wait() abgeholt oder per
+    clear() verworfen wird; so geht kein Interrupt zwischen zwei Aufrufen
+    verloren.
+    """
+
+    def __init__(self):
+        self._edge = threading.Event()
+
+    def wait(self, timeout: float) -> bool:
+        """
+        Wartet auf eine Flanke.
+
+        Args:
+            timeout: Maximale Wartezeit in Sekunden
+
+        Returns:
+            True, wenn eine Flanke aufgetreten ist
+        """
+        triggered = self._edge.wait(timeout)
+        self._edge.clear()
+        return triggered
+
+    def clear(self) -> None:
+        """Verwirft eine bereits gespeicherte Flanke."""
+        self._edge.clear()
+
+    def close(self) -> None:
+        """Gibt die Ressourcen der Quelle frei."""
+
+
+class GpioEdgeSource(EdgeSource):
+    """
+    Fallende Flanke an einem GPIO-Pin über gpiozero.
+
+    Der IRQ-Ausgang des MFRC522 ist Open-Drain und active-low, daher wird
+    der interne Pull-up verwendet.
+
+    Attributes:
+        pin: GPIO-Pin (BCM-Nummer)
+    """
+
+    def __init__(self, pin: int):
+        """
+        Initialisiert die Flankenquelle.
+
+        Args:
+            pin: GPIO-Pin (BCM-Nummer)
+
+        Raises:
+            RuntimeError: Wenn gpiozero nicht verfügbar ist
+        """
+        if DigitalInputDevice is None:
+            raise RuntimeError("gpiozero ist nicht installiert")
+
+        super().__init__()
+        self.pin = pin
+        try:
+            self.device = DigitalInputDevice(pin, pull_up=True, pin_factory=get_gpio_factory())
+            # Pull-up: "deaktiviert" entspricht der fallenden Flanke
+            self.device.when_deactivated = self._edge.set
+            LOGGER.info(f"IRQ-Pin {pin} initialisiert")
+        except Exception as e:
+            LOGGER.error(f"Fehler beim Initialisieren des IRQ-Pins {pin}: {e}")
+            raise
+
+    def close(self) -> None:
+        """Gibt den GPIO-Pin frei."""
+        try:
+            self.device.close()
+        except Exception as e:
+            LOGGER.warning(f"Fehler beim Schließen des IRQ-Pins {self.pin}: {e}")
+
+    def __repr__(self):
+        return f"<GpioEdgeSource(pin={self.pin})>"
+
+
+class SimulatedEdgeSource(EdgeSource):
+    """Flankenquelle ohne Hardware; Flanken werden per trigger() ausgelöst."""
+
+    def trigger(self) -> None:
+        """Löst eine Flanke aus (thread-sicher)."""
+        self._edge.set()
+
+    def __repr__(self):
+        return "<SimulatedEdgeSource>"
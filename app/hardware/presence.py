@@ -0,0 +1,122 @@
+"""
+Presence Tracker Module
+Erkennt Ankunft und Weggang von RFID-Tags aus wiederholten Lesevorgängen.
+"""
+import logging
+from time import monotonic
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+LOGGER = logging.getLogger(__name__)
+
+ARRIVED = "arrived"
+LEFT = "left"
+
+
+class PresenceEvent(NamedTuple):
+    """
+    Zustandswechsel eines Tags.
+
+    Attributes:
+        kind: ARRIVED oder LEFT
+        rfid_id: RFID-Tag-Nummer
+        timestamp: Zeitpunkt (time.monotonic())
+        duration: Anwesenheitsdauer in Sekunden (nur bei LEFT, sonst 0)
+    """
+    kind: str
+    rfid_id: int
+    timestamp: float
+    duration: float = 0.0
+
+
+class PresenceTracker:
+    """
+    Zustandsmaschine über den Rohdaten von RFIDReader.read_once().
+
+    Solange ein Tier am Futterplatz steht, liefert der Reader alle paar
+    hundert Millisekunden dieselbe UID. Der Tracker meldet daraus nur:
+
+    - ARRIVED beim ersten Lesen eines Tags,
+    - LEFT, wenn der Tag länger als hold_off nicht mehr gelesen wurde
+      (einzelne Fehllesungen des MFRC522 werden so überbrückt).
+
+    Taucht ein Tag innerhalb von rearm Sekunden nach LEFT wieder auf, gilt
+    er als weiterhin anwesend und erzeugt kein neues ARRIVED.
+
+    Attributes:
+        hold_off: Sekunden ohne Lesung bis LEFT
+        rearm: Sekunden nach LEFT, bevor derselbe Tag erneut ARRIVED auslöst
+    """
+
+    def __init__(self, hold_off: float = 1.0, rearm: float = 5.0, clock: Callable[[], float] = monotonic):
+        """
+        Initialisiert den Tracker.
+
+        Args:
+            hold_off: Sekunden ohne Lesung, bis ein Tag als weg gilt
+            rearm: Sperrzeit nach dem Weggang für erneute Ankünfte
+            clock: Zeitquelle (default: time.monotonic)
+        """
+        self.hold_off = hold_off
+        self.rearm = rearm
+        self._clock = clock
+        # rfid_id -> (Ankunft, letzte Lesung)
+        self._present: Dict[int, tuple] = {}
+        # rfid_id -> (Ankunft, Weggang)
+        self._departed: Dict[int, tuple] = {}
+
+    @property
+    def present(self) -> List[int]:
+        """Aktuell anwesende Tags."""
+        return list(self._present)
+
+    def update(self, rfid_id: Optional[int], now: Optional[float] = None) -> List[PresenceEvent]:
+        """
+        Verarbeitet das Ergebnis eines Lesevorgangs.
+
+        Muss bei jedem Poll aufgerufen werden, auch ohne erkannten Tag,
+        damit Weggänge erkannt werden.
+
+        Args:
+            rfid_id: Gelesene RFID-ID oder None
+            now: Zeitpunkt (default: clock())
+
+        Returns:
+            Ausgelöste Events (meist leer)
+        """
+        now = self._clock() if now is None else now
+        events: List[PresenceEvent] = []
+
+        if rfid_id is not None:
+            if rfid_id in self._present:
+                arrived_at, _ = self._present[rfid_id]
+                self._present[rfid_id] = (arrived_at, now)
+            elif rfid_id in self._departed and now - self._departed[rfid_id][1] < self.rearm:
+                # Kurz weg und wieder da: gilt als durchgehend anwesend
+                arrived_at, _ = self._departed.pop(rfid_id)
+                self._present[rfid_id] = (arrived_at, now)
+            else:
+                self._departed.pop(rfid_id, None)
+                self._present[rfid_id] = (now, now)
+                LOGGER.debug(f"Tag {rfid_id} angekommen")
+                events.append(PresenceEvent(ARRIVED, rfid_id, now))
+
+        for tag, (arrived_at, last_seen) in list(self._present.items()):
+            if now - last_seen > self.hold_off:
+                del self._present[tag]
+                self._departed[tag] = (arrived_at, last_seen)
+                LOGGER.debug(f"Tag {tag} weg nach {last_seen - arrived_at:.1f}s")
+                events.append(PresenceEvent(LEFT, tag, now, last_seen - arrived_at))
+
+        for tag, (_arrived_at, left_at) in list(self._departed.items()):
+            if now - left_at >= self.rearm:
+                del self._departed[tag]
+
+        return events
+
+    def reset(self) -> None:
+        """Vergisst alle Tags."""
+        self._present.clear()
+        self._departed.clear()
+
+    def __repr__(self):
+        return f"<PresenceTracker(hold_off={self.hold_off}, rearm={self.rearm}, present={len(self._present)})>"
@@ -3,6 +3,7 @@ RFID Reader Module
 Liest RFID-Tags über MFRC522-Reader.
 """
 import logging
+import time
 from typing import Optional
 
 try:
@@ -10,41 +11,103 @@ try:
 except ImportError:
     MFRC522 = None
 
+from .irq import EdgeSource, GpioEdgeSource
+
 LOGGER = logging.getLogger(__name__)
 
+# MFRC522-Register und -Befehle für den IRQ-Modus (Datenblatt, Kapitel 9)
+COMMAND_REG = 0x01
+COM_IEN_REG = 0x02
+DIV_IEN_REG = 0x03
+COM_IRQ_REG = 0x04
+FIFO_DATA_REG = 0x09
+FIFO_LEVEL_REG = 0x0A
+BIT_FRAMING_REG = 0x0D
+PCD_TRANSCEIVE = 0x0C
+PICC_REQIDL = 0x26
+
+# IRqInv (IRQ-Pin active-low) | RxIEn (Interrupt bei empfangener Antwort)
+COM_IEN_RX_IRQ = 0xA0
+# IRQPushPull: IRQ-Pin als CMOS-Ausgang
+DIV_IEN_PUSH_PULL = 0x80
+# Setzt alle Interrupt-Flags in ComIrqReg zurück
+COM_IRQ_CLEAR = 0x7F
+# StartSend mit 7 gültigen Bits (REQA ist ein Short Frame)
+BIT_FRAMING_START_SHORT = 0x87
+
 
 class RFIDReader:
     """
     Reader für RFID-Tags über MFRC522.
 
+    Ohne IRQ-Pin wird gepollt (read_once() mit vollständiger SPI-Transaktion).
+    Mit IRQ-Pin sendet der Reader nur ein REQA und wartet auf die Flanke
+    des Empfangs-Interrupts; die teure Anticollision läuft erst, wenn eine
+    Karte geantwortet hat.
+
     Attributes:
         reader: MFRC522-Instanz
+        edge_source: Flankenquelle des IRQ-Pins (None im Polling-Modus)
     """
 
-    def __init__(self, spi_device: int = 0, speed: int = 50000):
+    def __init__(
+        self,
+        spi_device: int = 0,
+        speed: int = 50000,
+        spi_bus: int = 0,
+        pin_rst: Optional[int] = None,
+        irq_pin: Optional[int] = None,
+        edge_source: Optional[EdgeSource] = None,
+        irq_rearm_interval: float = 0.05,
+        backend=None
+    ):
         """
         Initialisiert den RFID-Reader.
 
         Args:
             spi_device: SPI-Device-Nummer (default: 0)
             speed: SPI-Geschwindigkeit in Hz (default: 50000)
+            spi_bus: SPI-Bus-Nummer (default: 0)
+            pin_rst: Reset-Pin des Readers (default: Standard der mfrc522-Bibliothek)
+            irq_pin: GPIO-Pin (BCM) am IRQ-Ausgang; None = Polling
+            edge_source: Eigene Flankenquelle (hat Vorrang vor irq_pin)
+            irq_rearm_interval: Abstand zwischen zwei REQA im IRQ-Modus in Sekunden
+            backend: Eigene MFRC522-Instanz (z.B. SimulatedMFRC522); ersetzt SPI-Parameter
 
         Raises:
             RuntimeError: Wenn mfrc522 nicht verfügbar ist
         """
-        if MFRC522 is None:
+        if backend is not None:
+            self.reader = backend
+        elif MFRC522 is None:
             raise RuntimeError("mfrc522 ist nicht installiert")
 
         try:
-            self.reader = MFRC522(device=spi_device, spd=speed)
+            if backend is None:
+                kwargs = {"pin_rst": pin_rst} if pin_rst is not None else {}
+                self.reader = MFRC522(bus=spi_bus, device=spi_device, spd=speed, **kwargs)
             LOGGER.info(
-                f"RFID-Reader initialisiert (SPI Device: {spi_device}, "
+                f"RFID-Reader initialisiert (SPI {spi_bus}.{spi_device}, "
                 f"Speed: {speed} Hz)"
             )
         except Exception as e:
             LOGGER.error(f"Fehler beim Initialisieren des RFID-Readers: {e}")
             raise
 
+        self.spi_bus = spi_bus
+        self.spi_device = spi_device
+        self.irq_rearm_interval = irq_rearm_interval
+        if edge_source is None and irq_pin is not None:
+            edge_source = GpioEdgeSource(irq_pin)
+        self.edge_source = edge_source
+        if edge_source is not None:
+            LOGGER.info(f"RFID-Reader im IRQ-Modus ({edge_source!r})")
+
+    @property
+    def irq_enabled(self) -> bool:
+        """True, wenn Karten über den IRQ-Pin erkannt werden."""
+        return self.edge_source is not None
+
     def read_once(self) -> Optional[int]:
         """
         Versucht, ein RFID-Tag zu lesen (non-blocking).
@@ -58,47 +121,112 @@ class RFIDReader:
             if status != self.reader.MI_OK:
                 return None
 
-            # Anti-Collision
-            (status, uid) = self.reader.MFRC522_Anticoll()
-            if status != self.reader.MI_OK:
+            return self._read_uid()
+
+        except Exception as e:
+            LOGGER.error(f"Fehler beim Lesen des RFID-Tags: {e}")
+            return None
+
+    def wait_for_tag(self, timeout: float) -> Optional[int]:
+        """
+        Wartet blockierend bis zu timeout Sekunden auf ein RFID-Tag.
+
+        Im IRQ-Modus wird alle irq_rearm_interval Sekunden ein REQA gesendet
+        und auf die Interrupt-Flanke gewartet. Im Polling-Modus entspricht
+        der Aufruf einem read_once() (ohne Wartezeit).
+
+        Args:
+            timeout: Maximale Wartezeit in Sekunden
+
+        Returns:
+            RFID-ID als Integer oder None wenn kein Tag erkannt wurde
+        """
+        if self.edge_source is None:
+            return self.read_once()
+
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
                 return None
 
-            # Konvertiere UID zu Integer
-            rfid_id = 0
-            for i in range(0, 4):
-                rfid_id = (rfid_id << 8) + uid[i]
+            try:
+                self._arm_irq()
+                if not self.edge_source.wait(min(remaining, self.irq_rearm_interval)):
+                    continue
 
-            LOGGER.info(f"RFID-Tag erkannt: {rfid_id}")
-            return rfid_id
+                # Karte hat auf REQA geantwortet (Zustand READY): direkt Anticollision
+                self.reader.Write_MFRC522(COM_IRQ_REG, COM_IRQ_CLEAR)
+                rfid_id = self._read_uid()
+                if rfid_id is not None:
+                    return rfid_id
+            except Exception as e:
+                LOGGER.error(f"Fehler beim Lesen des RFID-Tags (IRQ): {e}")
+                # Nicht in einer Fehlerschleife kreisen
+                time.sleep(max(0.0, deadline - time.monotonic()))
+                return None
 
-        except Exception as e:
-            LOGGER.error(f"Fehler beim Lesen des RFID-Tags: {e}")
+    def _arm_irq(self) -> None:
+        """Aktiviert den Empfangs-Interrupt und sendet ein REQA."""
+        write = self.reader.Write_MFRC522
+        write(COM_IEN_REG, COM_IEN_RX_IRQ)
+        write(DIV_IEN_REG, DIV_IEN_PUSH_PULL)
+        write(COM_IRQ_REG, COM_IRQ_CLEAR)
+        # Flanken aus vorherigen Transaktionen (MFRC522_ToCard) verwerfen
+        self.edge_source.clear()
+
+        write(FIFO_LEVEL_REG, 0x80)
+        write(FIFO_DATA_REG, PICC_REQIDL)
+        write(COMMAND_REG, PCD_TRANSCEIVE)
+        write(BIT_FRAMING_REG, BIT_FRAMING_START_SHORT)
+
+    def _read_uid(self) -> Optional[int]:
+        """Führt die Anticollision aus und liefert die UID als Integer."""
+        (status, uid) = self.reader.MFRC522_Anticoll()
+        if status != self.reader.MI_OK:
             return None
 
+        # Konvertiere UID zu Integer
+        rfid_id = 0
+        for i in range(0, 4):
+            rfid_id = (rfid_id << 8) + uid[i]
+
+        LOGGER.info(f"RFID-Tag erkannt: {rfid_id}")
+        return rfid_id
+
     def read_continuous(self, callback, interval: float = 0.2):
         """
         Liest kontinuierlich RFID-Tags und ruft Callback auf.
 
         Args:
             callback: Funktion die bei erkanntem Tag aufgerufen wird (rfid_id)
-            interval: Wartezeit zwischen Scans in Sekunden
+            interval: Wartezeit zwischen Scans in Sekunden (nur Polling-Modus)
         """
-        import time
-
         LOGGER.info("Starte kontinuierliches RFID-Lesen...")
 
         try:
             while True:
-                rfid_id = self.read_once()
+                rfid_id = self.wait_for_tag(interval)
                 if rfid_id is not None:
                     callback(rfid_id)
-                time.sleep(interval)
+                if not self.irq_enabled:
+                    time.sleep(interval)
         except KeyboardInterrupt:
             LOGGER.info("RFID-Lesen durch Benutzer gestoppt")
         except Exception as e:
             LOGGER.error(f"Fehler beim kontinuierlichen RFID-Lesen: {e}")
             raise
 
+    def close(self) -> None:
+        """Gibt IRQ-Pin und SPI-Verbindung frei."""
+        if self.edge_source is not None:
+            self.edge_source.close()
+        try:
+            self.reader.Close_MFRC522()
+        except Exception as e:
+            LOGGER.warning(f"Fehler beim Schließen des RFID-Readers: {e}")
+
     def __repr__(self):
-        return "<RFIDReader(MFRC522)>"
+        mode = "IRQ" if self.irq_enabled else "Polling"
+        return f"<RFIDReader(MFRC522, SPI {self.spi_bus}.{self.spi_device}, {mode})>"
 
@@ -10,6 +10,7 @@ except ImportError:
     AngularServo = None
 
 from .gpio_factory import get_gpio_factory
+from .simulation import SimulatedPinFactory
 
 LOGGER = logging.getLogger(__name__)
 
@@ -28,9 +29,6 @@ class ServoController:
         min_pulse: float,
         max_pulse: float
     ):
-        if AngularServo is None:
-            raise RuntimeError("gpiozero ist nicht installiert")
-
         self.pin = pin
 
         # Wir speichern Ihre gewünschten Zielwinkel separat
@@ -38,12 +36,17 @@ class ServoController:
         self.target_max = max_angle
 
         factory = get_gpio_factory()
+        if AngularServo is None and not isinstance(factory, SimulatedPinFactory):
+            raise RuntimeError("gpiozero ist nicht installiert")
+
+        # Simulierte Factory erzeugt die Servos selbst (ohne gpiozero)
+        servo_class = factory.angular_servo if isinstance(factory, SimulatedPinFactory) else AngularServo
 
         try:
             # FIX: Wir initialisieren den Servo IMMER mit seinem vollen physischen Bereich (-90 bis 90).
             # Damit bleibt die Skalierung korrekt (1 Grad ist wirklich 1 Grad).
             # initial_value=None verhindert, dass der Servo beim Start automatisch auf 0° springt
-            self.servo = AngularServo(
+            self.servo = servo_class(
                 pin,
                 min_angle=-90,
                 max_angle=90,
@@ -85,6 +88,20 @@ class ServoController:
             LOGGER.error(f"Fehler beim Bewegen des Servos auf Pin {self.pin}: {e}")
             raise
 
+    def retarget(self, min_angle: float, max_angle: float) -> None:
+        """
+        Ändert die logischen Zielwinkel, ohne den AngularServo neu zu erstellen.
+
+        Pin und Pulsbreiten bleiben unverändert; dafür ist ein neuer
+        ServoController nötig.
+        """
+        LOGGER.debug(
+            f"Servo Pin {self.pin}: Ziele {self.target_min}°/{self.target_max}° -> "
+            f"{min_angle}°/{max_angle}°"
+        )
+        self.target_min = min_angle
+        self.target_max = max_angle
+
     def move_to_angle(self, angle: float) -> None:
         """
         Bewegt den Servo zu einem spezifischen Winkel.
@@ -0,0 +1,255 @@
+"""
+Simulation Module
+Simulierte Hardware-Backends (MFRC522, Servos) für Tests und Benchmarks ohne Pi.
+"""
+import threading
+import time
+from time import monotonic
+from typing import Callable, Iterable, List, NamedTuple, Optional, Tuple
+
+from .irq import SimulatedEdgeSource
+
+# Register BitFramingReg und StartSend-Bit (siehe rfid.py)
+_BIT_FRAMING_REG = 0x0D
+_START_SEND = 0x80
+
+
+class ServoEvent(NamedTuple):
+    """
+    Aufgezeichnete Winkeländerung eines simulierten Servos.
+
+    Attributes:
+        timestamp: Zeitpunkt (Uhr der Factory, default time.monotonic())
+        pin: GPIO-Pin
+        angle: Gesetzter Winkel (None = Servo freigegeben)
+    """
+    timestamp: float
+    pin: int
+    angle: Optional[float]
+
+
+class SimulatedServo:
+    """Ersatz für gpiozero.AngularServo; jede Winkeländerung wird aufgezeichnet."""
+
+    def __init__(self, factory: "SimulatedPinFactory", pin: int, min_angle: float, max_angle: float):
+        self._factory = factory
+        self.pin = pin
+        self.min_angle = min_angle
+        self.max_angle = max_angle
+        self._angle: Optional[float] = None
+
+    @property
+    def angle(self) -> Optional[float]:
+        return self._angle
+
+    @angle.setter
+    def angle(self, value: Optional[float]) -> None:
+        if value is not None and not (self.min_angle <= value <= self.max_angle):
+            raise ValueError(f"Winkel {value}° außerhalb von {self.min_angle}..{self.max_angle}")
+        self._angle = value
+        self._factory.record(self.pin, value)
+
+    def close(self) -> None:
+        self._factory.release(self.pin)
+
+    def __repr__(self):
+        return f"<SimulatedServo(pin={self.pin}, angle={self._angle})>"
+
+
+class SimulatedPinFactory:
+    """
+    Pin-Factory ohne GPIO-Hardware.
+
+    Wird per set_gpio_factory() installiert; ServoController erzeugt dann
+    SimulatedServo statt AngularServo. Alle Winkeländerungen landen mit
+    Zeitstempel in events.
+
+    Attributes:
+        events: Aufgezeichnete ServoEvents in zeitlicher Reihenfolge
+    """
+
+    def __init__(self, clock: Callable[[], float] = monotonic):
+        """
+        Initialisiert die Factory.
+
+        Args:
+            clock: Zeitquelle für die Zeitstempel (default: time.monotonic)
+        """
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._claimed: set[int] = set()
+        self.events: List[ServoEvent] = []
+
+    def angular_servo(
+        self,
+        pin: int,
+        min_angle: float = -90,
+        max_angle: float = 90,
+        min_pulse_width: float = 0.001,
+        max_pulse_width: float = 0.002,
+        initial_angle: Optional[float] = 0.0,
+        pin_factory=None
+    ) -> SimulatedServo:
+        """
+        Erstellt einen simulierten Servo (Signatur wie gpiozero.AngularServo).
+
+        Pulsbreiten und pin_factory werden nur der Kompatibilität halber angenommen.
+
+        Raises:
+            RuntimeError: Wenn der Pin bereits belegt ist
+        """
+        with self._lock:
+            if pin in self._claimed:
+                raise RuntimeError(f"Pin {pin} ist bereits belegt")
+            self._claimed.add(pin)
+
+        servo = SimulatedServo(self, pin, min_angle, max_angle)
+        if initial_angle is not None:
+            servo.angle = initial_angle
+        return servo
+
+    def record(self, pin: int, angle: Optional[float]) -> None:
+        """Zeichnet eine Winkeländerung auf."""
+        event = ServoEvent(self._clock(), pin, angle)
+        with self._lock:
+            self.events.append(event)
+
+    def release(self, pin: int) -> None:
+        """Gibt einen Pin frei."""
+        with self._lock:
+            self._claimed.discard(pin)
+
+    def events_for(self, pin: int) -> List[ServoEvent]:
+        """Aufgezeichnete Events eines Pins."""
+        with self._lock:
+            return [event for event in self.events if event.pin == pin]
+
+    def close(self) -> None:
+        """Gibt alle Pins frei."""
+        with self._lock:
+            self._claimed.clear()
+
+    def __repr__(self):
+        return f"<SimulatedPinFactory(events={len(self.events)})>"
+
+
+class SimulatedMFRC522:
+    """
+    Ersatz für mfrc522.MFRC522 mit skriptbaren Tag-Ankünften.
+
+    Ein Skript besteht aus (start, end, uid)-Einträgen in Sekunden relativ
+    zu start(); vor start() liegt kein Tag auf. Zusätzlich können Tags per
+    present()/remove() manuell aufgelegt werden. Mit edge_source wird der
+    IRQ-Pin simuliert: ein REQA löst eine Flanke aus, wenn ein Tag aufliegt.
+
+    Attributes:
+        script: Liste von (start, end, uid)
+        spi_delay: Simulierte Dauer einer Request-/Anticoll-Transaktion in Sekunden
+    """
+
+    MI_OK = 0
+    MI_NOTAGERR = 1
+    MI_ERR = 2
+    PICC_REQIDL = 0x26
+
+    def __init__(
+        self,
+        script: Iterable[Tuple[float, float, int]] = (),
+        edge_source: Optional[SimulatedEdgeSource] = None,
+        spi_delay: float = 0.0,
+        clock: Callable[[], float] = monotonic
+    ):
+        """
+        Initialisiert den simulierten Reader.
+
+        Args:
+            script: (start, end, uid)-Einträge relativ zu start()
+            edge_source: Simulierter IRQ-Pin (optional)
+            spi_delay: Simulierte Dauer einer SPI-Transaktion in Sekunden
+            clock: Zeitquelle (default: time.monotonic)
+        """
+        self.script = sorted(script)
+        self.edge_source = edge_source
+        self.spi_delay = spi_delay
+        self._clock = clock
+        self._t0: Optional[float] = None
+        self._manual: Optional[int] = None
+
+    def start(self, t0: Optional[float] = None) -> float:
+        """
+        Startet das Skript.
+
+        Args:
+            t0: Startzeitpunkt (default: jetzt)
+
+        Returns:
+            Startzeitpunkt auf der Uhr des Readers
+        """
+        self._t0 = self._clock() if t0 is None else t0
+        return self._t0
+
+    def arrivals(self) -> List[Tuple[float, int]]:
+        """Absolute Ankunftszeiten (start) und UIDs des Skripts; erst nach start()."""
+        if self._t0 is None:
+            return []
+        return [(self._t0 + start, uid) for start, _end, uid in self.script]
+
+    def present(self, uid: int) -> None:
+        """Legt einen Tag dauerhaft auf (hat Vorrang vor dem Skript)."""
+        self._manual = uid
+
+    def remove(self) -> None:
+        """Entfernt den manuell aufgelegten Tag."""
+        self._manual = None
+
+    def current_tag(self) -> Optional[int]:
+        """UID des aktuell aufliegenden Tags oder None."""
+        if self._manual is not None:
+            return self._manual
+        if self._t0 is None:
+            return None
+
+        elapsed = self._clock() - self._t0
+        for start, end, uid in self.script:
+            if start <= elapsed < end:
+                return uid
+            if start > elapsed:
+                break
+        return None
+
+    # Schnittstelle der mfrc522-Bibliothek
+
+    def MFRC522_Request(self, req_mode: int):
+        self._transaction()
+        if self.current_tag() is None:
+            return self.MI_NOTAGERR, None
+        return self.MI_OK, 0x10
+
+    def MFRC522_Anticoll(self):
+        self._transaction()
+        uid = self.current_tag()
+        if uid is None:
+            return self.MI_ERR, []
+
+        data = list(uid.to_bytes(4, "big"))
+        checksum = data[0] ^ data[1] ^ data[2] ^ data[3]
+        return self.MI_OK, data + [checksum]
+
+    def Write_MFRC522(self, addr: int, val: int) -> None:
+        # StartSend eines REQA: aufliegender Tag antwortet -> IRQ-Flanke
+        if addr == _BIT_FRAMING_REG and val & _START_SEND and self.edge_source is not None:
+            if self.current_tag() is not None:
+                self.edge_source.trigger()
+
+    def Read_MFRC522(self, addr: int) -> int:
+        return 0
+
+    def Close_MFRC522(self) -> None:
+        pass
+
+    def _transaction(self) -> None:
+        if self.spi_delay > 0:
+            time.sleep(self.spi_delay)
+
+    def __repr__(self):
+        return f"<SimulatedMFRC522(script={len(self.script)} tags)>"
@@ -5,8 +5,12 @@ Exportiert alle Datenbank-Modelle.
 from .entity import Entity
 from .door_setting import DoorSetting
 from .access_log import AccessLog
+from .access_log_daily import AccessLogDaily
+from .access_log_counter import AccessLogCounter
+from .audit_event import AuditEvent
 from .pending_rfid import PendingRFID
 from .system_settings import SystemSettings
 
-__all__ = ["Entity", "DoorSetting", "AccessLog", "PendingRFID", "SystemSettings"]
+__all__ = ["Entity", "DoorSetting", "AccessLog", "AccessLogDaily", "AccessLogCounter", "AuditEvent", "PendingRFID",
+           "SystemSettings"]
 
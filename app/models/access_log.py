@@ -2,11 +2,16 @@
 AccessLog Database Model
 Protokolliert Zugriffe auf das System.
 """
-from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, func
+from datetime import datetime, timezone
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Index, func
 from sqlalchemy.orm import relationship
 from ..database import Base
 
 
+def _utc_now() -> datetime:
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
 class AccessLog(Base):
     """
     AccessLog Model - Zugriffsprotokolle.
@@ -14,18 +19,27 @@ class AccessLog(Base):
     Attributes:
         id: Eindeutige ID
         entity_id: Verknüpfung zur Entity (null bei unbekanntem RFID)
-        action: Art des Zugriffs (granted, unknown, read, update, delete, etc.)
+        action: Art des Zugriffs (granted, unknown, etc.; Admin-Zugriffe stehen in audit_events)
         rfid_id: RFID-Nummer (optional, besonders bei unbekannten Tags)
         timestamp: Zeitpunkt des Zugriffs
         entity: Beziehung zum Entity-Objekt
     """
     __tablename__ = 'access_logs'
+    # Filter + Zeit: jede Seite von GET /logs ist ein Bereichsscan (neueste zuerst).
+    # id ist die rowid und steckt damit in jedem SQLite-Index als letzte Spalte.
+    __table_args__ = (
+        Index('ix_access_logs_entity_id_timestamp', 'entity_id', 'timestamp'),
+        Index('ix_access_logs_action_timestamp', 'action', 'timestamp'),
+        Index('ix_access_logs_rfid_id_timestamp', 'rfid_id', 'timestamp'),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
-    entity_id = Column(Integer, ForeignKey('entities.id'), nullable=True, index=True)
-    action = Column(String(50), nullable=False, index=True)
-    rfid_id = Column(String(64), nullable=True, index=True)
-    timestamp = Column(DateTime(timezone=True), server_default=func.now(), index=True)
+    entity_id = Column(Integer, ForeignKey('entities.id'), nullable=True)
+    action = Column(String(50), nullable=False)
+    rfid_id = Column(String(64), nullable=True)
+    # Python-Default statt nur server_default: SQLite speichert dann jeden Zeitstempel
+    # einheitlich mit Mikrosekunden, sodass Textvergleich und Zeitfolge übereinstimmen
+    timestamp = Column(DateTime(timezone=True), default=_utc_now, server_default=func.now(), index=True)
 
     # Relationships
     entity = relationship('Entity', back_populates='logs')
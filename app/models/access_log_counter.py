@@ -0,0 +1,49 @@
+"""
+AccessLogCounter Database Model
+Inkrementell gepflegte Zähler für Log-Statistiken.
+"""
+from sqlalchemy import Column, Integer, String, DateTime, UniqueConstraint
+from ..database import Base
+
+
+class AccessLogCounter(Base):
+    """
+    AccessLogCounter Model - Zähler je Zeit-Bucket.
+
+    Wird in derselben Transaktion wie jeder AccessLog-Insert erhöht, damit
+    Statistiken nur Buckets statt Roh-Logs lesen. Zeilen mit door = ''
+    zählen Logs; Zeilen mit gesetzter door zählen Türöffnungen durch Scans.
+
+    Fehlende Werte werden als 0 bzw. '' gespeichert (statt NULL), damit der
+    Unique-Constraint für das Upsert greift.
+
+    Attributes:
+        id: Eindeutige ID
+        granularity: 'hour' oder 'day'
+        bucket_start: Beginn des Buckets (UTC, naiv)
+        entity_id: Entity-ID (0 = keine)
+        action: Art des Zugriffs
+        door: Geöffnete Tür ('' = Zähler für Logs)
+        rfid_id: RFID, nur bei unbekannten Tags gesetzt ('' sonst)
+        count: Anzahl
+    """
+    __tablename__ = 'access_log_counters'
+    __table_args__ = (
+        UniqueConstraint(
+            'granularity', 'bucket_start', 'entity_id', 'action', 'door', 'rfid_id',
+            name='uq_access_log_counters_key'
+        ),
+    )
+
+    id = Column(Integer, primary_key=True)
+    granularity = Column(String(4), nullable=False)
+    bucket_start = Column(DateTime, nullable=False)
+    entity_id = Column(Integer, nullable=False, default=0)
+    action = Column(String(50), nullable=False)
+    door = Column(String(50), nullable=False, default='')
+    rfid_id = Column(String(64), nullable=False, default='')
+    count = Column(Integer, nullable=False, default=0)
+
+    def __repr__(self):
+        return (f"<AccessLogCounter({self.granularity} {self.bucket_start}, entity_id={self.entity_id}, "
+                f"action='{self.action}', door='{self.door}', count={self.count})>")
@@ -0,0 +1,38 @@
+"""
+AccessLogDaily Database Model
+Tageszähler für AccessLogs, die aus der Roh-Tabelle verdichtet wurden.
+"""
+from sqlalchemy import Column, Integer, String, Date, Index
+from ..database import Base
+
+
+class AccessLogDaily(Base):
+    """
+    AccessLogDaily Model - verdichtete Zugriffsprotokolle.
+
+    Jede Zeile zählt die Logs eines Tages (UTC) mit gleicher Entity,
+    RFID und Aktion. Ein Log steht entweder noch in access_logs oder ist
+    hier gezählt, nie in beiden.
+
+    Attributes:
+        id: Eindeutige ID
+        day: Tag der Zugriffe (UTC)
+        entity_id: Entity-ID (ohne Fremdschlüssel, Zähler bleiben nach dem Löschen der Entity)
+        rfid_id: RFID-Nummer
+        action: Art des Zugriffs
+        count: Anzahl der Logs
+    """
+    __tablename__ = 'access_log_daily'
+    __table_args__ = (
+        Index('ix_access_log_daily_key', 'day', 'entity_id', 'rfid_id', 'action'),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    day = Column(Date, nullable=False)
+    entity_id = Column(Integer, nullable=True, index=True)
+    rfid_id = Column(String(64), nullable=True)
+    action = Column(String(50), nullable=False)
+    count = Column(Integer, nullable=False, default=0)
+
+    def __repr__(self):
+        return f"<AccessLogDaily(day={self.day}, entity_id={self.entity_id}, action='{self.action}', count={self.count})>"
@@ -0,0 +1,36 @@
+"""
+AuditEvent Database Model
+Protokolliert Admin-Zugriffe getrennt von den Zugriffen der Futterstationen.
+"""
+from sqlalchemy import Column, Integer, String, DateTime, Index
+from ..database import Base
+
+
+class AuditEvent(Base):
+    """
+    AuditEvent Model - Audit-Trail der Verwaltungs-API.
+
+    Wird gepuffert vom AuditTrail geschrieben; welche Zugriffe hier
+    landen, bestimmt Settings.audit.policy.
+
+    Attributes:
+        id: Eindeutige ID
+        timestamp: Zeitpunkt des Zugriffs (UTC)
+        resource: Art der Ressource (z.B. 'entity')
+        resource_id: ID der Ressource (ohne Fremdschlüssel, Events bleiben nach dem Löschen)
+        action: Art des Zugriffs (read, create, update, delete)
+    """
+    __tablename__ = 'audit_events'
+    __table_args__ = (
+        Index('ix_audit_events_resource_timestamp', 'resource', 'resource_id', 'timestamp'),
+    )
+
+    id = Column(Integer, primary_key=True)
+    timestamp = Column(DateTime(timezone=True), nullable=False, index=True)
+    resource = Column(String(50), nullable=False)
+    resource_id = Column(Integer, nullable=True)
+    action = Column(String(50), nullable=False)
+
+    def __repr__(self):
+        return (f"<AuditEvent(id={self.id}, {self.action} {self.resource}/{self.resource_id}, "
+                f"timestamp={self.timestamp})>")
@@ -18,6 +18,7 @@ class DoorSetting(Base):
         max_angle: Maximaler Servo-Winkel in Grad
         min_pulse: Minimale PWM-Pulsbreite in Sekunden
         max_pulse: Maximale PWM-Pulsbreite in Sekunden
+        station: Futterstelle (Reader), die die Tür auslöst; None = alle
     """
     __tablename__ = 'door_settings'
 
@@ -28,6 +29,7 @@ class DoorSetting(Base):
     max_angle = Column(Float, nullable=False)
     min_pulse = Column(Float, nullable=False, default=0.0005)
     max_pulse = Column(Float, nullable=False, default=0.0025)
+    station = Column(String(50), nullable=True, index=True)
 
     def __repr__(self):
         return f"<DoorSetting(id={self.id}, door_name='{self.door_name}', servo_pin={self.servo_pin})>"
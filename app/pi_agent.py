@@ -1,227 +1,77 @@
+import asyncio
 import logging
 import signal
-import sys
-import threading
-from time import sleep, time
-from typing import Dict, Optional
+from functools import partial
+from pathlib import Path
 
-import requests
-
-# Importieren Sie hier Ihre KORRIGIERTE ServoController Klasse
-from .hardware import RFIDReader, ServoController
+from .agent import DEFAULT_STATION, AgentRuntime, ApiClient, EmbeddedTransport, Metrics
+from .hardware import RFIDReader
 
 logging.basicConfig(level=logging.INFO)
 LOGGER = logging.getLogger("pi_agent")
 
+# "http": API über API_BASE (Server auf einem anderen Rechner oder eigener Prozess)
+# "embedded": Services direkt auf der lokalen Datenbank aufrufen (Einzel-Pi, kein HTTP)
+AGENT_TRANSPORT = "http"
 API_BASE = "http://localhost:8080"
 CONFIG_RELOAD_INTERVAL = 10
-
-
-def fetch_door_settings() -> Dict[str, dict]:
-    """Lädt Türkonfigurationen von der API."""
-    try:
-        resp = requests.get(f"{API_BASE}/settings", timeout=5)
-        resp.raise_for_status()
-        data = resp.json()
-        settings_map = {}
-        for item in data:
-            settings_map[item["door_name"]] = item
-        return settings_map
-    except requests.RequestException as exc:
-        LOGGER.error("Failed to fetch door settings: %s", exc)
-        return {}
-
-
-def fetch_entities() -> dict:
-    try:
-        resp = requests.get(f"{API_BASE}/entities", timeout=5)
-        resp.raise_for_status()
-        return {entity["rfid_id"]: entity for entity in resp.json()}
-    except requests.RequestException as exc:
-        LOGGER.error("Failed to fetch entities: %s", exc)
-        return {}
-
-
-def fetch_pending_door_values() -> Dict[str, float]:
-    try:
-        resp = requests.get(f"{API_BASE}/system-settings", timeout=5)
-        resp.raise_for_status()
-        data = resp.json()
-        return data.get("pending_door_values", {})
-    except requests.RequestException as exc:
-        LOGGER.error("Failed to fetch pending door values: %s", exc)
-        return {}
-
-
-def log_access(entity_id: Optional[int], action: str, rfid_id: Optional[str] = None):
-    try:
-        payload = {"entity_id": entity_id, "action": action}
-        if rfid_id:
-            payload["rfid_id"] = rfid_id
-        requests.post(f"{API_BASE}/logs", json=payload, timeout=5)
-    except requests.RequestException as exc:
-        LOGGER.warning("Failed to post access log: %s", exc)
-
-
-def reload_servos_if_needed(current_settings: Dict[str, dict],
-                            servos: Dict[str, ServoController]) -> tuple[Dict[str, dict], Dict[str, ServoController]]:
-    new_settings = fetch_door_settings()
-    if not new_settings:
-        LOGGER.warning("Could not reload settings, keeping current configuration")
-        return current_settings, servos
-
-    if new_settings == current_settings:
-        return current_settings, servos
-
-    LOGGER.info("Servo configuration changed, reloading controllers")
-
-    for door_name, servo in servos.items():
-        try:
-            servo.close()
-        except Exception as exc:
-            LOGGER.warning(f"Error closing servo for {door_name}: {exc}")
-
-    sleep(0.5)
-
-    new_servos = {}
-    for door_name, cfg in new_settings.items():
-        try:
-            # WICHTIG: Sichere Defaults verwenden (0 statt -90/90)
-            # Damit der Servo bei DB-Fehler nicht wild ausschlägt.
-            min_angle = cfg.get("min_angle", 0)
-            max_angle = cfg.get("max_angle", 0)
-
-            new_servos[door_name] = ServoController(
-                pin=cfg["servo_pin"],
-                min_angle=min_angle,
-                max_angle=max_angle,
-                min_pulse=cfg.get("min_pulse", 0.0005),
-                max_pulse=cfg.get("max_pulse", 0.0025)
-            )
-            # Initial schließen
-            new_servos[door_name].move_to_max()
-            LOGGER.info(f"Reloaded '{door_name}' (Pin {cfg['servo_pin']}): Open={min_angle}°, Closed={max_angle}°")
-        except Exception as exc:
-            LOGGER.error("Failed to initialize servo '%s': %s", door_name, exc)
-
-    return new_settings, new_servos
-
-
-def operate_door(servo: ServoController, door_name: str, seconds: float):
-    """
-    Logik:
-    move_to_min() -> Öffnen (Zielwinkel: min_angle aus Config)
-    move_to_max() -> Schließen (Zielwinkel: max_angle aus Config)
-    """
-    try:
-        if seconds <= 0:
-            LOGGER.info("%s: Skipping (value=%.2f seconds, no opening)", door_name, seconds)
-            return
-
-        LOGGER.info("Opening %s for %.2f seconds", door_name, seconds)
-        # HIER WIRD GEÖFFNET
-        servo.move_to_min()
-        sleep(seconds)
-
-        LOGGER.info("Closing %s", door_name)
-        # HIER WIRD GESCHLOSSEN
-        servo.move_to_max()
-    except Exception as exc:
-        LOGGER.error("Error operating door %s: %s", door_name, exc)
+ENTITY_REFRESH_INTERVAL = 30
+POLL_INTERVAL = 0.2
+# Ein Eintrag je Futterstelle. "station" entspricht DoorSetting.station;
+# Türen ohne Station werden von jedem Reader ausgelöst.
+# irq_pin: GPIO-Pin (BCM) am IRQ-Ausgang des MFRC522; None = Polling alle POLL_INTERVAL Sekunden
+READERS = [
+    {"station": DEFAULT_STATION, "spi_bus": 0, "spi_device": 0, "irq_pin": None},
+    # {"station": "station_2", "spi_bus": 0, "spi_device": 1, "pin_rst": 25, "irq_pin": 24},
+]
+# Kurzer Timeout: Auflösung unbekannter Tags darf den Scan nicht lange blockieren
+SCAN_RESOLVE_TIMEOUT = 1.0
+# Anwesenheit: Lücken bis 1s überbrücken, erneute Ankunft erst 5s nach dem Weggang
+PRESENCE_HOLD_OFF = 1.0
+PRESENCE_REARM = 5.0
+# Lokaler Prometheus-Endpunkt http://127.0.0.1:<port>/metrics; None = aus
+METRICS_PORT = 9105
+OUTBOX_PATH = Path(__file__).resolve().parent.parent / "agent_outbox.db"
+# Letzter bekannter Konfigurationsstand für den Start ohne erreichbare API
+SNAPSHOT_PATH = Path(__file__).resolve().parent.parent / "agent_snapshot.json"
+
+
+async def run_agent():
+    metrics = Metrics()
+    if AGENT_TRANSPORT == "embedded":
+        api = EmbeddedTransport(metrics=metrics)
+    else:
+        api = ApiClient(API_BASE, metrics=metrics)
+    LOGGER.info("Using %r", api)
+
+    runtime = AgentRuntime(
+        api=api,
+        outbox_path=OUTBOX_PATH,
+        readers={
+            cfg["station"]: partial(RFIDReader, **{key: value for key, value in cfg.items() if key != "station"})
+            for cfg in READERS
+        },
+        poll_interval=POLL_INTERVAL,
+        config_reload_interval=CONFIG_RELOAD_INTERVAL,
+        entity_refresh_interval=ENTITY_REFRESH_INTERVAL,
+        scan_resolve_timeout=SCAN_RESOLVE_TIMEOUT,
+        presence_hold_off=PRESENCE_HOLD_OFF,
+        presence_rearm=PRESENCE_REARM,
+        metrics=metrics,
+        metrics_port=METRICS_PORT,
+        snapshot_path=SNAPSHOT_PATH
+    )
+
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(sig, runtime.stop)
+
+    await runtime.run()
 
 
 def main_loop():
-    reader = RFIDReader()
-    door_settings = fetch_door_settings()
-
-    if not door_settings:
-        LOGGER.warning("Could not load door settings from API. Retry in 3s...")
-        sleep(3)
-        main_loop()
-        return
-
-    servos = {}
-    for door_name, cfg in door_settings.items():
-        try:
-            min_angle = cfg.get("min_angle", 0)
-            max_angle = cfg.get("max_angle", 0)
-
-            servos[door_name] = ServoController(
-                pin=cfg["servo_pin"],
-                min_angle=min_angle,
-                max_angle=max_angle,
-                min_pulse=cfg.get("min_pulse", 0.0005),
-                max_pulse=cfg.get("max_pulse", 0.0025)
-            )
-            servos[door_name].move_to_max()
-            LOGGER.info(f"Initialized '{door_name}' on pin {cfg['servo_pin']}. Open={min_angle}°, Closed={max_angle}°")
-        except Exception as exc:
-            LOGGER.error("Failed to initialize servo '%s': %s", door_name, exc)
-
-    LOGGER.info("Fooder Pi agent ready. Scan RFID tags.")
-
-    def handle_sigterm(_signal, _frame):
-        LOGGER.info("Stopping agent...")
-        for door_name, servo in servos.items():
-            try:
-                servo.close()
-            except Exception:
-                pass
-        sys.exit(0)
-
-    signal.signal(signal.SIGTERM, handle_sigterm)
-    signal.signal(signal.SIGINT, handle_sigterm)
-
-    last_config_reload = time()
-
-    while True:
-        if time() - last_config_reload > CONFIG_RELOAD_INTERVAL:
-            door_settings, servos = reload_servos_if_needed(door_settings, servos)
-            last_config_reload = time()
-
-        rfid_id = reader.read_once()
-        if rfid_id is None:
-            sleep(0.2)
-            continue
-
-        entities = fetch_entities()
-        entity = entities.get(str(rfid_id))
-
-        if entity:
-            LOGGER.info("RFID %s recognized as entity ID %d", rfid_id, entity["id"])
-            log_access(entity["id"], "granted", rfid_id=str(rfid_id))
-            door_values = entity.get("door_values", {})
-        else:
-            LOGGER.warning("Unknown RFID %s", rfid_id)
-            log_access(None, "unknown", rfid_id=str(rfid_id))
-            try:
-                requests.post(f"{API_BASE}/pending-rfids", json={"rfid_id": str(rfid_id)}, timeout=5)
-            except requests.RequestException:
-                pass
-
-            door_values = fetch_pending_door_values()
-
-        # Threads starten
-        threads = []
-        for door_name, seconds in door_values.items():
-            servo = servos.get(door_name)
-            if servo is None:
-                continue
-
-            thread = threading.Thread(
-                target=operate_door,
-                args=(servo, door_name, seconds),
-                name=f"door_{door_name}"
-            )
-            thread.start()
-            threads.append(thread)
-
-        # Warten bis Bewegung fertig ist (Blocking!)
-        # Das verhindert, dass während des Öffnens schon der nächste Chip gelesen wird.
-        # Das ist gut für die Stabilität.
-        for thread in threads:
-            thread.join()
+    asyncio.run(run_agent())
 
 
 if __name__ == "__main__":
-    main_loop()
\ No newline at end of file
+    main_loop()
@@ -2,11 +2,19 @@
 Repositories Package Initialization
 Exportiert alle Repository-Klassen.
 """
-from .entity_repository import EntityRepository
-from .setting_repository import SettingRepository
-from .log_repository import LogRepository
-from .pending_rfid_repository import PendingRFIDRepository
-from .system_settings_repository import SystemSettingsRepository
-
-__all__ = ["EntityRepository", "SettingRepository", "LogRepository", "PendingRFIDRepository", "SystemSettingsRepository"]
+from .async_base import AsyncBaseRepository
+from .entity_repository import AsyncEntityRepository, EntityRepository
+from .setting_repository import AsyncSettingRepository, SettingRepository
+from .log_repository import AsyncLogRepository, LogRepository
+from .pending_rfid_repository import AsyncPendingRFIDRepository, PendingRFIDRepository
+from .system_settings_repository import AsyncSystemSettingsRepository, SystemSettingsRepository
+from .access_log_daily_repository import AsyncAccessLogDailyRepository
+from .access_log_counter_repository import AccessLogCounterRepository, AsyncAccessLogCounterRepository
+from .audit_repository import AsyncAuditRepository
 
+__all__ = [
+    "EntityRepository", "SettingRepository", "LogRepository", "PendingRFIDRepository", "SystemSettingsRepository",
+    "AsyncBaseRepository", "AsyncEntityRepository", "AsyncSettingRepository", "AsyncLogRepository",
+    "AsyncPendingRFIDRepository", "AsyncSystemSettingsRepository", "AsyncAccessLogDailyRepository",
+    "AccessLogCounterRepository", "AsyncAccessLogCounterRepository", "AsyncAuditRepository"
+]
@@ -0,0 +1,218 @@
+"""
+AccessLogCounter Repository
+Data Access Layer für die inkrementellen Log-Zähler.
+"""
+from collections import Counter
+from datetime import datetime
+from typing import List, Optional, Sequence
+from sqlalchemy import delete, func, insert, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from .async_base import AsyncBaseRepository
+from .base import UPSERT_INSERTS, BaseRepository
+from ..models.access_log_counter import AccessLogCounter
+
+# Gepflegte Bucket-Größen; Wochen werden aus Tagen summiert
+GRANULARITIES = ("hour", "day")
+KEY_COLUMNS = ("granularity", "bucket_start", "entity_id", "action", "door", "rfid_id")
+# Spalte je Statistik-Dimension
+DIMENSIONS = {
+    "entity": AccessLogCounter.entity_id,
+    "action": AccessLogCounter.action,
+    "door": AccessLogCounter.door,
+}
+
+
+def bucket_start(timestamp: datetime, granularity: str) -> datetime:
+    """Beginn des Stunden- bzw. Tages-Buckets eines Zeitstempels."""
+    if granularity == "hour":
+        return timestamp.replace(minute=0, second=0, microsecond=0)
+    return timestamp.replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+def counter_increments(params: List[dict], doors: Optional[Sequence[Optional[List[str]]]] = None) -> List[dict]:
+    """
+    Fasst Log-Zeilen zu Zähler-Inkrementen zusammen.
+
+    Args:
+        params: Log-Zeilen mit gesetztem timestamp (naiv, UTC)
+        doors: Je Zeile die geöffneten Türen (optional, nur bei Scans)
+
+    Returns:
+        Zeilen für access_log_counters mit count = Inkrement
+    """
+    counts: Counter = Counter()
+    for index, row in enumerate(params):
+        entity_id = row.get("entity_id") or 0
+        action = row["action"]
+        # RFID nur bei unbekannten Tags; erkannte Tags zählt die Entity
+        rfid_id = (row.get("rfid_id") or "") if action == "unknown" else ""
+        row_doors = doors[index] if doors else None
+        for granularity in GRANULARITIES:
+            start = bucket_start(row["timestamp"], granularity)
+            counts[(granularity, start, entity_id, action, "", rfid_id)] += 1
+            for door in row_doors or ():
+                counts[(granularity, start, entity_id, action, door, "")] += 1
+    return [dict(zip(KEY_COLUMNS, key), count=count) for key, count in counts.items()]
+
+
+def _upsert_statement(dialect_name: str):
+    """Konstantes Upsert für executemany (wird von SQLAlchemy nur einmal kompiliert)."""
+    insert = UPSERT_INSERTS.get(dialect_name)
+    if insert is None:
+        return None
+    statement = insert(AccessLogCounter)
+    return statement.on_conflict_do_update(
+        index_elements=list(KEY_COLUMNS),
+        set_={"count": AccessLogCounter.count + statement.excluded.count},
+    )
+
+
+def _update_statement(increment: dict):
+    statement = update(AccessLogCounter).values(count=AccessLogCounter.count + increment["count"])
+    for column in KEY_COLUMNS:
+        statement = statement.where(getattr(AccessLogCounter, column) == increment[column])
+    return statement
+
+
+class AccessLogCounterRepository(BaseRepository[AccessLogCounter]):
+    """Repository für AccessLogCounter-Datenbankoperationen."""
+
+    def __init__(self):
+        super().__init__(AccessLogCounter)
+
+    def increment(self, db: Session, params: List[dict], doors: Optional[Sequence[Optional[List[str]]]] = None) -> None:
+        """
+        Erhöht die Zähler für neu geschriebene Logs (ohne Commit, Transaktion des Aufrufers).
+
+        Dialekte ohne Upsert erhöhen per UPDATE und legen fehlende Zeilen in
+        einem Savepoint an; kommt ein paralleler Schreiber mit dem INSERT
+        zuvor (IntegrityError), wird das UPDATE wiederholt.
+
+        Args:
+            db: Datenbank-Session
+            params: Geschriebene Log-Zeilen (mit timestamp)
+            doors: Je Zeile die geöffneten Türen (optional)
+        """
+        increments = counter_increments(params, doors)
+        if not increments:
+            return
+        statement = _upsert_statement(db.get_bind().dialect.name)
+        if statement is not None:
+            db.execute(statement, increments)
+            return
+        for increment in increments:
+            while db.execute(_update_statement(increment)).rowcount == 0:
+                try:
+                    with db.begin_nested():
+                        db.execute(insert(AccessLogCounter), [increment])
+                    break
+                except IntegrityError:
+                    # Zeile wurde parallel angelegt: erneut per UPDATE erhöhen
+                    continue
+
+
+class AsyncAccessLogCounterRepository(AsyncBaseRepository[AccessLogCounter]):
+    """Async-Repository für AccessLogCounter-Datenbankoperationen."""
+
+    def __init__(self):
+        super().__init__(AccessLogCounter)
+
+    async def increment(
+        self, db: AsyncSession, params: List[dict], doors: Optional[Sequence[Optional[List[str]]]] = None
+    ) -> None:
+        """Erhöht die Zähler für neu geschriebene Logs (siehe AccessLogCounterRepository.increment)."""
+        increments = counter_increments(params, doors)
+        if not increments:
+            return
+        statement = _upsert_statement(db.get_bind().dialect.name)
+        if statement is not None:
+            await db.execute(statement, increments)
+            return
+        for increment in increments:
+            while (await db.execute(_update_statement(increment))).rowcount == 0:
+                try:
+                    async with db.begin_nested():
+                        await db.execute(insert(AccessLogCounter), [increment])
+                    break
+                except IntegrityError:
+                    # Zeile wurde parallel angelegt: erneut per UPDATE erhöhen
+                    continue
+
+    async def get_counts(
+        self,
+        db: AsyncSession,
+        granularity: str,
+        dimension: str,
+        since: datetime,
+        until: datetime,
+        entity_id: Optional[int] = None,
+        action: Optional[str] = None
+    ) -> list:
+        """
+        Summiert Zähler je Bucket und Dimension im Bereich [since, until).
+
+        Args:
+            db: Datenbank-Session
+            granularity: 'hour' oder 'day'
+            dimension: 'entity', 'action' oder 'door'
+            since: Erster Bucket (inklusive)
+            until: Ende des Bereichs (exklusive)
+            entity_id: Optional - Filter nach Entity-ID
+            action: Optional - Filter nach Aktion
+
+        Returns:
+            Zeilen mit bucket_start, key, count
+        """
+        key = DIMENSIONS[dimension]
+        query = (
+            select(AccessLogCounter.bucket_start, key.label("key"), func.sum(AccessLogCounter.count).label("count"))
+            .where(AccessLogCounter.granularity == granularity)
+            .where(AccessLogCounter.bucket_start >= since)
+            .where(AccessLogCounter.bucket_start < until)
+            # Türzeilen zählen Öffnungen, alle anderen Logs
+            .where(AccessLogCounter.door != "" if dimension == "door" else AccessLogCounter.door == "")
+            .group_by(AccessLogCounter.bucket_start, key)
+            .order_by(AccessLogCounter.bucket_start, key)
+        )
+        if entity_id is not None:
+            query = query.where(AccessLogCounter.entity_id == entity_id)
+        if action is not None:
+            query = query.where(AccessLogCounter.action == action)
+        result = await db.execute(query)
+        return list(result)
+
+    async def get_top_unknown(self, db: AsyncSession, since: datetime, until: datetime, limit: int) -> list:
+        """
+        Häufigste unbekannte RFIDs im Bereich [since, until) (Tages-Zähler).
+
+        Returns:
+            Zeilen mit rfid_id, count, last_seen_day
+        """
+        result = await db.execute(
+            select(
+                AccessLogCounter.rfid_id,
+                func.sum(AccessLogCounter.count).label("count"),
+                func.max(AccessLogCounter.bucket_start).label("last_seen_day"),
+            )
+            .where(AccessLogCounter.granularity == "day")
+            .where(AccessLogCounter.bucket_start >= since)
+            .where(AccessLogCounter.bucket_start < until)
+            .where(AccessLogCounter.action == "unknown")
+            .where(AccessLogCounter.door == "")
+            .where(AccessLogCounter.rfid_id != "")
+            .group_by(AccessLogCounter.rfid_id)
+            .order_by(func.sum(AccessLogCounter.count).desc(), AccessLogCounter.rfid_id)
+            .limit(limit)
+        )
+        return list(result)
+
+    async def delete_before(self, db: AsyncSession, granularity: str, before: datetime) -> int:
+        """Löscht Zähler einer Granularität vor einem Zeitpunkt (ohne Commit)."""
+        result = await db.execute(
+            delete(AccessLogCounter)
+            .where(AccessLogCounter.granularity == granularity)
+            .where(AccessLogCounter.bucket_start < before)
+        )
+        return result.rowcount
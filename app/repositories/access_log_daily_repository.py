@@ -0,0 +1,64 @@
+"""
+AccessLogDaily Repository
+Data Access Layer für die verdichteten Tageszähler der AccessLogs.
+"""
+from datetime import date
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from .async_base import AsyncBaseRepository
+from ..models.access_log_daily import AccessLogDaily
+
+# (day, entity_id, rfid_id, action)
+DailyKey = Tuple[date, Optional[int], Optional[str], str]
+
+
+class AsyncAccessLogDailyRepository(AsyncBaseRepository[AccessLogDaily]):
+    """Async-Repository für AccessLogDaily-Datenbankoperationen."""
+
+    def __init__(self):
+        super().__init__(AccessLogDaily)
+
+    async def add_counts(self, db: AsyncSession, counts: Dict[DailyKey, int]) -> None:
+        """
+        Addiert Zählerstände auf bestehende Tageszeilen oder legt sie an (ohne Commit).
+
+        entity_id und rfid_id können NULL sein; der Abgleich nutzt daher
+        IS NOT DISTINCT FROM statt eines Unique-Constraints.
+
+        Args:
+            db: Datenbank-Session
+            counts: Anzahl je (day, entity_id, rfid_id, action)
+        """
+        for (day, entity_id, rfid_id, action), count in counts.items():
+            result = await db.execute(
+                update(AccessLogDaily)
+                .where(AccessLogDaily.day == day)
+                .where(AccessLogDaily.entity_id.is_not_distinct_from(entity_id))
+                .where(AccessLogDaily.rfid_id.is_not_distinct_from(rfid_id))
+                .where(AccessLogDaily.action == action)
+                .values(count=AccessLogDaily.count + count)
+            )
+            if result.rowcount == 0:
+                db.add(AccessLogDaily(day=day, entity_id=entity_id, rfid_id=rfid_id, action=action, count=count))
+        await db.flush()
+
+    async def get_counts(
+        self,
+        db: AsyncSession,
+        since: date,
+        until: date,
+        entity_id: Optional[int] = None,
+        rfid_id: Optional[str] = None,
+        action: Optional[str] = None
+    ) -> List[AccessLogDaily]:
+        """Gibt die Tageszeilen im Bereich [since, until] zurück (optional gefiltert)."""
+        query = select(AccessLogDaily).where(AccessLogDaily.day >= since).where(AccessLogDaily.day <= until)
+        if entity_id is not None:
+            query = query.where(AccessLogDaily.entity_id == entity_id)
+        if rfid_id is not None:
+            query = query.where(AccessLogDaily.rfid_id == rfid_id)
+        if action is not None:
+            query = query.where(AccessLogDaily.action == action)
+        result = await db.scalars(query)
+        return list(result)
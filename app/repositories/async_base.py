@@ -0,0 +1,73 @@
+"""
+Async Base Repository
+Asynchrone Variante von BaseRepository für AsyncSession.
+"""
+from typing import Generic, TypeVar, Type, List, Optional
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from ..database import Base
+
+ModelType = TypeVar("ModelType", bound=Base)
+
+
+class AsyncBaseRepository(Generic[ModelType]):
+    """
+    Generisches Repository für CRUD-Operationen mit AsyncSession.
+
+    Gleiche Semantik wie BaseRepository; Abfragen laufen über select(),
+    da AsyncSession kein query() kennt.
+
+    Attributes:
+        model: SQLAlchemy-Modell-Klasse
+    """
+
+    def __init__(self, model: Type[ModelType]):
+        self.model = model
+
+    async def get_all(self, db: AsyncSession) -> List[ModelType]:
+        """Gibt alle Einträge zurück."""
+        result = await db.scalars(select(self.model))
+        return list(result)
+
+    async def get_by_id(self, db: AsyncSession, id: int) -> Optional[ModelType]:
+        """Gibt einen Eintrag anhand der ID zurück."""
+        return await db.get(self.model, id)
+
+    async def create(self, db: AsyncSession, obj_data: dict, commit: bool = True) -> ModelType:
+        """
+        Erstellt einen neuen Eintrag.
+
+        Mit commit=False wird nur geflusht, damit mehrere Schreibvorgänge
+        in einer gemeinsamen Transaktion des Aufrufers landen.
+        """
+        db_obj = self.model(**obj_data)
+        db.add(db_obj)
+        if commit:
+            await db.commit()
+            await db.refresh(db_obj)
+        else:
+            await db.flush()
+        return db_obj
+
+    async def update(self, db: AsyncSession, id: int, obj_data: dict) -> Optional[ModelType]:
+        """Aktualisiert einen existierenden Eintrag."""
+        db_obj = await self.get_by_id(db, id)
+        if not db_obj:
+            return None
+
+        for key, value in obj_data.items():
+            setattr(db_obj, key, value)
+
+        await db.commit()
+        await db.refresh(db_obj)
+        return db_obj
+
+    async def delete(self, db: AsyncSession, id: int) -> Optional[ModelType]:
+        """Löscht einen Eintrag."""
+        db_obj = await self.get_by_id(db, id)
+        if not db_obj:
+            return None
+
+        await db.delete(db_obj)
+        await db.commit()
+        return db_obj
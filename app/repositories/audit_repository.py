@@ -0,0 +1,59 @@
+"""
+Audit Repository
+Data Access Layer für den Audit-Trail.
+"""
+from typing import List, Optional
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from .async_base import AsyncBaseRepository
+from ..models.audit_event import AuditEvent
+
+
+class AsyncAuditRepository(AsyncBaseRepository[AuditEvent]):
+    """Async-Repository für AuditEvent-Datenbankoperationen."""
+
+    def __init__(self):
+        super().__init__(AuditEvent)
+
+    async def bulk_insert(self, db: AsyncSession, rows: List[dict]) -> int:
+        """
+        Schreibt mehrere Events mit einem executemany-INSERT (ohne Commit).
+
+        Args:
+            db: Datenbank-Session
+            rows: Events mit timestamp, resource, resource_id, action
+
+        Returns:
+            Anzahl geschriebener Events
+        """
+        if not rows:
+            return 0
+        await db.execute(insert(AuditEvent), rows)
+        return len(rows)
+
+    async def get_recent(
+        self,
+        db: AsyncSession,
+        limit: int = 100,
+        resource: Optional[str] = None,
+        resource_id: Optional[int] = None
+    ) -> List[AuditEvent]:
+        """
+        Gibt die neuesten Events zurück.
+
+        Args:
+            db: Datenbank-Session
+            limit: Maximale Anzahl Einträge
+            resource: Optional - Filter nach Ressource
+            resource_id: Optional - Filter nach Ressourcen-ID
+
+        Returns:
+            Liste von AuditEvent-Einträgen (neueste zuerst)
+        """
+        query = select(AuditEvent)
+        if resource is not None:
+            query = query.where(AuditEvent.resource == resource)
+        if resource_id is not None:
+            query = query.where(AuditEvent.resource_id == resource_id)
+        result = await db.scalars(query.order_by(AuditEvent.timestamp.desc(), AuditEvent.id.desc()).limit(limit))
+        return list(result)
@@ -3,11 +3,18 @@ Base Repository
 Abstrakte Basis-Klasse für alle Repositories mit generischen CRUD-Operationen.
 """
 from typing import Generic, TypeVar, Type, List, Optional
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.orm import Session
 from ..database import Base
 
 ModelType = TypeVar("ModelType", bound=Base)
 
+# Dialekte mit INSERT ... ON CONFLICT DO UPDATE
+UPSERT_INSERTS = {
+    "sqlite": sqlite.insert,
+    "postgresql": postgresql.insert,
+}
+
 
 class BaseRepository(Generic[ModelType]):
     """
@@ -28,12 +35,20 @@ class BaseRepository(Generic[ModelType]):
         """Gibt einen Eintrag anhand der ID zurück."""
         return db.query(self.model).filter(self.model.id == id).first()
 
-    def create(self, db: Session, obj_data: dict) -> ModelType:
-        """Erstellt einen neuen Eintrag."""
+    def create(self, db: Session, obj_data: dict, commit: bool = True) -> ModelType:
+        """
+        Erstellt einen neuen Eintrag.
+
+        Mit commit=False wird nur geflusht, damit mehrere Schreibvorgänge
+        in einer gemeinsamen Transaktion des Aufrufers landen.
+        """
         db_obj = self.model(**obj_data)
         db.add(db_obj)
-        db.commit()
-        db.refresh(db_obj)
+        if commit:
+            db.commit()
+            db.refresh(db_obj)
+        else:
+            db.flush()
         return db_obj
 
     def update(self, db: Session, id: int, obj_data: dict) -> Optional[ModelType]:
@@ -3,7 +3,10 @@ Entity Repository
 Data Access Layer für Entity-Operationen.
 """
 from typing import Optional
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
+from .async_base import AsyncBaseRepository
 from .base import BaseRepository
 from ..models.entity import Entity
 
@@ -40,3 +43,19 @@ class EntityRepository(BaseRepository[Entity]):
         """
         return db.query(Entity).filter(Entity.rfid_id == rfid_id).count() > 0
 
+
+
+class AsyncEntityRepository(AsyncBaseRepository[Entity]):
+    """Async-Repository für Entity-Datenbankoperationen."""
+
+    def __init__(self):
+        super().__init__(Entity)
+
+    async def get_by_rfid(self, db: AsyncSession, rfid_id: str) -> Optional[Entity]:
+        """Findet eine Entity anhand der RFID-ID."""
+        return await db.scalar(select(Entity).where(Entity.rfid_id == rfid_id).limit(1))
+
+    async def exists_rfid(self, db: AsyncSession, rfid_id: str) -> bool:
+        """Prüft, ob eine RFID-ID bereits existiert."""
+        count = await db.scalar(select(func.count()).select_from(Entity).where(Entity.rfid_id == rfid_id))
+        return count > 0
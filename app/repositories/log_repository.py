@@ -2,18 +2,67 @@
 Log Repository
 Data Access Layer für AccessLog-Operationen.
 """
-from typing import List, Optional
-from datetime import datetime
+from typing import Any, AsyncIterator, List, Optional, Sequence, Tuple
+from datetime import datetime, timezone
+from sqlalchemy import String, delete, func, insert, select, tuple_, type_coerce
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
+from .access_log_counter_repository import AccessLogCounterRepository, AsyncAccessLogCounterRepository
+from .async_base import AsyncBaseRepository
 from .base import BaseRepository
 from ..models.access_log import AccessLog
 
 
+def _insert_params(rows: List[dict]) -> List[dict]:
+    """
+    Einheitliche INSERT-Parameter; fehlende Zeitstempel = aktuelle UTC-Zeit.
+
+    Zusätzliche Schlüssel (z.B. 'doors' für die Zähler) werden verworfen.
+    """
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    params = []
+    for row in rows:
+        timestamp = row.get("timestamp")
+        if timestamp is None:
+            timestamp = now
+        elif timestamp.tzinfo is not None:
+            timestamp = timestamp.astimezone(timezone.utc).replace(tzinfo=None)
+        params.append({
+            "entity_id": row.get("entity_id"),
+            "action": row["action"],
+            "rfid_id": row.get("rfid_id"),
+            "timestamp": timestamp,
+        })
+    return params
+
+
+def _doors(rows: List[dict]) -> List[Optional[List[str]]]:
+    """Geöffnete Türen je Zeile (nur Scans liefern 'doors')."""
+    return [row.get("doors") for row in rows]
+
+
 class LogRepository(BaseRepository[AccessLog]):
-    """Repository für AccessLog-Datenbankoperationen."""
+    """
+    Repository für AccessLog-Datenbankoperationen.
+
+    Jeder Insert erhöht in derselben Transaktion die Statistik-Zähler
+    (access_log_counters).
+    """
 
     def __init__(self):
         super().__init__(AccessLog)
+        self.counter_repository = AccessLogCounterRepository()
+
+    def create(self, db: Session, obj_data: dict, commit: bool = True) -> AccessLog:
+        """
+        Erstellt einen Log-Eintrag und erhöht die Zähler.
+
+        Der Zeitstempel wird hier gesetzt (statt per server_default), damit
+        Log und Zähler denselben Bucket verwenden.
+        """
+        params = _insert_params([obj_data])
+        self.counter_repository.increment(db, params, _doors([obj_data]))
+        return super().create(db, params[0], commit=commit)
 
     def get_by_entity(self, db: Session, entity_id: int, limit: int = 100) -> List[AccessLog]:
         """
@@ -90,3 +139,280 @@ class LogRepository(BaseRepository[AccessLog]):
                 .order_by(AccessLog.timestamp.desc())
                 .all())
 
+
+    def bulk_insert(self, db: Session, rows: List[dict], commit: bool = True) -> int:
+        """
+        Schreibt mehrere Logs mit einem executemany-INSERT.
+
+        Es werden keine ORM-Objekte erzeugt und nichts zurückgelesen.
+        Fehlende Zeitstempel werden mit der aktuellen UTC-Zeit belegt,
+        damit alle Zeilen dieselben Parameter haben.
+
+        Args:
+            db: Datenbank-Session
+            rows: Log-Daten (entity_id, action, rfid_id, optional timestamp)
+            commit: False, um nur auszuführen (Transaktion des Aufrufers)
+
+        Returns:
+            Anzahl geschriebener Einträge
+        """
+        if not rows:
+            return 0
+
+        params = _insert_params(rows)
+        db.execute(insert(AccessLog), params)
+        self.counter_repository.increment(db, params, _doors(rows))
+        if commit:
+            db.commit()
+        return len(params)
+
+
+class AsyncLogRepository(AsyncBaseRepository[AccessLog]):
+    """Async-Repository für AccessLog-Datenbankoperationen (Zähler wie in LogRepository)."""
+
+    def __init__(self):
+        super().__init__(AccessLog)
+        self.counter_repository = AsyncAccessLogCounterRepository()
+
+    async def create(self, db: AsyncSession, obj_data: dict, commit: bool = True) -> AccessLog:
+        """Erstellt einen Log-Eintrag und erhöht die Zähler (siehe LogRepository.create)."""
+        params = _insert_params([obj_data])
+        await self.counter_repository.increment(db, params, _doors([obj_data]))
+        return await super().create(db, params[0], commit=commit)
+
+    async def get_by_entity(self, db: AsyncSession, entity_id: int, limit: int = 100) -> List[AccessLog]:
+        """Gibt alle Logs einer Entity zurück (neueste zuerst)."""
+        result = await db.scalars(
+            select(AccessLog)
+            .where(AccessLog.entity_id == entity_id)
+            .order_by(AccessLog.timestamp.desc())
+            .limit(limit)
+        )
+        return list(result)
+
+    async def get_by_action(self, db: AsyncSession, action: str, limit: int = 100) -> List[AccessLog]:
+        """Gibt alle Logs mit einer bestimmten Aktion zurück (neueste zuerst)."""
+        result = await db.scalars(
+            select(AccessLog)
+            .where(AccessLog.action == action)
+            .order_by(AccessLog.timestamp.desc())
+            .limit(limit)
+        )
+        return list(result)
+
+    async def get_recent(self, db: AsyncSession, limit: int = 100) -> List[AccessLog]:
+        """Gibt die neuesten Logs zurück."""
+        result = await db.scalars(select(AccessLog).order_by(AccessLog.timestamp.desc()).limit(limit))
+        return list(result)
+
+    async def get_by_date_range(
+        self,
+        db: AsyncSession,
+        start_date: datetime,
+        end_date: datetime
+    ) -> List[AccessLog]:
+        """Gibt Logs in einem Datumsbereich zurück (neueste zuerst)."""
+        result = await db.scalars(
+            select(AccessLog)
+            .where(AccessLog.timestamp >= start_date)
+            .where(AccessLog.timestamp <= end_date)
+            .order_by(AccessLog.timestamp.desc())
+        )
+        return list(result)
+
+    @staticmethod
+    def _timestamp_key(db: AsyncSession):
+        """Sortierschlüssel für timestamp, wie ihn die Datenbank vergleicht."""
+        if db.get_bind().dialect.name == "sqlite":
+            # SQLite vergleicht den gespeicherten Text; der Cursor übernimmt ihn unverändert.
+            # Alle Zeitstempel haben dasselbe Format mit Mikrosekunden (siehe AccessLog.timestamp),
+            # daher entspricht die Textfolge der Zeitfolge, auch gegenüber since/until
+            return type_coerce(AccessLog.timestamp, String)
+        return AccessLog.timestamp
+
+    async def get_page(
+        self,
+        db: AsyncSession,
+        limit: int,
+        before: Optional[Tuple[Any, int]] = None,
+        entity_id: Optional[int] = None,
+        action: Optional[str] = None,
+        rfid_id: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None
+    ) -> List[Tuple[AccessLog, Any]]:
+        """
+        Gibt eine Seite Logs zurück, neueste zuerst (Keyset-Pagination).
+
+        Sortiert wird nach (timestamp, id) absteigend; before setzt die
+        Abfrage hinter dem letzten Eintrag der vorigen Seite fort. Ohne
+        OFFSET kostet jede Seite gleich viel, egal wie tief geblättert wird.
+
+        Args:
+            db: Datenbank-Session
+            limit: Maximale Anzahl Einträge
+            before: (Sortierschlüssel, id) des letzten Eintrags der vorigen Seite
+            entity_id: Optional - Filter nach Entity-ID
+            action: Optional - Filter nach Aktion
+            rfid_id: Optional - Filter nach RFID
+            since: Optional - nur Logs ab diesem Zeitpunkt (inklusive, naiv UTC)
+            until: Optional - nur Logs vor diesem Zeitpunkt (exklusive, naiv UTC)
+
+        Returns:
+            Paare aus AccessLog und Sortierschlüssel (für den nächsten Aufruf)
+        """
+        key = self._timestamp_key(db)
+        query = select(AccessLog, key.label("timestamp_key"))
+        if entity_id is not None:
+            query = query.where(AccessLog.entity_id == entity_id)
+        if action is not None:
+            query = query.where(AccessLog.action == action)
+        if rfid_id is not None:
+            query = query.where(AccessLog.rfid_id == rfid_id)
+        if since is not None:
+            query = query.where(AccessLog.timestamp >= since)
+        if until is not None:
+            query = query.where(AccessLog.timestamp < until)
+        if before is not None:
+            query = query.where(tuple_(key, AccessLog.id) < tuple_(*before))
+        result = await db.execute(query.order_by(key.desc(), AccessLog.id.desc()).limit(limit))
+        return [(log, log_key) for log, log_key in result]
+
+    async def stream_rows(
+        self,
+        db: AsyncSession,
+        chunk_size: int,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None
+    ) -> AsyncIterator[Sequence[Any]]:
+        """
+        Liest Logs chronologisch in Blöcken über einen serverseitigen Cursor.
+
+        Es werden nur Spalten-Tupel gelesen, keine ORM-Objekte; im Speicher
+        liegt immer nur ein Block. Die Session bleibt bis zum Ende des
+        Durchlaufs belegt.
+
+        Args:
+            db: Datenbank-Session
+            chunk_size: Zeilen pro Block (yield_per)
+            since: Optional - nur Logs ab diesem Zeitpunkt (inklusive, naiv UTC)
+            until: Optional - nur Logs vor diesem Zeitpunkt (exklusive, naiv UTC)
+
+        Yields:
+            Blöcke von (id, timestamp, entity_id, action, rfid_id); timestamp
+            ist auf SQLite der gespeicherte Text (siehe _timestamp_key)
+        """
+        key = self._timestamp_key(db)
+        query = select(AccessLog.id, key, AccessLog.entity_id, AccessLog.action, AccessLog.rfid_id)
+        if since is not None:
+            query = query.where(AccessLog.timestamp >= since)
+        if until is not None:
+            query = query.where(AccessLog.timestamp < until)
+        query = query.order_by(key, AccessLog.id).execution_options(yield_per=chunk_size)
+
+        result = await db.stream(query)
+        try:
+            async for partition in result.partitions():
+                yield partition
+        finally:
+            await result.close()
+
+    async def bulk_insert(self, db: AsyncSession, rows: List[dict], commit: bool = True) -> int:
+        """
+        Schreibt mehrere Logs mit einem executemany-INSERT (siehe LogRepository.bulk_insert).
+
+        Returns:
+            Anzahl geschriebener Einträge
+        """
+        if not rows:
+            return 0
+
+        params = _insert_params(rows)
+        await db.execute(insert(AccessLog), params)
+        await self.counter_repository.increment(db, params, _doors(rows))
+        if commit:
+            await db.commit()
+        return len(params)
+
+    @staticmethod
+    def prepare_rows(rows: List[dict]) -> List[dict]:
+        """
+        Normalisiert Log-Zeilen für den INSERT.
+
+        Fehlende Zeitstempel werden jetzt gesetzt, nicht erst beim
+        (später) gebündelten Schreiben.
+        """
+        return _insert_params(rows)
+
+    async def insert_returning_ids(self, db: AsyncSession, params: List[dict]) -> List[int]:
+        """
+        Schreibt vorbereitete Log-Zeilen samt Zählern und gibt ihre IDs zurück (ohne Commit).
+
+        Args:
+            db: Datenbank-Session
+            params: Zeilen aus prepare_rows()
+
+        Returns:
+            IDs in der Reihenfolge von params
+        """
+        result = await db.execute(
+            insert(AccessLog).returning(AccessLog.id, sort_by_parameter_order=True), params
+        )
+        ids = list(result.scalars())
+        await self.counter_repository.increment(db, params)
+        return ids
+
+    async def get_expired(self, db: AsyncSession, cutoff: datetime, limit: int) -> list:
+        """
+        Gibt die ältesten Logs vor cutoff zurück (nur die Spalten für die Verdichtung).
+
+        Returns:
+            Zeilen mit id, timestamp, entity_id, rfid_id, action
+        """
+        result = await db.execute(
+            select(AccessLog.id, AccessLog.timestamp, AccessLog.entity_id, AccessLog.rfid_id, AccessLog.action)
+            .where(AccessLog.timestamp < cutoff)
+            .order_by(AccessLog.timestamp)
+            .limit(limit)
+        )
+        return list(result)
+
+    async def delete_by_ids(self, db: AsyncSession, ids: List[int]) -> int:
+        """Löscht Logs anhand ihrer IDs (ohne Commit) und gibt die Anzahl zurück."""
+        result = await db.execute(delete(AccessLog).where(AccessLog.id.in_(ids)))
+        return result.rowcount
+
+    async def get_oldest_timestamp(self, db: AsyncSession) -> Optional[datetime]:
+        """Zeitstempel des ältesten Roh-Logs (None bei leerer Tabelle)."""
+        return await db.scalar(select(func.min(AccessLog.timestamp)))
+
+    async def count_by_day(
+        self,
+        db: AsyncSession,
+        start: datetime,
+        end: datetime,
+        entity_id: Optional[int] = None,
+        rfid_id: Optional[str] = None,
+        action: Optional[str] = None
+    ) -> list:
+        """
+        Zählt Logs in [start, end) je Tag, Entity, RFID und Aktion.
+
+        Returns:
+            Zeilen mit day ('YYYY-MM-DD'), entity_id, rfid_id, action, count
+        """
+        day = func.date(AccessLog.timestamp).label("day")
+        query = (
+            select(day, AccessLog.entity_id, AccessLog.rfid_id, AccessLog.action, func.count().label("count"))
+            .where(AccessLog.timestamp >= start)
+            .where(AccessLog.timestamp < end)
+            .group_by(day, AccessLog.entity_id, AccessLog.rfid_id, AccessLog.action)
+        )
+        if entity_id is not None:
+            query = query.where(AccessLog.entity_id == entity_id)
+        if rfid_id is not None:
+            query = query.where(AccessLog.rfid_id == rfid_id)
+        if action is not None:
+            query = query.where(AccessLog.action == action)
+        result = await db.execute(query)
+        return list(result)
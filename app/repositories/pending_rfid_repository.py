@@ -3,9 +3,11 @@ PendingRFID Repository
 Data Access Layer für PendingRFID-Operationen.
 """
 from typing import Optional, List
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from sqlalchemy import func
-from .base import BaseRepository
+from sqlalchemy import func, select
+from .async_base import AsyncBaseRepository
+from .base import UPSERT_INSERTS, BaseRepository
 from ..models.pending_rfid import PendingRFID
 
 
@@ -28,7 +30,7 @@ class PendingRFIDRepository(BaseRepository[PendingRFID]):
         """
         return db.query(PendingRFID).filter(PendingRFID.rfid_id == rfid_id).first()
 
-    def increment_scan_count(self, db: Session, rfid_id: str) -> Optional[PendingRFID]:
+    def increment_scan_count(self, db: Session, rfid_id: str, commit: bool = True) -> Optional[PendingRFID]:
         """
         Erhöht den Scan-Counter für eine RFID.
         Aktualisiert auch last_seen.
@@ -36,6 +38,7 @@ class PendingRFIDRepository(BaseRepository[PendingRFID]):
         Args:
             db: Datenbank-Session
             rfid_id: RFID-Tag-Nummer
+            commit: False, um nur zu flushen (Transaktion des Aufrufers)
 
         Returns:
             Aktualisiertes PendingRFID oder None
@@ -44,8 +47,11 @@ class PendingRFIDRepository(BaseRepository[PendingRFID]):
         if pending:
             pending.scan_count += 1
             pending.last_seen = func.now()
-            db.commit()
-            db.refresh(pending)
+            if commit:
+                db.commit()
+                db.refresh(pending)
+            else:
+                db.flush()
         return pending
 
     def get_recent(self, db: Session, limit: int = 50) -> List[PendingRFID]:
@@ -64,3 +70,67 @@ class PendingRFIDRepository(BaseRepository[PendingRFID]):
                 .limit(limit)
                 .all())
 
+
+class AsyncPendingRFIDRepository(AsyncBaseRepository[PendingRFID]):
+    """Async-Repository für PendingRFID-Datenbankoperationen."""
+
+    def __init__(self):
+        super().__init__(PendingRFID)
+
+    async def get_by_rfid(self, db: AsyncSession, rfid_id: str) -> Optional[PendingRFID]:
+        """Findet einen PendingRFID anhand der RFID-ID."""
+        return await db.scalar(select(PendingRFID).where(PendingRFID.rfid_id == rfid_id).limit(1))
+
+    async def increment_scan_count(
+        self, db: AsyncSession, rfid_id: str, commit: bool = True
+    ) -> Optional[PendingRFID]:
+        """
+        Erhöht den Scan-Counter für eine RFID und aktualisiert last_seen.
+
+        Anders als im sync Repository wird auch ohne Commit neu geladen,
+        da last_seen sonst erst beim (synchronen) Zugriff nachgeladen würde.
+        """
+        pending = await self.get_by_rfid(db, rfid_id)
+        if pending:
+            pending.scan_count += 1
+            pending.last_seen = func.now()
+            if commit:
+                await db.commit()
+            else:
+                await db.flush()
+            await db.refresh(pending)
+        return pending
+
+    async def upsert_scan(self, db: AsyncSession, rfid_id: str, commit: bool = True) -> Optional[PendingRFID]:
+        """
+        Legt einen PendingRFID an oder erhöht dessen Counter in einem Statement.
+
+        Parallele Scans desselben unbekannten Tags laufen so nicht in den
+        Unique-Constraint auf rfid_id.
+
+        Args:
+            db: Datenbank-Session
+            rfid_id: RFID-Tag-Nummer
+            commit: False, um nur zu flushen (Transaktion des Aufrufers)
+
+        Returns:
+            PendingRFID oder None, wenn der Dialekt kein Upsert kennt
+        """
+        insert = UPSERT_INSERTS.get(db.get_bind().dialect.name)
+        if insert is None:
+            return None
+
+        statement = insert(PendingRFID).values(rfid_id=rfid_id, scan_count=1)
+        statement = statement.on_conflict_do_update(
+            index_elements=[PendingRFID.rfid_id],
+            set_={"scan_count": PendingRFID.scan_count + 1, "last_seen": func.now()},
+        ).returning(PendingRFID.id)
+        pending_id = await db.scalar(statement)
+        if commit:
+            await db.commit()
+        return await db.get(PendingRFID, pending_id, populate_existing=True)
+
+    async def get_recent(self, db: AsyncSession, limit: int = 50) -> List[PendingRFID]:
+        """Gibt die neuesten PendingRFIDs zurück (nach last_seen sortiert)."""
+        result = await db.scalars(select(PendingRFID).order_by(PendingRFID.last_seen.desc()).limit(limit))
+        return list(result)
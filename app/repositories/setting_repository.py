@@ -3,7 +3,10 @@ Setting Repository
 Data Access Layer für DoorSetting-Operationen.
 """
 from typing import Optional
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
+from .async_base import AsyncBaseRepository
 from .base import BaseRepository
 from ..models.door_setting import DoorSetting
 
@@ -40,3 +43,21 @@ class SettingRepository(BaseRepository[DoorSetting]):
         """
         return db.query(DoorSetting).filter(DoorSetting.door_name == door_name).count() > 0
 
+
+
+class AsyncSettingRepository(AsyncBaseRepository[DoorSetting]):
+    """Async-Repository für DoorSetting-Datenbankoperationen."""
+
+    def __init__(self):
+        super().__init__(DoorSetting)
+
+    async def get_by_door_name(self, db: AsyncSession, door_name: str) -> Optional[DoorSetting]:
+        """Findet ein Setting anhand des Tür-Namens."""
+        return await db.scalar(select(DoorSetting).where(DoorSetting.door_name == door_name).limit(1))
+
+    async def exists_door_name(self, db: AsyncSession, door_name: str) -> bool:
+        """Prüft, ob ein Tür-Name bereits existiert."""
+        count = await db.scalar(
+            select(func.count()).select_from(DoorSetting).where(DoorSetting.door_name == door_name)
+        )
+        return count > 0
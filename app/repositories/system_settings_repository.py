@@ -3,6 +3,7 @@ SystemSettings Repository
 Data Access Layer für SystemSettings-Operationen.
 """
 from typing import Optional
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from ..models.system_settings import SystemSettings
 
@@ -24,12 +25,13 @@ class SystemSettingsRepository:
         """
         return db.query(SystemSettings).filter(SystemSettings.id == self.SINGLETON_ID).first()
 
-    def get_or_create(self, db: Session) -> SystemSettings:
+    def get_or_create(self, db: Session, commit: bool = True) -> SystemSettings:
         """
         Gibt die SystemSettings zurück oder erstellt sie mit Defaults.
 
         Args:
             db: Datenbank-Session
+            commit: False, um nur zu flushen (Transaktion des Aufrufers)
 
         Returns:
             SystemSettings
@@ -42,8 +44,11 @@ class SystemSettingsRepository:
                 settings_json={}
             )
             db.add(settings)
-            db.commit()
-            db.refresh(settings)
+            if commit:
+                db.commit()
+                db.refresh(settings)
+            else:
+                db.flush()
         return settings
 
     def update(self, db: Session, update_data: dict) -> SystemSettings:
@@ -67,3 +72,42 @@ class SystemSettingsRepository:
         db.refresh(settings)
         return settings
 
+
+
+class AsyncSystemSettingsRepository:
+    """Async-Repository für SystemSettings-Datenbankoperationen."""
+
+    SINGLETON_ID = SystemSettingsRepository.SINGLETON_ID
+
+    async def get(self, db: AsyncSession) -> Optional[SystemSettings]:
+        """Gibt die SystemSettings zurück (Singleton)."""
+        return await db.get(SystemSettings, self.SINGLETON_ID)
+
+    async def get_or_create(self, db: AsyncSession, commit: bool = True) -> SystemSettings:
+        """Gibt die SystemSettings zurück oder erstellt sie mit Defaults."""
+        settings = await self.get(db)
+        if not settings:
+            settings = SystemSettings(
+                id=self.SINGLETON_ID,
+                pending_door_values={},
+                settings_json={}
+            )
+            db.add(settings)
+            if commit:
+                await db.commit()
+                await db.refresh(settings)
+            else:
+                await db.flush()
+        return settings
+
+    async def update(self, db: AsyncSession, update_data: dict) -> SystemSettings:
+        """Aktualisiert die SystemSettings."""
+        settings = await self.get_or_create(db)
+
+        for key, value in update_data.items():
+            if value is not None:  # Nur nicht-None Werte updaten
+                setattr(settings, key, value)
+
+        await db.commit()
+        await db.refresh(settings)
+        return settings
@@ -4,15 +4,19 @@ Exportiert alle Pydantic-Schemas.
 """
 from .entity import Entity, EntityCreate, EntityBase
 from .door_setting import DoorSetting, DoorSettingCreate, DoorSettingBase
-from .access_log import AccessLog, AccessLogCreate, AccessLogBase
+from .access_log import AccessLog, AccessLogCreate, AccessLogBase, AccessLogBatchEntry, AccessLogBatch, AccessLogBatchResult
 from .pending_rfid import PendingRFID, PendingRFIDCreate, PendingRFIDBase
 from .system_settings import SystemSettings, SystemSettingsCreate, SystemSettingsUpdate, SystemSettingsBase
+from .access_scan import AccessScanRequest, AccessScanResult, AccessScanBatch, AccessScanBatchResult
+from .audit_event import AuditEvent
 
 __all__ = [
     "Entity", "EntityCreate", "EntityBase",
     "DoorSetting", "DoorSettingCreate", "DoorSettingBase",
-    "AccessLog", "AccessLogCreate", "AccessLogBase",
+    "AccessLog", "AccessLogCreate", "AccessLogBase", "AccessLogBatchEntry", "AccessLogBatch", "AccessLogBatchResult",
     "PendingRFID", "PendingRFIDCreate", "PendingRFIDBase",
-    "SystemSettings", "SystemSettingsCreate", "SystemSettingsUpdate", "SystemSettingsBase"
+    "SystemSettings", "SystemSettingsCreate", "SystemSettingsUpdate", "SystemSettingsBase",
+    "AccessScanRequest", "AccessScanResult", "AccessScanBatch", "AccessScanBatchResult",
+    "AuditEvent"
 ]
 
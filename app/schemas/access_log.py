@@ -2,8 +2,8 @@
 AccessLog Pydantic Schemas
 Schemas für API-Validierung und Serialisierung.
 """
-from datetime import datetime
-from typing import Optional
+from datetime import date, datetime
+from typing import List, Optional
 from pydantic import BaseModel, Field
 
 
@@ -28,3 +28,67 @@ class AccessLog(AccessLogBase):
     class Config:
         from_attributes = True
 
+
+
+class AccessLogPage(BaseModel):
+    """Schema für eine Seite von GET /logs."""
+    items: List[AccessLog]
+    next_cursor: Optional[str] = Field(None, description="Cursor für die nächste Seite (null = letzte Seite)")
+
+
+class AccessLogQueued(AccessLogCreate):
+    """Schema für eingereihte, noch nicht geschriebene AccessLogs (ohne ID)."""
+    timestamp: datetime
+
+    class Config:
+        from_attributes = True
+
+
+class AccessLogBatchEntry(AccessLogCreate):
+    """Schema für einen Eintrag im Log-Batch (optional mit Client-Zeitstempel)."""
+    timestamp: Optional[datetime] = Field(None, description="Zeitpunkt des Zugriffs (optional, default: Serverzeit)")
+
+
+class AccessLogBatch(BaseModel):
+    """Schema für die Bulk-Erstellung von AccessLogs."""
+    logs: List[AccessLogBatchEntry] = Field(..., min_length=1, max_length=5000)
+
+
+class AccessLogBatchResult(BaseModel):
+    """Schema für das Ergebnis einer Bulk-Erstellung."""
+    inserted: int = Field(..., description="Anzahl geschriebener Log-Einträge")
+
+
+class AccessLogDailyCount(BaseModel):
+    """Schema für Tageszähler der AccessLogs."""
+    day: date = Field(..., description="Tag (UTC)")
+    entity_id: Optional[int]
+    rfid_id: Optional[str]
+    action: str
+    count: int = Field(..., description="Anzahl der Logs")
+
+
+class LogStatsBucket(BaseModel):
+    """Schema für einen Zähler-Bucket der Log-Statistik."""
+    bucket_start: datetime = Field(..., description="Beginn des Buckets (UTC)")
+    entity_id: Optional[int] = Field(None, description="Entity (bei group_by=entity, null = ohne Entity)")
+    action: Optional[str] = Field(None, description="Aktion (bei group_by=action)")
+    door: Optional[str] = Field(None, description="Tür (bei group_by=door)")
+    count: int = Field(..., description="Anzahl der Logs bzw. Türöffnungen")
+
+
+class UnknownTagCount(BaseModel):
+    """Schema für die Häufigkeit eines unbekannten RFID-Tags."""
+    rfid_id: str
+    count: int = Field(..., description="Anzahl der Scans im Zeitraum")
+    last_seen_day: date = Field(..., description="Letzter Tag mit Scan (UTC)")
+
+
+class LogRetentionStatus(BaseModel):
+    """Schema für den Zustand der Log-Aufbewahrung."""
+    raw_days: Optional[int] = Field(..., description="Tage, die Roh-Logs behalten werden (null = unbegrenzt)")
+    cutoff: Optional[date] = Field(..., description="Ältere Logs werden zu Tageszählern verdichtet")
+    oldest_raw_timestamp: Optional[datetime]
+    last_run: Optional[datetime]
+    last_pruned: int = Field(..., description="Im letzten Lauf verdichtete Logs")
+    total_pruned: int = Field(..., description="Seit dem Start verdichtete Logs")
@@ -0,0 +1,37 @@
+"""
+AccessScan Pydantic Schemas
+Schemas für die Auflösung eines RFID-Scans in einem Request.
+"""
+from datetime import datetime
+from typing import Dict, List, Optional
+from pydantic import BaseModel, Field
+
+
+class AccessScanRequest(BaseModel):
+    """Schema für einen gemeldeten RFID-Scan."""
+    rfid_id: str = Field(..., max_length=64, description="Gescannte RFID-Tag-Nummer")
+    timestamp: Optional[datetime] = Field(None, description="Zeitpunkt des Scans (optional, default: Serverzeit)")
+
+
+class AccessScanResult(BaseModel):
+    """Schema für das Ergebnis eines RFID-Scans."""
+    rfid_id: str
+    action: str = Field(..., description="Geloggte Aktion ('granted' oder 'unknown')")
+    entity_id: Optional[int] = Field(None, description="Erkannte Entity-ID (null bei unbekanntem RFID)")
+    identifier: Optional[str] = Field(None, description="Name/Bezeichnung der erkannten Entity")
+    door_values: Dict[str, float] = Field(
+        default_factory=dict,
+        description="Effektive Türöffnungszeiten in Sekunden (Entity-Werte oder pending_door_values)"
+    )
+
+
+class AccessScanBatch(BaseModel):
+    """Schema für nachgereichte Scans aus der Outbox des Pi-Agents."""
+    scans: List[AccessScanRequest] = Field(..., min_length=1, max_length=1000)
+
+
+class AccessScanBatchResult(BaseModel):
+    """Schema für das Ergebnis eines Scan-Batches."""
+    received: int = Field(..., description="Anzahl verarbeiteter Scans")
+    granted: int = Field(..., description="Davon erkannte Entities")
+    unknown: int = Field(..., description="Davon unbekannte RFIDs")
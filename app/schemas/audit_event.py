@@ -0,0 +1,19 @@
+"""
+AuditEvent Pydantic Schemas
+Schemas für API-Validierung und Serialisierung.
+"""
+from datetime import datetime
+from typing import Optional
+from pydantic import BaseModel, Field
+
+
+class AuditEvent(BaseModel):
+    """Schema für AuditEvent-Antworten."""
+    id: int
+    timestamp: datetime = Field(..., description="Zeitpunkt des Zugriffs (UTC)")
+    resource: str = Field(..., description="Art der Ressource (z.B. 'entity')")
+    resource_id: Optional[int]
+    action: str = Field(..., description="Art des Zugriffs (read, create, update, delete)")
+
+    class Config:
+        from_attributes = True
@@ -2,6 +2,7 @@
 DoorSetting Pydantic Schemas
 Schemas für API-Validierung und Serialisierung.
 """
+from typing import Optional
 from pydantic import BaseModel, Field
 
 
@@ -13,6 +14,9 @@ class DoorSettingBase(BaseModel):
     max_angle: float = Field(..., description="Maximaler Servo-Winkel in Grad")
     min_pulse: float = Field(0.0005, description="Minimale PWM-Pulsbreite in Sekunden")
     max_pulse: float = Field(0.0025, description="Maximale PWM-Pulsbreite in Sekunden")
+    station: Optional[str] = Field(
+        None, max_length=50, description="Futterstelle (Reader), die die Tür auslöst; None = alle"
+    )
 
 
 class DoorSettingCreate(DoorSettingBase):
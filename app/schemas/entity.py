@@ -37,3 +37,16 @@ class Entity(EntityBase):
     class Config:
         from_attributes = True
 
+
+class EntityCacheStats(BaseModel):
+    """Schema für die Zähler des Entity-Caches."""
+    enabled: bool
+    size: int = Field(..., description="Aktuelle Anzahl Einträge")
+    max_entries: int
+    ttl_seconds: float
+    hits: int
+    misses: int
+    hit_rate: float = Field(..., description="hits / (hits + misses)")
+    puts: int = Field(..., description="Abgelegte Lookup-Ergebnisse")
+    evictions: int = Field(..., description="Wegen max_entries verdrängte Einträge")
+    invalidations: int = Field(..., description="Invalidierungen durch Schreibvorgänge")
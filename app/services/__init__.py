@@ -2,11 +2,23 @@
 Services Package Initialization
 Exportiert alle Service-Klassen.
 """
-from .entity_service import EntityService
-from .setting_service import SettingService
-from .log_service import LogService
-from .pending_rfid_service import PendingRFIDService
-from .system_settings_service import SystemSettingsService
-
-__all__ = ["EntityService", "SettingService", "LogService", "PendingRFIDService", "SystemSettingsService"]
+from .entity_cache import EntityCache, EntitySnapshot, entity_cache
+from .entity_service import AsyncEntityService, EntityService
+from .setting_service import AsyncSettingService, SettingService
+from .log_service import AsyncLogService, LogService
+from .pending_rfid_service import AsyncPendingRFIDService, PendingRFIDService
+from .system_settings_service import AsyncSystemSettingsService, SystemSettingsService
+from .access_service import AccessService, AsyncAccessService
+from .change_feed import ChangeFeed, change_feed
+from .log_writer import LogWriter, log_writer
+from .log_retention import LogRetention, log_retention
+from .audit_trail import AuditTrail, audit_trail
 
+__all__ = [
+    "EntityService", "SettingService", "LogService", "PendingRFIDService", "SystemSettingsService", "AccessService",
+    "AsyncEntityService", "AsyncSettingService", "AsyncLogService", "AsyncPendingRFIDService",
+    "AsyncSystemSettingsService", "AsyncAccessService",
+    "ChangeFeed", "change_feed", "LogWriter", "log_writer",
+    "LogRetention", "log_retention", "AuditTrail", "audit_trail",
+    "EntityCache", "EntitySnapshot", "entity_cache"
+]
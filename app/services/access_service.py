@@ -0,0 +1,172 @@
+"""
+Access Service
+Business Logic Layer für die Auflösung von RFID-Scans.
+"""
+from datetime import datetime
+from typing import List, Optional, Tuple
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from ..repositories import AsyncLogRepository, AsyncSystemSettingsRepository, LogRepository, SystemSettingsRepository
+from ..schemas.access_scan import AccessScanRequest, AccessScanResult, AccessScanBatchResult
+from .entity_cache import EntitySnapshot
+from .entity_service import AsyncEntityService, EntityService
+from .pending_rfid_service import AsyncPendingRFIDService, PendingRFIDService
+
+
+def _granted(rfid_id: str, entity: EntitySnapshot) -> AccessScanResult:
+    return AccessScanResult(
+        rfid_id=rfid_id,
+        action="granted",
+        entity_id=entity.id,
+        identifier=entity.identifier,
+        door_values=entity.door_values
+    )
+
+
+def _log_row(result: AccessScanResult, timestamp: Optional[datetime]) -> dict:
+    return {
+        "entity_id": result.entity_id,
+        "action": result.action,
+        "rfid_id": result.rfid_id,
+        "timestamp": timestamp,
+        # Für die Türzähler: jede Tür mit Öffnungszeit > 0 öffnet beim Scan
+        "doors": [door for door, seconds in result.door_values.items() if seconds > 0],
+    }
+
+
+class AccessService:
+    """Service für die Scan-Auflösung des Pi-Agents."""
+
+    def __init__(self):
+        # Lookup über den EntityCache: bekannte Tags fragen die Datenbank nicht ab
+        self.entity_service = EntityService()
+        self.log_repository = LogRepository()
+        self.system_settings_repository = SystemSettingsRepository()
+        self.pending_service = PendingRFIDService()
+
+    def scan(self, db: Session, rfid_id: str, timestamp: Optional[datetime] = None) -> AccessScanResult:
+        """
+        Löst einen RFID-Scan vollständig auf.
+
+        Sucht die Entity, schreibt den Access-Log, registriert unbekannte Tags
+        als PendingRFID und ermittelt die effektiven Türwerte. Alle Schreib-
+        vorgänge laufen in einer Transaktion mit genau einem Commit.
+
+        Args:
+            db: Datenbank-Session
+            rfid_id: Gescannte RFID-Tag-Nummer
+            timestamp: Zeitpunkt des Scans (optional, default: Serverzeit)
+
+        Returns:
+            Scan-Ergebnis inkl. effektiver door_values
+        """
+        result, log_data = self._resolve(db, rfid_id, timestamp)
+        self.log_repository.bulk_insert(db, [log_data], commit=False)
+        db.commit()
+        return result
+
+    def scan_batch(self, db: Session, scans: List[AccessScanRequest]) -> AccessScanBatchResult:
+        """
+        Verarbeitet nachgereichte Scans (z.B. aus der Outbox des Agents).
+
+        Jeder Scan wird wie bei scan() aufgelöst, inklusive seines
+        ursprünglichen Zeitstempels. Die Logs werden gesammelt per
+        executemany geschrieben, der gesamte Batch mit einem Commit.
+
+        Args:
+            db: Datenbank-Session
+            scans: Liste der Scans
+
+        Returns:
+            Anzahl verarbeiteter, erkannter und unbekannter Scans
+        """
+        granted = 0
+        log_rows = []
+        for scan in scans:
+            result, log_data = self._resolve(db, scan.rfid_id, scan.timestamp)
+            log_rows.append(log_data)
+            if result.action == "granted":
+                granted += 1
+
+        self.log_repository.bulk_insert(db, log_rows, commit=False)
+        db.commit()
+        return AccessScanBatchResult(received=len(scans), granted=granted, unknown=len(scans) - granted)
+
+    def _resolve(
+        self,
+        db: Session,
+        rfid_id: str,
+        timestamp: Optional[datetime]
+    ) -> Tuple[AccessScanResult, dict]:
+        """
+        Löst einen Scan ohne Commit auf (Transaktion des Aufrufers).
+
+        Returns:
+            Scan-Ergebnis und die Daten des zu schreibenden Logs
+        """
+        entity = self.entity_service.get_by_rfid(db, rfid_id)
+
+        if entity:
+            result = _granted(rfid_id, entity)
+        else:
+            self.pending_service.register_unknown_rfid(db, rfid_id, commit=False)
+            settings = self.system_settings_repository.get_or_create(db, commit=False)
+            result = AccessScanResult(
+                rfid_id=rfid_id,
+                action="unknown",
+                door_values=settings.pending_door_values or {}
+            )
+
+        return result, _log_row(result, timestamp)
+
+
+class AsyncAccessService:
+    """Service für die Scan-Auflösung auf dem async Datenpfad (siehe AccessService)."""
+
+    def __init__(self):
+        self.entity_service = AsyncEntityService()
+        self.log_repository = AsyncLogRepository()
+        self.system_settings_repository = AsyncSystemSettingsRepository()
+        self.pending_service = AsyncPendingRFIDService()
+
+    async def scan(self, db: AsyncSession, rfid_id: str, timestamp: Optional[datetime] = None) -> AccessScanResult:
+        """Löst einen RFID-Scan in einer Transaktion mit genau einem Commit auf."""
+        result, log_data = await self._resolve(db, rfid_id, timestamp)
+        await self.log_repository.bulk_insert(db, [log_data], commit=False)
+        await db.commit()
+        return result
+
+    async def scan_batch(self, db: AsyncSession, scans: List[AccessScanRequest]) -> AccessScanBatchResult:
+        """Verarbeitet nachgereichte Scans in einer Transaktion."""
+        granted = 0
+        log_rows = []
+        for scan in scans:
+            result, log_data = await self._resolve(db, scan.rfid_id, scan.timestamp)
+            log_rows.append(log_data)
+            if result.action == "granted":
+                granted += 1
+
+        await self.log_repository.bulk_insert(db, log_rows, commit=False)
+        await db.commit()
+        return AccessScanBatchResult(received=len(scans), granted=granted, unknown=len(scans) - granted)
+
+    async def _resolve(
+        self,
+        db: AsyncSession,
+        rfid_id: str,
+        timestamp: Optional[datetime]
+    ) -> Tuple[AccessScanResult, dict]:
+        entity = await self.entity_service.get_by_rfid(db, rfid_id)
+
+        if entity:
+            result = _granted(rfid_id, entity)
+        else:
+            await self.pending_service.register_unknown_rfid(db, rfid_id, commit=False)
+            settings = await self.system_settings_repository.get_or_create(db, commit=False)
+            result = AccessScanResult(
+                rfid_id=rfid_id,
+                action="unknown",
+                door_values=settings.pending_door_values or {}
+            )
+
+        return result, _log_row(result, timestamp)
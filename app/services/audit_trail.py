@@ -0,0 +1,147 @@
+"""
+Audit Trail
+Puffert Admin-Zugriffe und schreibt sie gebündelt in audit_events.
+"""
+import asyncio
+import logging
+import random
+from datetime import datetime, timezone
+from typing import List, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from ..config import AuditConfig, settings
+from ..models.audit_event import AuditEvent
+from ..repositories import AsyncAuditRepository
+
+LOGGER = logging.getLogger(__name__)
+
+
+class AuditTrail:
+    """
+    Audit-Trail der Verwaltungs-API abseits des Request-Pfads.
+
+    record() reiht ein Event nur ein und kehrt sofort zurück; eine
+    Hintergrund-Task schreibt die gesammelten Events alle
+    flush_interval_ms (oder ab max_batch_rows) in einer Transaktion. Bei
+    voller Queue werden neue Events verworfen statt Requests aufzuhalten.
+
+    Läuft der Trail nicht (App ohne Lifespan), werden keine Events
+    protokolliert.
+    """
+
+    def __init__(self, config: AuditConfig):
+        self.config = config
+        self.repository = AsyncAuditRepository()
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self._session_factory: Optional[async_sessionmaker] = None
+        self._dropped = 0
+
+    @property
+    def running(self) -> bool:
+        """True, solange Events angenommen werden."""
+        return self._task is not None
+
+    async def start(self, session_factory: async_sessionmaker) -> None:
+        """
+        Startet die Hintergrund-Task in der laufenden Event-Loop.
+
+        Args:
+            session_factory: Factory für die Sessions der Batches
+        """
+        if self._task is not None or self.config.policy == "off":
+            return
+        self._session_factory = session_factory
+        self._queue = asyncio.Queue(maxsize=self.config.queue_size)
+        self._task = asyncio.create_task(self._run())
+        LOGGER.info("Audit trail started (policy=%s)", self.config.policy)
+
+    async def stop(self) -> None:
+        """Nimmt keine Events mehr an, schreibt alle gepufferten und beendet die Task."""
+        if self._task is None:
+            return
+        task, self._task = self._task, None
+        await self._queue.join()
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+        LOGGER.info("Audit trail stopped")
+
+    def record(self, resource: str, action: str, resource_id: Optional[int] = None) -> bool:
+        """
+        Protokolliert einen Zugriff gemäß policy, ohne zu warten.
+
+        Args:
+            resource: Art der Ressource (z.B. 'entity')
+            action: Art des Zugriffs (read, create, update, delete)
+            resource_id: ID der Ressource (optional)
+
+        Returns:
+            True, wenn das Event eingereiht wurde
+        """
+        if self._task is None:
+            return False
+        if (self.config.policy == "sampled" and action == "read"
+                and random.random() >= self.config.read_sample_rate):
+            return False
+        try:
+            self._queue.put_nowait({
+                "timestamp": datetime.now(timezone.utc).replace(tzinfo=None),
+                "resource": resource,
+                "resource_id": resource_id,
+                "action": action,
+            })
+        except asyncio.QueueFull:
+            self._dropped += 1
+            return False
+        return True
+
+    async def get_recent(
+        self,
+        db: AsyncSession,
+        limit: int = 100,
+        resource: Optional[str] = None,
+        resource_id: Optional[int] = None
+    ) -> List[AuditEvent]:
+        """Gibt die neuesten geschriebenen Events zurück (neueste zuerst)."""
+        return await self.repository.get_recent(db, limit, resource, resource_id)
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        interval = self.config.flush_interval_ms / 1000
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + interval
+            while len(batch) < self.config.max_batch_rows:
+                if not self._queue.empty():
+                    batch.append(self._queue.get_nowait())
+                    continue
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            try:
+                await self._flush(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def _flush(self, batch: List[dict]) -> None:
+        try:
+            async with self._session_factory() as db:
+                await self.repository.bulk_insert(db, batch)
+                await db.commit()
+        except Exception:
+            LOGGER.exception("Failed to write %d audit events", len(batch))
+        if self._dropped:
+            LOGGER.warning("Dropped %d audit events (queue full)", self._dropped)
+            self._dropped = 0
+
+
+audit_trail = AuditTrail(settings.audit)
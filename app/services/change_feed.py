@@ -0,0 +1,119 @@
+"""
+Change Feed
+Benachrichtigt Abonnenten über committete Änderungen an Konfigurationsdaten.
+"""
+import asyncio
+import itertools
+import logging
+import threading
+from typing import Dict, Optional
+
+LOGGER = logging.getLogger(__name__)
+
+# Ressourcen, für die Änderungen gemeldet werden
+RESOURCES = ("settings", "entities", "system_settings")
+
+
+class ChangeSubscription:
+    """
+    Abonnement auf den Change Feed.
+
+    Events landen in einer asyncio.Queue der Event-Loop, in der das
+    Abonnement erstellt wurde.
+    """
+
+    def __init__(self, feed: "ChangeFeed", loop: asyncio.AbstractEventLoop, maxsize: int):
+        self._feed = feed
+        self._loop = loop
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+        self.overflowed = False
+
+    def _deliver(self, event: dict) -> None:
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            # Langsamer Client: er muss nach dem Reconnect neu synchronisieren
+            self.overflowed = True
+
+    async def get(self, timeout: Optional[float] = None) -> Optional[dict]:
+        """Wartet auf das nächste Event; None nach Ablauf des Timeouts."""
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    def close(self) -> None:
+        """Beendet das Abonnement."""
+        self._feed._unsubscribe(self)
+
+
+class ChangeFeed:
+    """
+    Prozessweiter Feed für Konfigurationsänderungen.
+
+    Jede gemeldete Änderung erhält eine monoton steigende Versionsnummer.
+    publish() ist thread-sicher, da die synchronen Endpunkte im Threadpool
+    von FastAPI laufen.
+    """
+
+    def __init__(self, queue_size: int = 100):
+        self._queue_size = queue_size
+        self._lock = threading.Lock()
+        self._counter = itertools.count(1)
+        self._version = 0
+        self._resource_versions: Dict[str, int] = {resource: 0 for resource in RESOURCES}
+        self._subscribers: set[ChangeSubscription] = set()
+
+    @property
+    def version(self) -> int:
+        """Version der zuletzt gemeldeten Änderung."""
+        return self._version
+
+    def resource_versions(self) -> Dict[str, int]:
+        """Version der letzten Änderung je Ressource."""
+        with self._lock:
+            return dict(self._resource_versions)
+
+    def resource_version(self, resource: str) -> int:
+        """Version der letzten Änderung einer Ressource."""
+        return self._resource_versions[resource]
+
+    def publish(self, resource: str) -> int:
+        """
+        Meldet eine committete Änderung.
+
+        Args:
+            resource: Geänderte Ressource ('settings', 'entities', 'system_settings')
+
+        Returns:
+            Neue Versionsnummer
+        """
+        with self._lock:
+            version = next(self._counter)
+            self._version = version
+            self._resource_versions[resource] = version
+            subscribers = list(self._subscribers)
+
+        event = {"version": version, "resource": resource}
+        for subscription in subscribers:
+            try:
+                subscription._loop.call_soon_threadsafe(subscription._deliver, event)
+            except RuntimeError:
+                # Event-Loop bereits geschlossen
+                self._unsubscribe(subscription)
+        LOGGER.debug("Published change %s (version %d)", resource, version)
+        return version
+
+    def subscribe(self) -> ChangeSubscription:
+        """Erstellt ein Abonnement für die laufende Event-Loop."""
+        subscription = ChangeSubscription(self, asyncio.get_running_loop(), self._queue_size)
+        with self._lock:
+            self._subscribers.add(subscription)
+        return subscription
+
+    def _unsubscribe(self, subscription: ChangeSubscription) -> None:
+        with self._lock:
+            self._subscribers.discard(subscription)
+
+
+change_feed = ChangeFeed()
@@ -0,0 +1,173 @@
+"""
+Entity Cache
+Begrenzter LRU/TTL-Cache für Entity-Lookups nach RFID und ID.
+"""
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Dict, Hashable, Optional, Tuple
+
+from ..config import EntityCacheConfig, settings
+from ..models.entity import Entity
+
+
+@dataclass(frozen=True)
+class EntitySnapshot:
+    """
+    Kopie einer Entity, unabhängig von Session und Transaktion.
+
+    Hat dieselben Attribute wie das Modell, sodass Schemas
+    (from_attributes) und der Scan-Pfad sie wie eine Entity verwenden.
+    """
+    id: int
+    rfid_id: str
+    identifier: str
+    door_values: Dict[str, float]
+
+    @classmethod
+    def from_entity(cls, entity: Entity) -> "EntitySnapshot":
+        return cls(entity.id, entity.rfid_id, entity.identifier, dict(entity.door_values or {}))
+
+
+class EntityCache:
+    """
+    Cache für Entity-Lookups, gemeinsam für alle Entity-Services eines Prozesses.
+
+    Schlüssel sind ("id", entity_id) und ("rfid", rfid_id); auch "nicht
+    gefunden" wird für negative_ttl_seconds gespeichert, damit unbekannte
+    Tags die Datenbank nicht bei jedem Scan abfragen. Die kurze TTL
+    begrenzt die Veraltung, wenn ein anderer Prozess den Tag anlegt (z.B.
+    convert über die API neben dem Embedded-Agent).
+
+    Jede Invalidierung erhöht eine Generation: ein Lookup, der vor einer
+    Änderung gelesen hat, legt sein Ergebnis danach nicht mehr ab.
+
+    Thread-sicher, da auch der sync Datenpfad (Threadpool) ihn verwendet.
+    """
+
+    def __init__(self, config: EntityCacheConfig, clock: Callable[[], float] = time.monotonic):
+        self.config = config
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, Tuple[float, Optional[EntitySnapshot]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.puts = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.config.enabled
+
+    def token(self) -> int:
+        """Generation vor einem Datenbank-Lookup (für remember())."""
+        return self._generation
+
+    def get(self, key: Hashable) -> Tuple[bool, Optional[EntitySnapshot]]:
+        """
+        Sucht einen Eintrag.
+
+        Returns:
+            (gefunden, Entity oder None für "existiert nicht")
+        """
+        if not self.config.enabled:
+            return False, None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= self._clock():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return False, None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return True, entry[1]
+
+    def remember(self, key: Hashable, entity: Optional[Entity], token: int) -> Optional[EntitySnapshot]:
+        """
+        Legt das Ergebnis eines Datenbank-Lookups ab.
+
+        Gefundene Entities werden zusätzlich unter ihrer ID abgelegt.
+
+        Args:
+            key: Schlüssel des Lookups
+            entity: Gefundene Entity oder None
+            token: Ergebnis von token() vor dem Lookup
+
+        Returns:
+            EntitySnapshot bzw. None (auch bei deaktiviertem Cache)
+        """
+        snapshot = EntitySnapshot.from_entity(entity) if entity is not None else None
+        if not self.config.enabled:
+            return snapshot
+        with self._lock:
+            if token != self._generation:
+                return snapshot
+            if snapshot is None and not self.config.negative_ttl_seconds:
+                return None
+            ttl = self.config.ttl_seconds if snapshot is not None else self.config.negative_ttl_seconds
+            expires = self._clock() + ttl
+            self._store(key, expires, snapshot)
+            if snapshot is not None and key != ("id", snapshot.id):
+                self._store(("id", snapshot.id), expires, snapshot)
+        return snapshot
+
+    def invalidate(self, entity_id: Optional[int] = None, rfid_id: Optional[str] = None) -> None:
+        """
+        Entfernt alle Einträge einer Entity und eines RFID-Tags (synchron).
+
+        Einträge, die auf die Entity zeigen, werden auch unter alter RFID
+        entfernt; rfid_id trifft zusätzlich "nicht gefunden"-Einträge.
+        """
+        with self._lock:
+            self._generation += 1
+            self.invalidations += 1
+            if entity_id is not None:
+                stale = [key for key, (_, value) in self._entries.items()
+                         if value is not None and value.id == entity_id]
+                stale.append(("id", entity_id))
+                for key in stale:
+                    self._entries.pop(key, None)
+            if rfid_id is not None:
+                self._entries.pop(("rfid", rfid_id), None)
+
+    def clear(self) -> None:
+        """Leert den Cache."""
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        """
+        Zähler für das Monitoring.
+
+        Returns:
+            enabled, size, max_entries, ttl_seconds, hits, misses, hit_rate, puts, evictions, invalidations
+        """
+        lookups = self.hits + self.misses
+        return {
+            "enabled": self.config.enabled,
+            "size": len(self._entries),
+            "max_entries": self.config.max_entries,
+            "ttl_seconds": self.config.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "puts": self.puts,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
+
+    def _store(self, key: Hashable, expires: float, value: Optional[EntitySnapshot]) -> None:
+        self._entries[key] = (expires, value)
+        self._entries.move_to_end(key)
+        self.puts += 1
+        while len(self._entries) > self.config.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+
+entity_cache = EntityCache(settings.entity_cache)
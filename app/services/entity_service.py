@@ -3,30 +3,48 @@ Entity Service
 Business Logic Layer für Entity-Operationen.
 """
 from typing import List, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from ..repositories import EntityRepository, LogRepository
+from ..repositories import AsyncEntityRepository, EntityRepository, LogRepository
 from ..schemas.entity import EntityCreate
 from ..models.entity import Entity
+from .change_feed import change_feed
+from .entity_cache import EntityCache, EntitySnapshot, entity_cache
 
 
 class EntityService:
-    """Service für Entity-Business-Logic."""
+    """
+    Service für Entity-Business-Logic.
 
-    def __init__(self):
+    Lookups nach ID und RFID laufen über den prozessweiten EntityCache
+    und liefern EntitySnapshots (auch bei deaktiviertem Cache); alle
+    Schreibvorgänge invalidieren ihn sofort nach dem Commit.
+    """
+
+    def __init__(self, cache: EntityCache = entity_cache):
         self.repository = EntityRepository()
         self.log_repository = LogRepository()
+        self.cache = cache
 
     def get_all(self, db: Session) -> List[Entity]:
         """Gibt alle Entities zurück."""
         return self.repository.get_all(db)
 
-    def get_by_id(self, db: Session, entity_id: int) -> Optional[Entity]:
-        """Gibt eine Entity anhand der ID zurück."""
-        return self.repository.get_by_id(db, entity_id)
-
-    def get_by_rfid(self, db: Session, rfid_id: str) -> Optional[Entity]:
-        """Gibt eine Entity anhand der RFID-ID zurück."""
-        return self.repository.get_by_rfid(db, rfid_id)
+    def get_by_id(self, db: Session, entity_id: int) -> Optional[EntitySnapshot]:
+        """Gibt eine Entity anhand der ID zurück (aus dem Cache, falls aktiv)."""
+        found, entity = self.cache.get(("id", entity_id))
+        if found:
+            return entity
+        token = self.cache.token()
+        return self.cache.remember(("id", entity_id), self.repository.get_by_id(db, entity_id), token)
+
+    def get_by_rfid(self, db: Session, rfid_id: str) -> Optional[EntitySnapshot]:
+        """Gibt eine Entity anhand der RFID-ID zurück (aus dem Cache, falls aktiv)."""
+        found, entity = self.cache.get(("rfid", rfid_id))
+        if found:
+            return entity
+        token = self.cache.token()
+        return self.cache.remember(("rfid", rfid_id), self.repository.get_by_rfid(db, rfid_id), token)
 
     def create(self, db: Session, entity_data: EntityCreate) -> Entity:
         """
@@ -46,7 +64,10 @@ class EntityService:
         if self.repository.exists_rfid(db, entity_data.rfid_id):
             raise ValueError(f"RFID-ID '{entity_data.rfid_id}' existiert bereits")
 
-        return self.repository.create(db, entity_data.model_dump())
+        entity = self.repository.create(db, entity_data.model_dump())
+        self.cache.invalidate(entity.id, entity.rfid_id)
+        change_feed.publish("entities")
+        return entity
 
     def update(self, db: Session, entity_id: int, entity_data: EntityCreate) -> Optional[Entity]:
         """
@@ -70,7 +91,10 @@ class EntityService:
             if self.repository.exists_rfid(db, entity_data.rfid_id):
                 raise ValueError(f"RFID-ID '{entity_data.rfid_id}' wird bereits verwendet")
 
-        return self.repository.update(db, entity_id, entity_data.model_dump())
+        entity = self.repository.update(db, entity_id, entity_data.model_dump())
+        self.cache.invalidate(entity_id, entity_data.rfid_id)
+        change_feed.publish("entities")
+        return entity
 
     def delete(self, db: Session, entity_id: int) -> Optional[Entity]:
         """
@@ -83,5 +107,80 @@ class EntityService:
         Returns:
             Gelöschte Entity oder None
         """
-        return self.repository.delete(db, entity_id)
+        entity = self.repository.delete(db, entity_id)
+        if entity:
+            self.cache.invalidate(entity_id)
+            change_feed.publish("entities")
+        return entity
+
+
+
+class AsyncEntityService:
+    """Service für Entity-Business-Logic auf dem async Datenpfad (Cache wie EntityService)."""
+
+    def __init__(self, cache: EntityCache = entity_cache):
+        self.repository = AsyncEntityRepository()
+        self.cache = cache
+
+    async def get_all(self, db: AsyncSession) -> List[Entity]:
+        """Gibt alle Entities zurück."""
+        return await self.repository.get_all(db)
+
+    async def get_by_id(self, db: AsyncSession, entity_id: int) -> Optional[EntitySnapshot]:
+        """Gibt eine Entity anhand der ID zurück (aus dem Cache, falls aktiv)."""
+        found, entity = self.cache.get(("id", entity_id))
+        if found:
+            return entity
+        token = self.cache.token()
+        return self.cache.remember(("id", entity_id), await self.repository.get_by_id(db, entity_id), token)
+
+    async def get_by_rfid(self, db: AsyncSession, rfid_id: str) -> Optional[EntitySnapshot]:
+        """Gibt eine Entity anhand der RFID-ID zurück (aus dem Cache, falls aktiv)."""
+        found, entity = self.cache.get(("rfid", rfid_id))
+        if found:
+            return entity
+        token = self.cache.token()
+        return self.cache.remember(("rfid", rfid_id), await self.repository.get_by_rfid(db, rfid_id), token)
+
+    async def create(self, db: AsyncSession, entity_data: EntityCreate) -> Entity:
+        """
+        Erstellt eine neue Entity.
+
+        Raises:
+            ValueError: Wenn RFID-ID bereits existiert
+        """
+        if await self.repository.exists_rfid(db, entity_data.rfid_id):
+            raise ValueError(f"RFID-ID '{entity_data.rfid_id}' existiert bereits")
+
+        entity = await self.repository.create(db, entity_data.model_dump())
+        self.cache.invalidate(entity.id, entity.rfid_id)
+        change_feed.publish("entities")
+        return entity
+
+    async def update(self, db: AsyncSession, entity_id: int, entity_data: EntityCreate) -> Optional[Entity]:
+        """
+        Aktualisiert eine Entity.
+
+        Raises:
+            ValueError: Wenn die neue RFID-ID bereits verwendet wird
+        """
+        existing = await self.repository.get_by_id(db, entity_id)
+        if not existing:
+            return None
+
+        if entity_data.rfid_id != existing.rfid_id:
+            if await self.repository.exists_rfid(db, entity_data.rfid_id):
+                raise ValueError(f"RFID-ID '{entity_data.rfid_id}' wird bereits verwendet")
 
+        entity = await self.repository.update(db, entity_id, entity_data.model_dump())
+        self.cache.invalidate(entity_id, entity_data.rfid_id)
+        change_feed.publish("entities")
+        return entity
+
+    async def delete(self, db: AsyncSession, entity_id: int) -> Optional[Entity]:
+        """Löscht eine Entity."""
+        entity = await self.repository.delete(db, entity_id)
+        if entity:
+            self.cache.invalidate(entity_id)
+            change_feed.publish("entities")
+        return entity
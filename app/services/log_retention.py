@@ -0,0 +1,144 @@
+"""
+Log Retention
+Verdichtet abgelaufene AccessLogs zu Tageszählern und löscht sie in kleinen Batches.
+"""
+import asyncio
+import logging
+from collections import Counter
+from datetime import datetime, time, timedelta, timezone
+from typing import Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from ..config import LogRetentionConfig, settings
+from ..repositories import AsyncAccessLogCounterRepository, AsyncAccessLogDailyRepository, AsyncLogRepository
+
+LOGGER = logging.getLogger(__name__)
+
+
+class LogRetention:
+    """
+    Periodischer Aufräumlauf für access_logs.
+
+    Logs vor dem Stichtag (Mitternacht UTC, raw_days zurück) werden je
+    Batch in einer Transaktion auf access_log_daily addiert und gelöscht.
+    Ein Abbruch mitten im Lauf verliert oder verdoppelt daher nichts; ein
+    Batch hält die Schreibsperre nur kurz. Stunden-Zähler der Statistik
+    verfallen zum selben Stichtag, Tages-Zähler bleiben erhalten.
+    """
+
+    def __init__(self, config: LogRetentionConfig):
+        self.config = config
+        self.log_repository = AsyncLogRepository()
+        self.daily_repository = AsyncAccessLogDailyRepository()
+        self.counter_repository = AsyncAccessLogCounterRepository()
+        self._task: Optional[asyncio.Task] = None
+        self._session_factory: Optional[async_sessionmaker] = None
+        self.last_run: Optional[datetime] = None
+        self.last_pruned = 0
+        self.total_pruned = 0
+
+    def cutoff(self, now: Optional[datetime] = None) -> Optional[datetime]:
+        """
+        Stichtag, vor dem Roh-Logs verdichtet werden (naiv, UTC wie access_logs.timestamp).
+
+        Auf Mitternacht gerundet, damit ein Tag nie zwischen Roh-Logs und
+        Tageszählern aufgeteilt wird.
+        """
+        if self.config.raw_days is None:
+            return None
+        now = now or datetime.now(timezone.utc)
+        return datetime.combine(now.date() - timedelta(days=self.config.raw_days), time.min)
+
+    async def start(self, session_factory: async_sessionmaker) -> None:
+        """Startet die periodischen Läufe in der laufenden Event-Loop."""
+        if self._task is not None or self.config.raw_days is None:
+            return
+        self._session_factory = session_factory
+        self._task = asyncio.create_task(self._run())
+        LOGGER.info("Log retention started (raw logs kept for %d days)", self.config.raw_days)
+
+    async def stop(self) -> None:
+        """Beendet die periodischen Läufe; ein offener Batch wird zurückgerollt."""
+        if self._task is None:
+            return
+        task, self._task = self._task, None
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.run_once(self._session_factory)
+            except Exception:
+                LOGGER.exception("Log retention run failed")
+            await asyncio.sleep(self.config.interval_minutes * 60)
+
+    async def run_once(self, session_factory: async_sessionmaker, now: Optional[datetime] = None) -> int:
+        """
+        Verdichtet und löscht alle Logs vor dem Stichtag.
+
+        Args:
+            session_factory: Factory für die Sessions der Batches
+            now: Bezugszeitpunkt (default: jetzt)
+
+        Returns:
+            Anzahl gelöschter Roh-Logs
+        """
+        cutoff = self.cutoff(now)
+        if cutoff is None:
+            return 0
+
+        pruned = 0
+        while True:
+            async with session_factory() as db:
+                batch = await self._prune_batch(db, cutoff)
+            pruned += batch
+            if batch < self.config.batch_size:
+                break
+            await asyncio.sleep(self.config.batch_pause_ms / 1000)
+
+        async with session_factory() as db:
+            await self.counter_repository.delete_before(db, "hour", cutoff)
+            await db.commit()
+
+        self.last_run = datetime.now(timezone.utc)
+        self.last_pruned = pruned
+        self.total_pruned += pruned
+        if pruned:
+            LOGGER.info("Rolled up and pruned %d access logs older than %s", pruned, cutoff.date())
+        return pruned
+
+    async def _prune_batch(self, db: AsyncSession, cutoff: datetime) -> int:
+        rows = await self.log_repository.get_expired(db, cutoff, self.config.batch_size)
+        if not rows:
+            return 0
+
+        counts = Counter((row.timestamp.date(), row.entity_id, row.rfid_id, row.action) for row in rows)
+        await self.daily_repository.add_counts(db, counts)
+        deleted = await self.log_repository.delete_by_ids(db, [row.id for row in rows])
+        await db.commit()
+        return deleted
+
+    async def status(self, db: AsyncSession) -> dict:
+        """
+        Zustand der Aufbewahrung für die API.
+
+        Returns:
+            raw_days, cutoff, oldest_raw_timestamp, last_run, last_pruned, total_pruned
+        """
+        cutoff = self.cutoff()
+        return {
+            "raw_days": self.config.raw_days,
+            "cutoff": cutoff.date() if cutoff else None,
+            "oldest_raw_timestamp": await self.log_repository.get_oldest_timestamp(db),
+            "last_run": self.last_run,
+            "last_pruned": self.last_pruned,
+            "total_pruned": self.total_pruned,
+        }
+
+
+log_retention = LogRetention(settings.log_retention)
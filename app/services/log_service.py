@@ -2,12 +2,23 @@
 Log Service
 Business Logic Layer für AccessLog-Operationen.
 """
-from typing import List, Optional
-from datetime import datetime
+import base64
+import binascii
+import csv
+import io
+import json
+from collections import Counter
+from typing import Any, AsyncIterator, List, Optional, Sequence, Tuple
+from datetime import date, datetime, time, timedelta, timezone
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from ..repositories import LogRepository
-from ..schemas.access_log import AccessLogCreate
+from ..repositories import (
+    AsyncAccessLogCounterRepository, AsyncAccessLogDailyRepository, AsyncLogRepository, LogRepository
+)
+from ..repositories.access_log_counter_repository import DIMENSIONS, bucket_start
+from ..schemas.access_log import AccessLogCreate, AccessLogBatchEntry
 from ..models.access_log import AccessLog
+from .log_writer import LogWriter, log_writer
 
 
 class LogService:
@@ -63,6 +74,19 @@ class LogService:
         """
         return self.repository.create(db, log_data.model_dump())
 
+    def create_batch(self, db: Session, logs: List[AccessLogBatchEntry]) -> int:
+        """
+        Erstellt mehrere Log-Einträge in einer Transaktion.
+
+        Args:
+            db: Datenbank-Session
+            logs: Log-Daten (optional mit Client-Zeitstempel)
+
+        Returns:
+            Anzahl geschriebener Einträge
+        """
+        return self.repository.bulk_insert(db, [log.model_dump() for log in logs])
+
     def log_access(self, db: Session, entity_id: Optional[int], action: str) -> AccessLog:
         """
         Convenience-Methode zum Erstellen eines Access-Logs.
@@ -78,3 +102,383 @@ class LogService:
         log_data = AccessLogCreate(entity_id=entity_id, action=action)
         return self.create(db, log_data)
 
+
+
+def encode_cursor(key: Any, log_id: int) -> str:
+    """Verpackt (Sortierschlüssel, id) des letzten Eintrags einer Seite als opaken String."""
+    if isinstance(key, datetime):
+        payload = ["dt", key.isoformat(), log_id]
+    else:
+        payload = ["raw", key, log_id]
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[Any, int]:
+    """
+    Gegenstück zu encode_cursor().
+
+    Raises:
+        ValueError: Bei einem ungültigen Cursor
+    """
+    try:
+        kind, key, log_id = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        if kind == "dt":
+            key = datetime.fromisoformat(key)
+        elif kind != "raw" or not isinstance(key, str):
+            raise ValueError
+        if not isinstance(log_id, int):
+            raise ValueError
+    except (ValueError, TypeError, binascii.Error):
+        raise ValueError("Ungültiger Cursor")
+    return key, log_id
+
+
+# Spalten und Formate von GET /logs/export
+EXPORT_COLUMNS = ("id", "timestamp", "entity_id", "action", "rfid_id")
+EXPORT_FORMATS = ("ndjson", "csv")
+# Zeilen pro Datenbank-Block und damit pro geschriebenem Antwort-Chunk
+EXPORT_CHUNK_ROWS = 1000
+
+_JSON_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+
+def _export_timestamp(value: Any) -> str:
+    """ISO-8601 ohne Umweg über datetime (SQLite liefert den gespeicherten Text)."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value.replace(" ", "T", 1)
+
+
+def _ndjson_chunk(rows: Sequence[Any]) -> bytes:
+    lines = [
+        _JSON_ENCODER.encode({
+            "id": log_id,
+            "timestamp": _export_timestamp(timestamp),
+            "entity_id": entity_id,
+            "action": action,
+            "rfid_id": rfid_id,
+        })
+        for log_id, timestamp, entity_id, action, rfid_id in rows
+    ]
+    lines.append("")
+    return "\n".join(lines).encode()
+
+
+def _csv_chunk(rows: Sequence[Any]) -> bytes:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    writer.writerows(
+        (log_id, _export_timestamp(timestamp), entity_id, action, rfid_id)
+        for log_id, timestamp, entity_id, action, rfid_id in rows
+    )
+    return buffer.getvalue().encode()
+
+
+def _to_utc_naive(value: Optional[datetime]) -> Optional[datetime]:
+    """Vergleichswert für access_logs.timestamp (naiv, UTC)."""
+    if value is None or value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+class AsyncLogService:
+    """
+    Service für AccessLog-Business-Logic auf dem async Datenpfad.
+
+    Neue Logs laufen über den LogWriter (Group Commit), sofern er läuft;
+    sonst wird wie im sync Service direkt in der Session geschrieben.
+    """
+
+    def __init__(self, writer: LogWriter = log_writer):
+        self.repository = AsyncLogRepository()
+        self.daily_repository = AsyncAccessLogDailyRepository()
+        self.counter_repository = AsyncAccessLogCounterRepository()
+        self.writer = writer
+
+    async def get_all(self, db: AsyncSession, limit: int = 100) -> List[AccessLog]:
+        """Gibt alle Logs zurück (neueste zuerst)."""
+        return await self.repository.get_recent(db, limit)
+
+    async def get_page(
+        self,
+        db: AsyncSession,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        entity_id: Optional[int] = None,
+        action: Optional[str] = None,
+        rfid_id: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None
+    ) -> Tuple[List[AccessLog], Optional[str]]:
+        """
+        Gibt eine Seite Logs zurück (neueste zuerst); alle Filter sind kombinierbar.
+
+        Args:
+            db: Datenbank-Session
+            limit: Maximale Anzahl Einträge
+            cursor: next_cursor der vorigen Seite (None = erste Seite)
+            entity_id: Optional - Filter nach Entity-ID
+            action: Optional - Filter nach Aktion
+            rfid_id: Optional - Filter nach RFID
+            since: Optional - ab diesem Zeitpunkt (inklusive)
+            until: Optional - bis zu diesem Zeitpunkt (exklusive)
+
+        Returns:
+            (Logs, next_cursor); next_cursor ist None auf der letzten Seite
+
+        Raises:
+            ValueError: Bei ungültigem Cursor oder since nach until
+        """
+        before = decode_cursor(cursor) if cursor else None
+        since, until = _to_utc_naive(since), _to_utc_naive(until)
+        if since is not None and until is not None and since > until:
+            raise ValueError("since darf nicht nach until liegen")
+
+        # Ein Eintrag mehr verrät, ob es eine weitere Seite gibt
+        rows = await self.repository.get_page(db, limit + 1, before, entity_id, action, rfid_id, since, until)
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last, key = rows[-1]
+            next_cursor = encode_cursor(key, last.id)
+        return [log for log, _ in rows], next_cursor
+
+    async def get_by_id(self, db: AsyncSession, log_id: int) -> Optional[AccessLog]:
+        """Gibt einen Log anhand der ID zurück."""
+        return await self.repository.get_by_id(db, log_id)
+
+    def export(
+        self,
+        db: AsyncSession,
+        export_format: str = "ndjson",
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None
+    ) -> AsyncIterator[bytes]:
+        """
+        Exportiert Logs chronologisch als NDJSON oder CSV.
+
+        Die Parameter werden sofort geprüft; die Daten liefert der
+        zurückgegebene Iterator blockweise direkt aus dem Datenbank-Cursor,
+        ohne ORM-Objekte oder Pydantic-Modelle. Der Speicherbedarf hängt
+        daher nicht von der Anzahl der Logs ab.
+
+        Args:
+            db: Datenbank-Session (bleibt bis zum Ende des Exports belegt)
+            export_format: 'ndjson' oder 'csv'
+            since: Optional - nur Logs ab diesem Zeitpunkt (inklusive)
+            until: Optional - nur Logs vor diesem Zeitpunkt (exklusive)
+
+        Returns:
+            Iterator über UTF-8-kodierte Chunks
+
+        Raises:
+            ValueError: Bei unbekanntem Format oder since nach until
+        """
+        if export_format not in EXPORT_FORMATS:
+            raise ValueError(f"Unbekanntes Format: {export_format}")
+        since, until = _to_utc_naive(since), _to_utc_naive(until)
+        if since is not None and until is not None and since > until:
+            raise ValueError("since darf nicht nach until liegen")
+        return self._export_chunks(db, export_format, since, until)
+
+    async def _export_chunks(
+        self, db: AsyncSession, export_format: str, since: Optional[datetime], until: Optional[datetime]
+    ) -> AsyncIterator[bytes]:
+        serialize = _csv_chunk if export_format == "csv" else _ndjson_chunk
+        if export_format == "csv":
+            # Kopfzeile sofort, noch vor der ersten Abfrage
+            yield (",".join(EXPORT_COLUMNS) + "\n").encode()
+        async for rows in self.repository.stream_rows(db, EXPORT_CHUNK_ROWS, since, until):
+            yield serialize(rows)
+
+    async def get_by_entity(self, db: AsyncSession, entity_id: int, limit: int = 100) -> List[AccessLog]:
+        """Gibt alle Logs einer Entity zurück."""
+        return await self.repository.get_by_entity(db, entity_id, limit)
+
+    async def get_by_action(self, db: AsyncSession, action: str, limit: int = 100) -> List[AccessLog]:
+        """Gibt alle Logs mit einer bestimmten Aktion zurück."""
+        return await self.repository.get_by_action(db, action, limit)
+
+    async def get_by_date_range(
+        self,
+        db: AsyncSession,
+        start_date: datetime,
+        end_date: datetime
+    ) -> List[AccessLog]:
+        """Gibt Logs in einem Datumsbereich zurück."""
+        return await self.repository.get_by_date_range(db, start_date, end_date)
+
+    async def create(self, db: AsyncSession, log_data: AccessLogCreate) -> AccessLog:
+        """
+        Erstellt einen neuen Log-Eintrag.
+
+        Returns:
+            Log-Eintrag; id ist None, wenn der Writer mit durability 'enqueue'
+            läuft und der Eintrag noch nicht geschrieben wurde
+        """
+        if not self.writer.running:
+            return await self.repository.create(db, log_data.model_dump())
+
+        params = self.repository.prepare_rows([log_data.model_dump()])
+        ids = await self.writer.submit(params)
+        return AccessLog(id=ids[0] if ids else None, **params[0])
+
+    async def create_batch(self, db: AsyncSession, logs: List[AccessLogBatchEntry]) -> int:
+        """Erstellt mehrere Log-Einträge in einer Transaktion."""
+        rows = [log.model_dump() for log in logs]
+        if not self.writer.running:
+            return await self.repository.bulk_insert(db, rows)
+
+        params = self.repository.prepare_rows(rows)
+        await self.writer.submit(params)
+        return len(params)
+
+    async def get_daily_stats(
+        self,
+        db: AsyncSession,
+        since: date,
+        until: date,
+        entity_id: Optional[int] = None,
+        rfid_id: Optional[str] = None,
+        action: Optional[str] = None
+    ) -> List[dict]:
+        """
+        Zählt Logs je Tag, Entity, RFID und Aktion im Bereich [since, until].
+
+        Verdichtete Tage kommen aus access_log_daily, jüngere aus den
+        Roh-Logs. Jeder Log steht in genau einer der beiden Tabellen, daher
+        werden beide Teile einfach addiert.
+
+        Args:
+            db: Datenbank-Session
+            since: Erster Tag (UTC)
+            until: Letzter Tag (UTC, inklusive)
+            entity_id: Optional - Filter nach Entity-ID
+            rfid_id: Optional - Filter nach RFID
+            action: Optional - Filter nach Aktion
+
+        Returns:
+            Zeilen mit day, entity_id, rfid_id, action, count (nach Tag sortiert)
+
+        Raises:
+            ValueError: Wenn since nach until liegt
+        """
+        if since > until:
+            raise ValueError("since darf nicht nach until liegen")
+
+        counts: Counter = Counter()
+        for row in await self.daily_repository.get_counts(db, since, until, entity_id, rfid_id, action):
+            counts[(row.day, row.entity_id, row.rfid_id, row.action)] += row.count
+
+        start = datetime.combine(since, time.min)
+        end = datetime.combine(until + timedelta(days=1), time.min)
+        for row in await self.repository.count_by_day(db, start, end, entity_id, rfid_id, action):
+            day = row.day if isinstance(row.day, date) else date.fromisoformat(row.day)
+            counts[(day, row.entity_id, row.rfid_id, row.action)] += row.count
+
+        return [
+            {"day": day, "entity_id": entity_id, "rfid_id": rfid_id, "action": action, "count": count}
+            for (day, entity_id, rfid_id, action), count in sorted(
+                counts.items(), key=lambda item: (item[0][0], item[0][3], item[0][1] or 0, item[0][2] or "")
+            )
+        ]
+
+    async def get_stats(
+        self,
+        db: AsyncSession,
+        since: datetime,
+        until: datetime,
+        group_by: str = "entity",
+        bucket: str = "day",
+        entity_id: Optional[int] = None,
+        action: Optional[str] = None
+    ) -> List[dict]:
+        """
+        Zählt Logs je Bucket und Entity, Aktion oder Tür aus den Zähler-Tabellen.
+
+        Die Laufzeit hängt nur von der Anzahl der Buckets ab, nicht von der
+        Anzahl der Logs. since wird auf den Beginn seines Buckets gerundet;
+        Wochen (ab Montag) werden aus den Tageszählern summiert. Bei
+        group_by=door wird je Tür die Anzahl der Öffnungen gezählt.
+
+        Args:
+            db: Datenbank-Session
+            since: Beginn des Zeitraums
+            until: Ende des Zeitraums (exklusive)
+            group_by: 'entity', 'action' oder 'door'
+            bucket: 'hour', 'day' oder 'week'
+            entity_id: Optional - Filter nach Entity-ID
+            action: Optional - Filter nach Aktion
+
+        Returns:
+            Zeilen mit bucket_start, entity_id, action, door, count (nach Bucket sortiert)
+
+        Raises:
+            ValueError: Bei unbekanntem group_by/bucket oder since nach until
+        """
+        if group_by not in DIMENSIONS:
+            raise ValueError(f"Unbekanntes group_by: {group_by}")
+        if bucket not in ("hour", "day", "week"):
+            raise ValueError(f"Unbekannter Bucket: {bucket}")
+        since, until = _to_utc_naive(since), _to_utc_naive(until)
+        if since >= until:
+            raise ValueError("since muss vor until liegen")
+
+        granularity = "hour" if bucket == "hour" else "day"
+        start = bucket_start(since, granularity)
+        if bucket == "week":
+            start -= timedelta(days=start.weekday())
+
+        counts: Counter = Counter()
+        rows = await self.counter_repository.get_counts(db, granularity, group_by, start, until, entity_id, action)
+        for row in rows:
+            bucket_key = row.bucket_start
+            if bucket == "week":
+                bucket_key -= timedelta(days=bucket_key.weekday())
+            counts[(bucket_key, row.key)] += row.count
+
+        stats = []
+        for (bucket_key, key), count in sorted(counts.items(), key=lambda item: (item[0][0], str(item[0][1]))):
+            entry = {"bucket_start": bucket_key, "entity_id": None, "action": None, "door": None, "count": count}
+            # Zähler speichern "ohne Entity" als 0
+            if group_by == "entity":
+                entry["entity_id"] = key or None
+            else:
+                entry[group_by] = key
+            stats.append(entry)
+        return stats
+
+    async def get_top_unknown(self, db: AsyncSession, since: date, until: date, limit: int = 20) -> List[dict]:
+        """
+        Gibt die häufigsten unbekannten RFID-Tags im Bereich [since, until] zurück.
+
+        Args:
+            db: Datenbank-Session
+            since: Erster Tag (UTC)
+            until: Letzter Tag (UTC, inklusive)
+            limit: Maximale Anzahl Tags
+
+        Returns:
+            Zeilen mit rfid_id, count, last_seen_day (häufigste zuerst)
+
+        Raises:
+            ValueError: Wenn since nach until liegt
+        """
+        if since > until:
+            raise ValueError("since darf nicht nach until liegen")
+        rows = await self.counter_repository.get_top_unknown(
+            db, datetime.combine(since, time.min), datetime.combine(until + timedelta(days=1), time.min), limit
+        )
+        return [
+            {"rfid_id": row.rfid_id, "count": row.count, "last_seen_day": row.last_seen_day.date()}
+            for row in rows
+        ]
+
+    @property
+    def acknowledges_on_enqueue(self) -> bool:
+        """True, wenn neue Logs vor dem Commit bestätigt werden."""
+        return self.writer.running and self.writer.config.durability == "enqueue"
+
+    async def log_access(self, db: AsyncSession, entity_id: Optional[int], action: str) -> AccessLog:
+        """Convenience-Methode zum Erstellen eines Access-Logs."""
+        return await self.create(db, AccessLogCreate(entity_id=entity_id, action=action))
@@ -0,0 +1,224 @@
+"""
+Log Writer
+Bündelt AccessLog-Inserts mehrerer Requests in gemeinsame Transaktionen.
+"""
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import List, Optional
+
+from sqlalchemy.exc import InterfaceError, OperationalError
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from ..config import LogWriterConfig, settings
+from ..repositories import AsyncLogRepository
+
+LOGGER = logging.getLogger(__name__)
+
+
+@dataclass
+class _Job:
+    """Zeilen eines Requests; future wird nach dem Commit mit den IDs erfüllt."""
+    params: List[dict]
+    future: Optional[asyncio.Future]
+    attempts: int = 0
+
+
+class LogWriter:
+    """
+    Group-Commit-Writer für AccessLogs.
+
+    Eine Hintergrund-Task sammelt eingereihte Zeilen, bis max_batch_rows
+    erreicht oder flush_interval_ms seit der ersten Zeile vergangen ist,
+    und schreibt sie in einer Transaktion. Auch mit Intervall 0 entstehen
+    unter Last Batches aus allem, was während des vorigen Commits ankam. SQLite lässt nur einen Schreiber
+    zu; statt eines Commits (und fsyncs) pro Request gibt es einen pro Batch.
+
+    Scheitert ein Batch, wird jeder Auftrag in einer eigenen Transaktion
+    wiederholt, sodass eine fehlerhafte Zeile nur ihren eigenen Request
+    scheitern lässt. Mit durability 'enqueue' (niemand wartet auf das
+    Ergebnis) werden Aufträge bei vorübergehenden Datenbankfehlern
+    zurückgehalten und nach retry_interval_ms erneut geschrieben, höchstens
+    max_retries Mal. Zurückgehaltene Zeilen zählen gegen max_batch_rows:
+    ist die Grenze erreicht, nimmt die Task keine neuen Aufträge an, die
+    Queue läuft voll und submit() wartet wieder. Von der Datenbank
+    abgelehnte oder aufgegebene Zeilen werden mit Inhalt geloggt.
+
+    Läuft der Writer nicht (App ohne Lifespan), schreiben die Aufrufer
+    selbst direkt.
+    """
+
+    def __init__(self, config: LogWriterConfig):
+        self.config = config
+        self.repository = AsyncLogRepository()
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self._session_factory: Optional[async_sessionmaker] = None
+        self._retained: List[_Job] = []
+
+    @property
+    def running(self) -> bool:
+        """True, solange Aufträge angenommen werden."""
+        return self._task is not None
+
+    async def start(self, session_factory: async_sessionmaker) -> None:
+        """
+        Startet die Hintergrund-Task in der laufenden Event-Loop.
+
+        Args:
+            session_factory: Factory für die Sessions der Batches
+        """
+        if self._task is not None:
+            return
+        self._session_factory = session_factory
+        self._queue = asyncio.Queue(maxsize=self.config.queue_size)
+        self._task = asyncio.create_task(self._run())
+        LOGGER.info(
+            "Log writer started (durability=%s, interval=%d ms, max rows=%d)",
+            self.config.durability, self.config.flush_interval_ms, self.config.max_batch_rows
+        )
+
+    async def stop(self) -> None:
+        """Nimmt keine Aufträge mehr an, schreibt alle eingereihten Zeilen und beendet die Task."""
+        if self._task is None:
+            return
+        task, self._task = self._task, None
+        # Ende-Marke hinter allen eingereihten Aufträgen; die Task schreibt bis dorthin und endet
+        await self._queue.put(None)
+        await task
+        # Aufträge, die beim Stoppen noch auf einen Queue-Platz gewartet haben
+        remaining = []
+        while not self._queue.empty():
+            job = self._queue.get_nowait()
+            if job is not None:
+                remaining.append(job)
+        if remaining:
+            await self._flush(remaining)
+        if self._retained:
+            LOGGER.error(
+                "Could not write %d access logs before shutdown: %r",
+                sum(len(job.params) for job in self._retained),
+                [row for job in self._retained for row in job.params]
+            )
+            self._retained = []
+        LOGGER.info("Log writer stopped")
+
+    async def submit(self, params: List[dict]) -> Optional[List[int]]:
+        """
+        Reiht vorbereitete Log-Zeilen zum Schreiben ein.
+
+        Args:
+            params: Zeilen aus AsyncLogRepository.prepare_rows()
+
+        Returns:
+            IDs nach dem Commit (durability 'flush') oder None direkt nach
+            dem Einreihen (durability 'enqueue')
+
+        Raises:
+            RuntimeError: Wenn der Writer nicht läuft
+        """
+        if self._task is None:
+            raise RuntimeError("Log writer is not running")
+
+        future = None
+        if self.config.durability == "flush":
+            future = asyncio.get_running_loop().create_future()
+        # Volle Queue: der Request wartet (Backpressure statt unbegrenztem Speicher)
+        await self._queue.put(_Job(params, future))
+        if future is None:
+            return None
+        return await future
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        interval = self.config.flush_interval_ms / 1000
+        stopping = False
+        while not stopping:
+            # Zurückgehaltene Aufträge nach retry_interval_ms erneut versuchen, neue kommen dazu
+            batch, self._retained = self._retained, []
+            if batch:
+                await asyncio.sleep(self.config.retry_interval_ms / 1000)
+                # Nur noch mitnehmen, was bereits in der Queue wartet
+                deadline = loop.time()
+            else:
+                job = await self._queue.get()
+                if job is None:
+                    break
+                batch.append(job)
+                deadline = loop.time() + interval
+            # Zurückgehaltene Zeilen zählen mit: ab max_batch_rows bleiben neue Aufträge
+            # in der Queue, bis sie voll ist und submit() wartet (Backpressure)
+            rows = sum(len(job.params) for job in batch)
+            while rows < self.config.max_batch_rows:
+                if self._queue.empty():
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        job = await asyncio.wait_for(self._queue.get(), timeout)
+                    except asyncio.TimeoutError:
+                        break
+                else:
+                    job = self._queue.get_nowait()
+                if job is None:
+                    stopping = True
+                    break
+                batch.append(job)
+                rows += len(job.params)
+            await self._flush(batch)
+
+    async def _flush(self, batch: List[_Job]) -> None:
+        params = [row for job in batch for row in job.params]
+        try:
+            ids = await self._write(params)
+        except Exception as exc:
+            if len(batch) == 1:
+                self._fail(batch[0], exc)
+                return
+            LOGGER.warning("Failed to write %d access logs in one transaction, retrying per request: %s",
+                           len(params), exc)
+            for job in batch:
+                try:
+                    ids = await self._write(job.params)
+                except Exception as job_exc:
+                    self._fail(job, job_exc)
+                else:
+                    self._complete(job, ids)
+            return
+
+        offset = 0
+        for job in batch:
+            self._complete(job, ids[offset:offset + len(job.params)])
+            offset += len(job.params)
+        LOGGER.debug("Wrote %d access logs in one transaction (%d requests)", len(params), len(batch))
+
+    async def _write(self, params: List[dict]) -> List[int]:
+        async with self._session_factory() as db:
+            ids = await self.repository.insert_returning_ids(db, params)
+            await db.commit()
+        return ids
+
+    @staticmethod
+    def _complete(job: _Job, ids: List[int]) -> None:
+        if job.future is not None and not job.future.done():
+            job.future.set_result(ids)
+
+    def _fail(self, job: _Job, exc: Exception) -> None:
+        """Meldet den Fehler dem wartenden Request oder hält den Auftrag (enqueue) zurück."""
+        if job.future is not None:
+            LOGGER.error("Failed to write %d access logs: %s", len(job.params), exc)
+            if not job.future.done():
+                job.future.set_exception(exc)
+        elif isinstance(exc, (OperationalError, InterfaceError)) and job.attempts < self.config.max_retries:
+            job.attempts += 1
+            LOGGER.warning("Failed to write %d access logs, retry %d/%d in %d ms: %s", len(job.params),
+                           job.attempts, self.config.max_retries, self.config.retry_interval_ms, exc)
+            self._retained.append(job)
+        elif isinstance(exc, (OperationalError, InterfaceError)):
+            LOGGER.error("Dropping %d access logs after %d retries: %s (%r)",
+                         len(job.params), job.attempts, exc, job.params)
+        else:
+            LOGGER.error("Dropping %d access logs rejected by the database: %s (%r)", len(job.params), exc, job.params)
+
+
+log_writer = LogWriter(settings.log_writer)
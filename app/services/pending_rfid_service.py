@@ -3,12 +3,17 @@ PendingRFID Service
 Business Logic Layer für PendingRFID-Operationen.
 """
 from typing import List, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from ..repositories import PendingRFIDRepository, EntityRepository
+from ..repositories import (
+    AsyncEntityRepository, AsyncPendingRFIDRepository, EntityRepository, PendingRFIDRepository
+)
 from ..schemas.pending_rfid import PendingRFIDCreate
 from ..schemas.entity import EntityCreate
 from ..models.pending_rfid import PendingRFID
 from ..models.entity import Entity
+from .change_feed import change_feed
+from .entity_cache import entity_cache
 
 
 class PendingRFIDService:
@@ -30,7 +35,7 @@ class PendingRFIDService:
         """Gibt einen PendingRFID anhand der RFID-Nummer zurück."""
         return self.repository.get_by_rfid(db, rfid_id)
 
-    def register_unknown_rfid(self, db: Session, rfid_id: str) -> PendingRFID:
+    def register_unknown_rfid(self, db: Session, rfid_id: str, commit: bool = True) -> PendingRFID:
         """
         Registriert einen unbekannten RFID-Tag.
         Wenn bereits vorhanden, erhöht den Counter.
@@ -38,6 +43,7 @@ class PendingRFIDService:
         Args:
             db: Datenbank-Session
             rfid_id: RFID-Tag-Nummer
+            commit: False, um nur zu flushen (Transaktion des Aufrufers)
 
         Returns:
             PendingRFID (neu oder aktualisiert)
@@ -47,11 +53,11 @@ class PendingRFIDService:
 
         if existing:
             # Erhöhe Counter
-            return self.repository.increment_scan_count(db, rfid_id)
+            return self.repository.increment_scan_count(db, rfid_id, commit=commit)
         else:
             # Erstelle neuen Eintrag
             pending_data = PendingRFIDCreate(rfid_id=rfid_id)
-            return self.repository.create(db, pending_data.model_dump())
+            return self.repository.create(db, pending_data.model_dump(), commit=commit)
 
     def convert_to_entity(
         self,
@@ -92,9 +98,11 @@ class PendingRFIDService:
 
         # Erstelle Entity
         entity = self.entity_repository.create(db, entity_data.model_dump())
+        entity_cache.invalidate(entity.id, entity.rfid_id)
 
         # Lösche PendingRFID
         self.repository.delete(db, pending_id)
+        change_feed.publish("entities")
 
         return entity
 
@@ -111,3 +119,70 @@ class PendingRFIDService:
         """
         return self.repository.delete(db, pending_id)
 
+
+
+class AsyncPendingRFIDService:
+    """Service für PendingRFID-Business-Logic auf dem async Datenpfad."""
+
+    def __init__(self):
+        self.repository = AsyncPendingRFIDRepository()
+        self.entity_repository = AsyncEntityRepository()
+
+    async def get_all(self, db: AsyncSession, limit: int = 50) -> List[PendingRFID]:
+        """Gibt alle PendingRFIDs zurück (neueste zuerst)."""
+        return await self.repository.get_recent(db, limit)
+
+    async def get_by_id(self, db: AsyncSession, pending_id: int) -> Optional[PendingRFID]:
+        """Gibt einen PendingRFID anhand der ID zurück."""
+        return await self.repository.get_by_id(db, pending_id)
+
+    async def get_by_rfid(self, db: AsyncSession, rfid_id: str) -> Optional[PendingRFID]:
+        """Gibt einen PendingRFID anhand der RFID-Nummer zurück."""
+        return await self.repository.get_by_rfid(db, rfid_id)
+
+    async def register_unknown_rfid(self, db: AsyncSession, rfid_id: str, commit: bool = True) -> PendingRFID:
+        """Registriert einen unbekannten RFID-Tag oder erhöht dessen Counter."""
+        pending = await self.repository.upsert_scan(db, rfid_id, commit=commit)
+        if pending is not None:
+            return pending
+
+        if await self.repository.get_by_rfid(db, rfid_id):
+            return await self.repository.increment_scan_count(db, rfid_id, commit=commit)
+
+        pending_data = PendingRFIDCreate(rfid_id=rfid_id)
+        return await self.repository.create(db, pending_data.model_dump(), commit=commit)
+
+    async def convert_to_entity(
+        self,
+        db: AsyncSession,
+        pending_id: int,
+        entity_data: EntityCreate
+    ) -> Optional[Entity]:
+        """
+        Konvertiert einen PendingRFID zu einer Entity und löscht den PendingRFID.
+
+        Raises:
+            ValueError: Wenn RFID-IDs nicht übereinstimmen oder RFID bereits als Entity existiert
+        """
+        pending = await self.repository.get_by_id(db, pending_id)
+        if not pending:
+            return None
+
+        if entity_data.rfid_id != pending.rfid_id:
+            raise ValueError(
+                f"RFID-ID mismatch: Entity hat '{entity_data.rfid_id}', "
+                f"Pending hat '{pending.rfid_id}'"
+            )
+
+        if await self.entity_repository.exists_rfid(db, entity_data.rfid_id):
+            raise ValueError(f"RFID-ID '{entity_data.rfid_id}' ist bereits als Entity registriert")
+
+        entity = await self.entity_repository.create(db, entity_data.model_dump())
+        entity_cache.invalidate(entity.id, entity.rfid_id)
+        await self.repository.delete(db, pending_id)
+        change_feed.publish("entities")
+        return entity
+
+    async def delete(self, db: AsyncSession, pending_id: int) -> Optional[PendingRFID]:
+        """Löscht einen PendingRFID."""
+        return await self.repository.delete(db, pending_id)
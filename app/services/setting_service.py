@@ -3,10 +3,17 @@ Setting Service
 Business Logic Layer für DoorSetting-Operationen.
 """
 from typing import List, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from ..repositories import SettingRepository
+from ..repositories import AsyncSettingRepository, SettingRepository
 from ..schemas.door_setting import DoorSettingCreate
 from ..models.door_setting import DoorSetting
+from .change_feed import change_feed
+
+
+def _validate_pulses(setting_data: DoorSettingCreate) -> None:
+    if setting_data.min_pulse >= setting_data.max_pulse:
+        raise ValueError("min_pulse muss kleiner als max_pulse sein")
 
 
 class SettingService:
@@ -50,10 +57,11 @@ class SettingService:
             raise ValueError("min_angle muss kleiner als max_angle sein")
 
         # Validiere Pulse-Breiten
-        if setting_data.min_pulse >= setting_data.max_pulse:
-            raise ValueError("min_pulse muss kleiner als max_pulse sein")
+        _validate_pulses(setting_data)
 
-        return self.repository.create(db, setting_data.model_dump())
+        setting = self.repository.create(db, setting_data.model_dump())
+        change_feed.publish("settings")
+        return setting
 
     def update(self, db: Session, setting_id: int, setting_data: DoorSettingCreate) -> Optional[DoorSetting]:
         """
@@ -83,10 +91,11 @@ class SettingService:
         # Keine Validierung nötig
 
         # Validiere Pulse-Breiten
-        if setting_data.min_pulse >= setting_data.max_pulse:
-            raise ValueError("min_pulse muss kleiner als max_pulse sein")
+        _validate_pulses(setting_data)
 
-        return self.repository.update(db, setting_id, setting_data.model_dump())
+        setting = self.repository.update(db, setting_id, setting_data.model_dump())
+        change_feed.publish("settings")
+        return setting
 
     def delete(self, db: Session, setting_id: int) -> Optional[DoorSetting]:
         """
@@ -99,5 +108,76 @@ class SettingService:
         Returns:
             Gelöschtes Setting oder None
         """
-        return self.repository.delete(db, setting_id)
+        setting = self.repository.delete(db, setting_id)
+        if setting:
+            change_feed.publish("settings")
+        return setting
+
+
+
+class AsyncSettingService:
+    """Service für DoorSetting-Business-Logic auf dem async Datenpfad."""
+
+    def __init__(self):
+        self.repository = AsyncSettingRepository()
+
+    async def get_all(self, db: AsyncSession) -> List[DoorSetting]:
+        """Gibt alle Settings zurück."""
+        return await self.repository.get_all(db)
+
+    async def get_by_id(self, db: AsyncSession, setting_id: int) -> Optional[DoorSetting]:
+        """Gibt ein Setting anhand der ID zurück."""
+        return await self.repository.get_by_id(db, setting_id)
+
+    async def get_by_door_name(self, db: AsyncSession, door_name: str) -> Optional[DoorSetting]:
+        """Gibt ein Setting anhand des Tür-Namens zurück."""
+        return await self.repository.get_by_door_name(db, door_name)
+
+    async def create(self, db: AsyncSession, setting_data: DoorSettingCreate) -> DoorSetting:
+        """
+        Erstellt ein neues Setting.
+
+        Raises:
+            ValueError: Wenn Tür-Name bereits existiert oder Winkel/Pulse ungültig sind
+        """
+        if await self.repository.exists_door_name(db, setting_data.door_name):
+            raise ValueError(f"Tür '{setting_data.door_name}' existiert bereits")
+
+        if setting_data.min_angle >= setting_data.max_angle:
+            raise ValueError("min_angle muss kleiner als max_angle sein")
+
+        _validate_pulses(setting_data)
+
+        setting = await self.repository.create(db, setting_data.model_dump())
+        change_feed.publish("settings")
+        return setting
+
+    async def update(
+        self, db: AsyncSession, setting_id: int, setting_data: DoorSettingCreate
+    ) -> Optional[DoorSetting]:
+        """
+        Aktualisiert ein Setting (beide Drehrichtungen erlaubt).
+
+        Raises:
+            ValueError: Wenn der neue Tür-Name bereits verwendet wird oder Pulse ungültig sind
+        """
+        existing = await self.repository.get_by_id(db, setting_id)
+        if not existing:
+            return None
+
+        if setting_data.door_name != existing.door_name:
+            if await self.repository.exists_door_name(db, setting_data.door_name):
+                raise ValueError(f"Tür '{setting_data.door_name}' wird bereits verwendet")
+
+        _validate_pulses(setting_data)
+
+        setting = await self.repository.update(db, setting_id, setting_data.model_dump())
+        change_feed.publish("settings")
+        return setting
 
+    async def delete(self, db: AsyncSession, setting_id: int) -> Optional[DoorSetting]:
+        """Löscht ein Setting."""
+        setting = await self.repository.delete(db, setting_id)
+        if setting:
+            change_feed.publish("settings")
+        return setting
@@ -3,10 +3,19 @@ SystemSettings Service
 Business Logic Layer für SystemSettings-Operationen.
 """
 from typing import Dict
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from ..repositories import SystemSettingsRepository
+from ..repositories import AsyncSystemSettingsRepository, SystemSettingsRepository
 from ..schemas.system_settings import SystemSettingsUpdate
 from ..models.system_settings import SystemSettings
+from .change_feed import change_feed
+
+
+def _validate_update(update_data: SystemSettingsUpdate) -> None:
+    if update_data.pending_door_values is not None:
+        for door_name, seconds in update_data.pending_door_values.items():
+            if seconds < 0:
+                raise ValueError(f"Türwert für '{door_name}' muss >= 0 sein")
 
 
 class SystemSettingsService:
@@ -34,12 +43,11 @@ class SystemSettingsService:
             Aktualisierte SystemSettings
         """
         # Validiere pending_door_values falls vorhanden
-        if update_data.pending_door_values is not None:
-            for door_name, seconds in update_data.pending_door_values.items():
-                if seconds < 0:
-                    raise ValueError(f"Türwert für '{door_name}' muss >= 0 sein")
+        _validate_update(update_data)
 
-        return self.repository.update(db, update_data.model_dump(exclude_none=True))
+        settings = self.repository.update(db, update_data.model_dump(exclude_none=True))
+        change_feed.publish("system_settings")
+        return settings
 
     def get_pending_door_values(self, db: Session) -> Dict[str, float]:
         """
@@ -51,3 +59,32 @@ class SystemSettingsService:
         settings = self.get(db)
         return settings.pending_door_values or {}
 
+
+
+class AsyncSystemSettingsService:
+    """Service für SystemSettings-Business-Logic auf dem async Datenpfad."""
+
+    def __init__(self):
+        self.repository = AsyncSystemSettingsRepository()
+
+    async def get(self, db: AsyncSession) -> SystemSettings:
+        """Gibt die globalen SystemSettings zurück (mit Defaults angelegt)."""
+        return await self.repository.get_or_create(db)
+
+    async def update(self, db: AsyncSession, update_data: SystemSettingsUpdate) -> SystemSettings:
+        """
+        Aktualisiert die SystemSettings.
+
+        Raises:
+            ValueError: Wenn ein Türwert negativ ist
+        """
+        _validate_update(update_data)
+
+        settings = await self.repository.update(db, update_data.model_dump(exclude_none=True))
+        change_feed.publish("system_settings")
+        return settings
+
+    async def get_pending_door_values(self, db: AsyncSession) -> Dict[str, float]:
+        """Gibt die konfigurierten pending_door_values zurück."""
+        settings = await self.get(db)
+        return settings.pending_door_values or {}
@@ -0,0 +1,4 @@
+"""
+Benchmarks Package
+Messskripte für API und Pi-Agent (Aufruf: python -m benchmarks.<name>).
+"""
@@ -0,0 +1,143 @@
+"""
+Async Concurrency Benchmark
+Vergleicht den async Datenpfad (AsyncSession, async Endpunkte) mit dem
+sync Stack (Session im Threadpool von FastAPI) unter paralleler Last.
+
+Beide Apps laufen auf derselben SQLite-Datei. Parallele Clients senden eine
+Mischung aus POST /access/scan (Agents), GET /logs und GET /entities
+(Admin-Oberflächen). Der sync Stack wird mit den sync Services nachgebildet,
+wie die Endpunkte vor der Umstellung aussahen.
+
+Aufruf:
+    python -m benchmarks.async_concurrency --clients 50 --requests 2000 [--threads 40]
+"""
+import argparse
+import asyncio
+import random
+import statistics
+from time import perf_counter
+from typing import List
+
+import anyio.to_thread
+import httpx
+from fastapi import Depends, FastAPI
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.config import SQLITE_PROFILES
+from app.schemas.access_scan import AccessScanRequest
+from app.services import AccessService, EntityService, LogService
+
+from .support import temporary_api
+
+ENTITIES = 200
+LOGS = 5000
+
+
+def create_sync_app(engine) -> FastAPI:
+    """Sync-Variante der gemessenen Endpunkte (def + Session, läuft im Threadpool)."""
+    session_factory = sessionmaker(bind=engine, autoflush=False, autocommit=False)
+    access_service, entity_service, log_service = AccessService(), EntityService(), LogService()
+
+    def get_db():
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    application = FastAPI()
+
+    @application.post("/access/scan")
+    def scan(scan_request: AccessScanRequest, db: Session = Depends(get_db)):
+        return access_service.scan(db, scan_request.rfid_id)
+
+    @application.get("/logs")
+    def get_logs(limit: int = 100, db: Session = Depends(get_db)):
+        return [
+            {"id": log.id, "entity_id": log.entity_id, "action": log.action, "rfid_id": log.rfid_id,
+             "timestamp": log.timestamp}
+            for log in log_service.get_all(db, limit)
+        ]
+
+    @application.get("/entities")
+    def get_entities(db: Session = Depends(get_db)):
+        return [
+            {"id": entity.id, "rfid_id": entity.rfid_id, "identifier": entity.identifier,
+             "door_values": entity.door_values}
+            for entity in entity_service.get_all(db)
+        ]
+
+    return application
+
+
+def seed(client) -> None:
+    for i in range(ENTITIES):
+        client.post("/entities", json={
+            "rfid_id": str(1000 + i), "identifier": f"Tier {i}", "door_values": {"door_1": 1.0}
+        }).raise_for_status()
+    rows = [{"entity_id": None, "action": "unknown", "rfid_id": str(i % 500)} for i in range(LOGS)]
+    for offset in range(0, LOGS, 1000):
+        client.post("/logs/batch", json={"logs": rows[offset:offset + 1000]}).raise_for_status()
+
+
+async def run_load(application: FastAPI, clients: int, requests: int, seed_value: int) -> tuple[float, List[float]]:
+    rng = random.Random(seed_value)
+    plan = [rng.random() for _ in range(requests)]
+    latencies: List[float] = []
+    queue: asyncio.Queue = asyncio.Queue()
+    for value in plan:
+        queue.put_nowait(value)
+
+    transport = httpx.ASGITransport(app=application)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as http:
+        async def worker():
+            while not queue.empty():
+                value = queue.get_nowait()
+                started = perf_counter()
+                if value < 0.2:
+                    resp = await http.post("/access/scan", json={"rfid_id": str(1000 + int(value * 5000) % 300)})
+                elif value < 0.6:
+                    resp = await http.get("/logs", params={"limit": 100})
+                else:
+                    resp = await http.get("/entities")
+                resp.raise_for_status()
+                latencies.append((perf_counter() - started) * 1000)
+
+        started = perf_counter()
+        await asyncio.gather(*(worker() for _ in range(clients)))
+        elapsed = perf_counter() - started
+    return requests / elapsed, latencies
+
+
+def summarize(label: str, throughput: float, latencies: List[float]) -> str:
+    cuts = statistics.quantiles(latencies, n=100, method="inclusive")
+    return f"{label:<6}: {throughput:8.1f} req/s  p50={cuts[49]:7.1f} ms  p99={cuts[98]:7.1f} ms"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--clients", type=int, default=50, help="Parallele Clients")
+    parser.add_argument("--requests", type=int, default=2000, help="Requests pro Stack")
+    parser.add_argument("--threads", type=int, default=40, help="Größe des Threadpools für sync Endpunkte")
+    parser.add_argument("--profile", default="durable", choices=list(SQLITE_PROFILES), help="SQLite-Preset")
+    args = parser.parse_args()
+
+    with temporary_api(SQLITE_PROFILES[args.profile]) as (client, engine):
+        seed(client)
+        sync_app = create_sync_app(engine)
+
+        async def measure():
+            anyio.to_thread.current_default_thread_limiter().total_tokens = args.threads
+            sync_result = await run_load(sync_app, args.clients, args.requests, seed_value=1)
+            async_result = await run_load(client.app, args.clients, args.requests, seed_value=1)
+            return sync_result, async_result
+
+        (sync_rps, sync_lat), (async_rps, async_lat) = asyncio.run(measure())
+
+    print(f"{args.clients} Clients, {args.requests} Requests, Threadpool {args.threads}, Preset {args.profile}")
+    print(summarize("sync", sync_rps, sync_lat))
+    print(summarize("async", async_rps, async_lat))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+Log Export Benchmark
+Misst GET /logs/export (Streaming) gegen das Materialisieren aller Logs.
+
+- stream: GET /logs/export, Zeit bis zum ersten Byte, Zeilen/Sekunde
+- materialize: LogRepository.get_by_date_range() + Pydantic je Zeile
+
+Der Speicherbedarf wird als Zuwachs des Spitzen-RSS gemessen; stream läuft
+zuerst, damit materialize ihn nicht vorab anhebt. Die ASGI-App wird direkt
+aufgerufen, weil TestClient/ASGITransport die Antwort puffern würden.
+
+Aufruf:
+    python -m benchmarks.log_export --rows 1000000 --format ndjson
+"""
+import argparse
+import asyncio
+import resource
+from datetime import datetime, timedelta, timezone
+from time import perf_counter
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from app.models.access_log import AccessLog
+from app.repositories import LogRepository
+from app.schemas.access_log import AccessLog as AccessLogSchema
+
+from .support import temporary_api
+
+SEED_CHUNK = 10000
+
+
+def seed(engine, rows: int) -> None:
+    start = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(seconds=rows)
+    with engine.begin() as connection:
+        for offset in range(0, rows, SEED_CHUNK):
+            connection.execute(insert(AccessLog), [
+                {
+                    "entity_id": i % 20 or None,
+                    "action": "granted" if i % 20 else "unknown",
+                    "rfid_id": str(1000 + i % 50),
+                    "timestamp": start + timedelta(seconds=i),
+                }
+                for i in range(offset, min(offset + SEED_CHUNK, rows))
+            ])
+
+
+def peak_rss_mb() -> float:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+async def stream_export(application, export_format: str) -> tuple[float, float, int]:
+    """Ruft GET /logs/export direkt über ASGI auf; liefert (TTFB s, Gesamtzeit s, Bytes)."""
+    first_byte = None
+    received = 0
+    done = asyncio.Event()
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET",
+        "scheme": "http", "path": "/logs/export", "raw_path": b"/logs/export",
+        "query_string": f"format={export_format}".encode(), "headers": [],
+        "client": ("bench", 0), "server": ("bench", 80), "root_path": "",
+    }
+
+    async def receive():
+        if not done.is_set():
+            done.set()
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await asyncio.Event().wait()
+
+    async def send(message):
+        nonlocal first_byte, received
+        if message["type"] == "http.response.body" and message.get("body"):
+            if first_byte is None:
+                first_byte = perf_counter()
+            received += len(message["body"])
+
+    started = perf_counter()
+    await application(scope, receive, send)
+    return first_byte - started, perf_counter() - started, received
+
+
+def materialize(engine) -> tuple[float, int]:
+    started = perf_counter()
+    with Session(engine) as db:
+        logs = LogRepository().get_by_date_range(db, datetime(1970, 1, 1), datetime(9999, 1, 1))
+        body = "\n".join(AccessLogSchema.model_validate(log).model_dump_json() for log in logs).encode()
+    return perf_counter() - started, len(body)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=200000, help="Anzahl Logs in der Datenbank")
+    parser.add_argument("--format", default="ndjson", choices=["ndjson", "csv"], help="Exportformat")
+    parser.add_argument("--skip-materialize", action="store_true", help="Nur den Streaming-Export messen")
+    args = parser.parse_args()
+
+    with temporary_api() as (client, engine):
+        seed(engine, args.rows)
+        baseline = peak_rss_mb()
+
+        ttfb, elapsed, size = client.portal.call(stream_export, client.app, args.format)
+        streamed_rss = peak_rss_mb()
+        print(f"stream      : {args.rows / elapsed:10.0f} rows/s  erstes Byte nach {ttfb * 1000:6.1f} ms  "
+              f"{size / 1e6:7.1f} MB  +{streamed_rss - baseline:6.1f} MB RSS")
+
+        if not args.skip_materialize:
+            elapsed, size = materialize(engine)
+            print(f"materialize : {args.rows / elapsed:10.0f} rows/s  erstes Byte nach {elapsed * 1000:6.0f} ms  "
+                  f"{size / 1e6:7.1f} MB  +{peak_rss_mb() - streamed_rss:6.1f} MB RSS")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Log Ingest Benchmark
+Vergleicht Zeilen/Sekunde von POST /logs (pro Zeile) mit POST /logs/batch.
+
+Aufruf:
+    python -m benchmarks.log_ingest --rows 2000 --batch-size 500
+"""
+import argparse
+from datetime import datetime, timedelta, timezone
+from time import perf_counter
+
+from .support import temporary_api
+
+
+def make_rows(count: int) -> list[dict]:
+    start = datetime.now(timezone.utc) - timedelta(hours=1)
+    return [
+        {
+            "entity_id": None,
+            "action": "unknown",
+            "rfid_id": str(1000 + i % 50),
+            "timestamp": (start + timedelta(milliseconds=i)).isoformat(),
+        }
+        for i in range(count)
+    ]
+
+
+def bench_single(rows: list[dict]) -> float:
+    with temporary_api() as (client, _engine):
+        started = perf_counter()
+        for row in rows:
+            client.post("/logs", json={k: v for k, v in row.items() if k != "timestamp"}).raise_for_status()
+        return len(rows) / (perf_counter() - started)
+
+
+def bench_batch(rows: list[dict], batch_size: int) -> float:
+    with temporary_api() as (client, _engine):
+        started = perf_counter()
+        for offset in range(0, len(rows), batch_size):
+            chunk = rows[offset:offset + batch_size]
+            resp = client.post("/logs/batch", json={"logs": chunk})
+            resp.raise_for_status()
+            assert resp.json()["inserted"] == len(chunk)
+        return len(rows) / (perf_counter() - started)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=2000, help="Anzahl Log-Zeilen pro Lauf")
+    parser.add_argument("--batch-size", type=int, default=500, help="Zeilen pro /logs/batch-Request")
+    args = parser.parse_args()
+
+    rows = make_rows(args.rows)
+    single = bench_single(rows)
+    batch = bench_batch(rows, args.batch_size)
+
+    print(f"POST /logs        : {single:10.1f} rows/s")
+    print(f"POST /logs/batch  : {batch:10.1f} rows/s  (batch size {args.batch_size})")
+    print(f"Speedup           : {batch / single:10.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Log Writer Benchmark
+Vergleicht POST /logs unter paralleler Last mit und ohne Group-Commit-Writer.
+
+Modi:
+- direct: ein Commit pro Request (Writer gestoppt)
+- flush: Writer, Antwort nach dem Commit des Batches
+- enqueue: Writer, Antwort nach dem Einreihen
+
+Nach jedem Lauf wird der Writer wie beim Herunterfahren gestoppt und
+geprüft, dass alle bestätigten Logs in der Datenbank stehen.
+
+Aufruf:
+    python -m benchmarks.log_writer --clients 50 --requests 2000 --interval-ms 5
+"""
+import argparse
+import asyncio
+import statistics
+from time import perf_counter
+from typing import List
+
+import httpx
+from sqlalchemy import func, select
+
+from app.config import SQLITE_PROFILES, LogWriterConfig
+from app.models.access_log import AccessLog
+from app.services import log_writer
+
+from .support import temporary_api
+
+MODES = ("direct", "flush", "enqueue")
+
+
+async def run_load(application, clients: int, requests: int) -> tuple[float, List[float]]:
+    latencies: List[float] = []
+    remaining = iter(range(requests))
+    transport = httpx.ASGITransport(app=application)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as http:
+        async def worker():
+            for i in remaining:
+                started = perf_counter()
+                resp = await http.post("/logs", json={"entity_id": None, "action": "unknown", "rfid_id": str(i % 50)})
+                resp.raise_for_status()
+                latencies.append((perf_counter() - started) * 1000)
+
+        started = perf_counter()
+        await asyncio.gather(*(worker() for _ in range(clients)))
+        elapsed = perf_counter() - started
+    return requests / elapsed, latencies
+
+
+def run_mode(mode: str, args) -> str:
+    log_writer.config = LogWriterConfig(
+        durability="enqueue" if mode == "enqueue" else "flush",
+        flush_interval_ms=args.interval_ms,
+        max_batch_rows=args.max_rows,
+    )
+    with temporary_api(SQLITE_PROFILES[args.profile]) as (client, engine):
+        if mode == "direct":
+            client.portal.call(log_writer.stop)
+        throughput, latencies = client.portal.call(run_load, client.app, args.clients, args.requests)
+        # Wie beim Herunterfahren: eingereihte Logs schreiben
+        client.portal.call(log_writer.stop)
+        with engine.connect() as connection:
+            stored = connection.scalar(select(func.count()).select_from(AccessLog))
+
+    cuts = statistics.quantiles(latencies, n=100, method="inclusive")
+    return (f"{mode:<8}: {throughput:8.1f} req/s  p50={cuts[49]:6.1f} ms  p99={cuts[98]:6.1f} ms  "
+            f"gespeichert {stored}/{args.requests}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--clients", type=int, default=50, help="Parallele Clients")
+    parser.add_argument("--requests", type=int, default=2000, help="POST /logs pro Modus")
+    parser.add_argument("--interval-ms", type=int, default=LogWriterConfig().flush_interval_ms, help="flush_interval_ms")
+    parser.add_argument("--max-rows", type=int, default=LogWriterConfig().max_batch_rows, help="max_batch_rows")
+    parser.add_argument("--profile", default="durable", choices=list(SQLITE_PROFILES), help="SQLite-Preset")
+    parser.add_argument("--modes", nargs="+", default=list(MODES), choices=MODES, help="Zu messende Modi")
+    args = parser.parse_args()
+
+    print(f"{args.clients} Clients, {args.requests} Requests, Intervall {args.interval_ms} ms, Preset {args.profile}")
+    for mode in args.modes:
+        print(run_mode(mode, args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+"""
+Scan Latency Benchmark
+Misst die Zeit vom Auflegen eines Tags bis zum Servo-Befehl "Öffnen" im Pi-Agent.
+
+RFID-Reader und Servos sind simuliert (SimulatedMFRC522, SimulatedPinFactory),
+die API läuft in-process. Gemessen wird der komplette Agent-Pfad: Polling bzw.
+IRQ, Presence-Tracking, Entscheidung (Cache oder POST /access/scan) und
+DoorScheduler. Mit --embedded ruft der Agent die Services direkt auf
+(EmbeddedTransport) statt über HTTP.
+
+Aufruf:
+    python -m benchmarks.scan_latency --arrivals 50 --unknown-ratio 0.2 [--irq] [--embedded]
+"""
+import argparse
+import asyncio
+import logging
+import statistics
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import httpx
+from sqlalchemy.orm import sessionmaker
+
+from app.agent import AgentRuntime, ApiClient, EmbeddedTransport
+from app.hardware import (
+    RFIDReader, SimulatedEdgeSource, SimulatedMFRC522, SimulatedPinFactory, set_gpio_factory
+)
+from app.hardware.gpio_factory import reset_gpio_factory
+
+from .support import temporary_api
+
+SERVO_PIN = 17
+OPEN_ANGLE = -90.0
+CLOSED_ANGLE = 90.0
+KNOWN_TAGS = 20
+FIRST_UNKNOWN_TAG = 900000
+
+
+def make_script(arrivals: int, unknown_ratio: float, spacing: float, dwell: float) -> List[Tuple[float, float, int]]:
+    """Tag-Ankünfte im Abstand spacing; jeder unknown_ratio-te Tag ist unbekannt."""
+    every = round(1 / unknown_ratio) if unknown_ratio > 0 else 0
+    script = []
+    for i in range(arrivals):
+        start = 0.5 + i * spacing
+        if every and i % every == every - 1:
+            uid = FIRST_UNKNOWN_TAG + i
+        else:
+            uid = 1000 + i % KNOWN_TAGS
+        script.append((start, start + dwell, uid))
+    return script
+
+
+def seed(client, open_seconds: float) -> None:
+    client.post("/settings", json={
+        "door_name": "door_1", "servo_pin": SERVO_PIN, "min_angle": OPEN_ANGLE, "max_angle": CLOSED_ANGLE
+    }).raise_for_status()
+    for i in range(KNOWN_TAGS):
+        client.post("/entities", json={
+            "rfid_id": str(1000 + i), "identifier": f"Tier {i}", "door_values": {"door_1": open_seconds}
+        }).raise_for_status()
+    client.put("/system-settings", json={"pending_door_values": {"door_1": open_seconds}}).raise_for_status()
+
+
+def measure(arrivals: List[Tuple[float, int]], open_times: List[float]) -> Dict[str, List[float]]:
+    """Ordnet jeder Ankunft den ersten Öffnungsbefehl bis zur nächsten Ankunft zu."""
+    latencies: Dict[str, List[float]] = {"known": [], "unknown": [], "missed": []}
+    bounds = [at for at, _uid in arrivals[1:]] + [float("inf")]
+    for (arrived_at, uid), next_arrival in zip(arrivals, bounds):
+        opened = next((t for t in open_times if arrived_at <= t < next_arrival), None)
+        if opened is None:
+            latencies["missed"].append(arrived_at)
+            continue
+        kind = "unknown" if uid >= FIRST_UNKNOWN_TAG else "known"
+        latencies[kind].append((opened - arrived_at) * 1000)
+    return latencies
+
+
+def summarize(label: str, values: List[float]) -> str:
+    if len(values) < 2:
+        return f"{label:<8}: n={len(values)}"
+    cuts = statistics.quantiles(values, n=100, method="inclusive")
+    return (
+        f"{label:<8}: n={len(values):4d}  p50={cuts[49]:7.1f} ms  p95={cuts[94]:7.1f} ms  "
+        f"p99={cuts[98]:7.1f} ms  max={max(values):7.1f} ms"
+    )
+
+
+async def run_agent(client, engine, args, outbox_path: Path) -> Tuple[List[Tuple[float, int]], List[float]]:
+    pins = SimulatedPinFactory()
+    set_gpio_factory(pins)
+    edge = SimulatedEdgeSource() if args.irq else None
+    backend = SimulatedMFRC522(
+        make_script(args.arrivals, args.unknown_ratio, args.spacing, args.dwell),
+        edge_source=edge,
+        spi_delay=args.spi_delay
+    )
+
+    if args.embedded:
+        api = EmbeddedTransport(sessionmaker(bind=engine, autoflush=False, autocommit=False))
+    else:
+        transport = httpx.ASGITransport(app=client.app)
+        api = ApiClient("http://bench", client=httpx.AsyncClient(transport=transport, base_url="http://bench"))
+    runtime = AgentRuntime(
+        api,
+        outbox_path,
+        readers={"bench": lambda: RFIDReader(backend=backend, edge_source=edge)},
+        poll_interval=args.poll_interval,
+        presence_hold_off=args.dwell / 2,
+        presence_rearm=0.0
+    )
+
+    agent = asyncio.create_task(runtime.run())
+    # Warten, bis Türen und Entity-Cache bereit sind
+    for _ in range(500):
+        if runtime.doors.doors and runtime.entity_cache.loaded:
+            break
+        await asyncio.sleep(0.01)
+    else:
+        runtime.stop()
+        await agent
+        raise RuntimeError("Agent ist nicht gestartet (Servo oder API nicht verfügbar)")
+    await asyncio.sleep(0.2)
+
+    backend.start()
+    await asyncio.sleep(0.5 + args.arrivals * args.spacing + 0.5)
+    runtime.stop()
+    await agent
+
+    open_times = [event.timestamp for event in pins.events_for(SERVO_PIN) if event.angle == OPEN_ANGLE]
+    reset_gpio_factory()
+    return backend.arrivals(), open_times
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--arrivals", type=int, default=50, help="Anzahl Tag-Ankünfte")
+    parser.add_argument("--unknown-ratio", type=float, default=0.2, help="Anteil unbekannter Tags (über die API)")
+    parser.add_argument("--spacing", type=float, default=0.6, help="Sekunden zwischen zwei Ankünften")
+    parser.add_argument("--dwell", type=float, default=0.3, help="Sekunden, die ein Tag aufliegt")
+    parser.add_argument("--open-seconds", type=float, default=0.05, help="Öffnungsdauer der Tür")
+    parser.add_argument("--poll-interval", type=float, default=0.2, help="Poll-Intervall des Agents")
+    parser.add_argument("--spi-delay", type=float, default=0.002, help="Simulierte Dauer einer SPI-Transaktion")
+    parser.add_argument("--irq", action="store_true", help="IRQ-Modus statt Polling")
+    parser.add_argument("--embedded", action="store_true", help="Services direkt aufrufen statt über HTTP")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.ERROR)
+
+    with temporary_api() as (client, engine), tempfile.TemporaryDirectory() as tmp:
+        seed(client, args.open_seconds)
+        arrivals, open_times = asyncio.run(run_agent(client, engine, args, Path(tmp) / "outbox.db"))
+
+    latencies = measure(arrivals, open_times)
+    mode = "IRQ" if args.irq else f"Polling ({args.poll_interval * 1000:.0f} ms)"
+    transport = "embedded" if args.embedded else "HTTP"
+    print(f"Tag present -> servo open, {mode}, {transport}")
+    print(summarize("known", latencies["known"]))
+    print(summarize("unknown", latencies["unknown"]))
+    print(summarize("all", latencies["known"] + latencies["unknown"]))
+    if latencies["missed"]:
+        print(f"missed  : {len(latencies['missed'])} Ankünfte ohne Öffnungsbefehl")
+
+
+if __name__ == "__main__":
+    main()
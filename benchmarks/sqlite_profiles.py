@@ -0,0 +1,76 @@
+"""
+SQLite Profile Benchmark
+Vergleicht die SQLite-Presets aus app.config.SQLITE_PROFILES.
+
+Je Preset werden gemessen:
+- Log-Inserts: POST /logs, ein Commit pro Zeile (wie der Scan-Pfad)
+- List-Queries: GET /logs?limit=100, während ein zweiter Thread
+  fortlaufend Logs schreibt (Leser gegen Schreiber)
+
+Aufruf:
+    python -m benchmarks.sqlite_profiles --rows 500 --queries 300
+"""
+import argparse
+import threading
+from time import perf_counter
+
+from sqlalchemy.orm import sessionmaker
+
+from app.config import SQLITE_PROFILES
+from app.repositories import LogRepository
+
+from .support import temporary_api
+
+
+def bench_inserts(client, rows: int) -> float:
+    started = perf_counter()
+    for i in range(rows):
+        client.post("/logs", json={"entity_id": None, "action": "unknown", "rfid_id": str(1000 + i % 50)}).raise_for_status()
+    return rows / (perf_counter() - started)
+
+
+def bench_queries(client, engine, queries: int) -> tuple[float, float]:
+    """List-Queries/s mit parallelem Schreiber; liefert (queries/s, writes/s)."""
+    session_factory = sessionmaker(bind=engine, autoflush=False, autocommit=False)
+    repository = LogRepository()
+    stop = threading.Event()
+    written = 0
+
+    def writer():
+        nonlocal written
+        with session_factory() as db:
+            while not stop.is_set():
+                repository.create(db, {"entity_id": None, "action": "unknown", "rfid_id": "4711"})
+                written += 1
+
+    thread = threading.Thread(target=writer, daemon=True)
+    started = perf_counter()
+    thread.start()
+    for _ in range(queries):
+        client.get("/logs", params={"limit": 100}).raise_for_status()
+    elapsed = perf_counter() - started
+    stop.set()
+    thread.join()
+    return queries / elapsed, written / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=500, help="Log-Inserts pro Preset")
+    parser.add_argument("--queries", type=int, default=300, help="List-Queries pro Preset")
+    parser.add_argument(
+        "--profiles", nargs="+", default=list(SQLITE_PROFILES), choices=list(SQLITE_PROFILES),
+        help="Zu messende Presets"
+    )
+    args = parser.parse_args()
+
+    print(f"{'profile':<10} {'inserts/s':>12} {'queries/s':>12} {'writes/s (parallel)':>20}")
+    for name in args.profiles:
+        with temporary_api(SQLITE_PROFILES[name]) as (client, engine):
+            inserts = bench_inserts(client, args.rows)
+            queries, writes = bench_queries(client, engine, args.queries)
+        print(f"{name:<10} {inserts:12.1f} {queries:12.1f} {writes:20.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Benchmark Support
+Gemeinsame Hilfen: In-Process-API mit eigener SQLite-Datei.
+"""
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, Optional, Tuple
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker
+from sqlalchemy.orm import sessionmaker
+
+import app.models  # noqa: F401  (registriert alle Tabellen an Base)
+from app.api.dependencies import get_async_db, get_db
+from app.api.lifespan import create_lifespan
+from app.api.snapshots import snapshot_cache
+from app.api.v1.router import api_router
+from app.config import SQLiteProfile
+from app.database import Base, apply_sqlite_profile, create_async_db_engine
+from app.services import entity_cache
+
+
+def create_app(engine: Engine, async_engine: AsyncEngine) -> FastAPI:
+    """Erstellt eine FastAPI-App mit allen v1-Routen auf den angegebenen Engines."""
+    session_factory = sessionmaker(bind=engine, autoflush=False, autocommit=False)
+    async_session_factory = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
+
+    def override_get_db():
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    async def override_get_async_db():
+        async with async_session_factory() as db:
+            yield db
+
+    application = FastAPI(lifespan=create_lifespan(async_session_factory))
+    application.include_router(api_router)
+    application.dependency_overrides[get_db] = override_get_db
+    application.dependency_overrides[get_async_db] = override_get_async_db
+    return application
+
+
+@contextmanager
+def temporary_api(profile: Optional[SQLiteProfile] = None) -> Iterator[Tuple[TestClient, Engine]]:
+    """
+    Startet die API in-process auf einer frischen SQLite-Datei.
+
+    Eine echte Datei (statt :memory:) ist wichtig, damit Commits
+    dieselben fsyncs kosten wie auf dem Pi.
+
+    Args:
+        profile: SQLite-Profil der Engine (default: SQLite ohne PRAGMAs)
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = Path(tmp) / "bench.db"
+        engine = create_engine(f"sqlite:///{db_path}", connect_args={"check_same_thread": False})
+        if profile is not None:
+            apply_sqlite_profile(engine, profile)
+        async_engine = create_async_db_engine(f"sqlite:///{db_path}", profile)
+        Base.metadata.create_all(engine)
+        # Prozessweite Caches gehören zur vorigen Datenbank
+        entity_cache.clear()
+        snapshot_cache.clear()
+        try:
+            with TestClient(create_app(engine, async_engine)) as client:
+                yield client, engine
+                client.portal.call(async_engine.dispose)
+        finally:
+            engine.dispose()